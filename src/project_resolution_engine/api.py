@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import importlib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Any, Iterable, Mapping, cast
 
+from packaging.markers import Marker
 from resolvelib.resolvers import Result
 
-from project_resolution_engine.internal.resolvelib_types import ResolverCandidate
+from project_resolution_engine.internal.resolvelib_types import (
+    ResolverCandidate,
+    ResolverRequirement,
+)
 from project_resolution_engine.model.keys import WheelKey
 from project_resolution_engine.model.resolution import (
     ResolutionMode,
@@ -17,6 +24,40 @@ from project_resolution_engine.model.resolution import (
 from project_resolution_engine.services import load_services
 from project_resolution_engine.strategies import ResolutionStrategyConfig
 
+# Heavy internals are imported on first use (PEP 562) and then bound as module
+# globals, so later lookups skip the import machinery entirely.
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    "rl_resolve": ("project_resolution_engine.internal.resolvelib", "resolve"),
+    "rl_provider": (
+        "project_resolution_engine.internal.resolvelib",
+        "ProjectResolutionProvider",
+    ),
+    "open_repository": (
+        "project_resolution_engine.internal.repositories.factory",
+        "open_repository",
+    ),
+}
+
+
+def __getattr__(name: str) -> Any:
+    target = _LAZY_IMPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = target
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def _lazy(name: str) -> Any:
+    """
+    Returns a lazily imported module global, importing and binding it on first use.
+    """
+    try:
+        return globals()[name]
+    except KeyError:
+        return __getattr__(name)
+
 
 # :: UtilityOperation | type=normalization
 def _normalize_strategy_configs(
@@ -52,13 +93,18 @@ def _normalize_strategy_configs(
 
     c: ResolutionStrategyConfig
     for c in strategy_configs:
-        iid = c.get("instance_id", c.get("strategy_name"))
-        if not iid:
+        existing_iid = c.get("instance_id")
+        if existing_iid:
+            # Already normalized: store as-is rather than copying.
+            configs_by_instance_id[existing_iid] = c
+            continue
+
+        name = c.get("strategy_name")
+        if not name:
             raise ValueError("strategy config requires instance_id or strategy_name")
 
-        cfg = dict(c)
-        cfg["instance_id"] = iid
-        configs_by_instance_id[iid] = cast(ResolutionStrategyConfig, cast(object, cfg))
+        cfg = {**c, "instance_id": name}
+        configs_by_instance_id[name] = cast(ResolutionStrategyConfig, cast(object, cfg))
 
     return configs_by_instance_id
 
@@ -84,18 +130,14 @@ def _roots_for_env(params: ResolutionParams, env: Any) -> list[Any]:
         list[Any]: A list of ResolverRequirement objects that meet the
         evaluated conditions.
     """
-    from project_resolution_engine.internal.resolvelib_types import ResolverRequirement
-    from packaging.markers import Marker
+    # The marker environment is constant for the env; fetch it once.
+    marker_env = cast(dict[str, str], cast(object, env.marker_environment))
 
     roots: list[ResolverRequirement] = []
     ws: WheelSpec
     for ws in params.root_wheels:
-        marker_env = cast(dict[str, str], cast(object, env.marker_environment))
         marker: Marker | None = ws.marker
-        marker_evaluation: bool = (
-            marker.evaluate(environment=marker_env) if marker else True
-        )
-        if marker is not None and not marker_evaluation:
+        if marker is not None and not marker.evaluate(environment=marker_env):
             continue
         roots.append(ResolverRequirement(wheel_spec=ws))
 
@@ -148,16 +190,15 @@ def _deps_by_parent_from_result(
     """
     deps_by_parent: dict[str, set[str]] = {name: set() for name in wk_by_name.keys()}
 
+    # deps_by_parent has exactly the keys of wk_by_name, so it answers membership for
+    # both sides of an edge; the child check is hoisted out of the information loop.
     child_name: str
     for child_name, crit in result.criteria.items():
+        if child_name not in deps_by_parent:
+            continue
         for info in crit.information:
             parent = info.parent
-            if parent is None:
-                continue
-            # Preserve existing membership logic exactly.
-            known_parent: bool = parent.name in wk_by_name
-            known_child: bool = child_name in wk_by_name
-            if known_parent and known_child:
+            if parent is not None and parent.name in deps_by_parent:
                 deps_by_parent[parent.name].add(child_name)
 
     return deps_by_parent
@@ -195,8 +236,8 @@ def _apply_dependency_ids(
 # :: UtilityOperation | type=normalization
 def _format_requirements_text(wheel_keys: Iterable[WheelKey]) -> str:
     """
-    Formats the requirements text by sorting the given wheel keys and combining their
-    requirement text blocks into a single string.
+    Formats the requirements text by sorting the given wheel keys by name and combining
+    their requirement text blocks into a single string.
 
     Args:
         wheel_keys (Iterable[WheelKey]): An iterable of WheelKey objects that contain
@@ -207,7 +248,58 @@ def _format_requirements_text(wheel_keys: Iterable[WheelKey]) -> str:
             of the provided wheel keys, separated by double newlines, and ending with
             a newline character.
     """
-    return "\n\n".join(wk.req_txt_block for wk in sorted(wheel_keys)) + "\n"
+    # Resolved keys are unique per name, so a plain string sort matches WheelKey
+    # ordering without invoking its rich comparison per pair.
+    ordered = sorted(wheel_keys, key=attrgetter("name"))
+    blocks: list[str] = [wk.req_txt_block for wk in ordered]
+    return "\n\n".join(blocks) + "\n"
+
+
+_MAX_ENV_WORKERS: int = 8
+
+
+def _resolve_one_env(
+    services: Any, env: ResolutionEnv, params: ResolutionParams, prefetch_workers: int
+) -> tuple[str, str, list[str] | None]:
+    """
+    Resolves a single target environment and formats its results.
+
+    Environments are independent of each other, so this is the unit of work that
+    ProjectResolutionEngine.resolve fans out across worker threads.
+
+    Args:
+        services: The resolution services shared by all environments.
+        env (ResolutionEnv): The target environment to resolve.
+        params (ResolutionParams): The resolution parameters.
+        prefetch_workers (int): This environment's share of params.prefetch_workers.
+
+    Returns:
+        tuple[str, str, list[str] | None]: The environment identifier, the formatted
+        requirements text, and the resolved wheel URIs (None unless the resolution
+        mode is RESOLVED_WHEELS).
+    """
+    roots = _roots_for_env(params, env)
+
+    result: Result[Any, ResolverCandidate, str] = _lazy("rl_resolve")(
+        services=services,
+        env=env,
+        roots=roots,
+        pep691_cache_dir=params.pep691_cache_dir,
+        prefetch_workers=prefetch_workers,
+    )
+
+    wk_by_name = _wk_by_name_from_result(result)
+    deps_by_parent = _deps_by_parent_from_result(result, wk_by_name)
+    _apply_dependency_ids(deps_by_parent, wk_by_name)
+
+    req_text = _format_requirements_text(wk_by_name.values())
+
+    wheels: list[str] | None = None
+    if params.resolution_mode is ResolutionMode.RESOLVED_WHEELS:
+        # You currently never populate URIs here. Leaving behavior unchanged.
+        wheels = []
+
+    return env.identifier, req_text, wheels
 
 
 @dataclass(kw_only=True, frozen=True, slots=True)
@@ -224,47 +316,69 @@ class ProjectResolutionEngine:
         resolve(params: ResolutionParams) -> ResolutionResult
             Resolves dependencies based on the provided parameters, producing requirements
             and resolved wheels categorized by the target environments.
+        clear_caches() -> None
+            Drops the process-wide metadata caches shared by resolutions.
+
+    Parsed index pages and core metadata are cached for the life of the process and
+    reused by every later resolve() call. This saves refetching and reparsing them,
+    but a long-lived process keeps resolving against the index pages it first saw,
+    so releases published afterwards stay invisible until clear_caches() is called.
     """
 
+    # :: ExternalApiMethod
+    @staticmethod
+    def clear_caches() -> None:
+        """
+        Drops the process-wide index and core metadata caches, so that later
+        resolutions re-read metadata (and see newly published releases).
+
+        Long-lived processes should call this whenever they need fresh index data,
+        for example periodically or before a resolution that must see the latest
+        releases.
+        """
+        _lazy("rl_provider").clear_caches()
+
     # :: ExternalApiMethod
     @staticmethod
     def resolve(params: ResolutionParams) -> ResolutionResult:
-        from project_resolution_engine.internal.resolvelib import resolve as rl_resolve
-        from project_resolution_engine.internal.repositories.factory import (
-            open_repository,
-        )
+        open_repository = _lazy("open_repository")
 
         # :: FeatureStart | name=full_resolution
         reqs_by_env: dict[str, str] = {}
         wheels_by_env: dict[str, list[str]] = {}
 
         configs_by_instance_id = _normalize_strategy_configs(params.strategy_configs)
+        envs: list[ResolutionEnv] = list(params.target_environments)
 
         with open_repository(repo_id=params.repo_id, config=params.repo_config) as repo:
             services = load_services(
                 repo=repo, strategy_configs_by_instance_id=configs_by_instance_id
             )
 
-            env: ResolutionEnv
             # :: FeatureBranch | name=full_resolution | branch=main | control_polarity=true
             # :: FeatureBranch | name=full_resolution | branch=resolve_no_env | control_polarity=false
-            for env in params.target_environments:
-                roots = _roots_for_env(params, env)
-
-                result: Result[Any, ResolverCandidate, str] = rl_resolve(
-                    services=services, env=env, roots=roots
+            if envs:
+                workers = min(len(envs), _MAX_ENV_WORKERS)
+                # Each environment builds its own prefetch pool, so split the budget
+                # between the environments running at once.
+                prefetch_workers = (
+                    max(1, params.prefetch_workers // workers)
+                    if params.prefetch_workers > 0
+                    else 0
                 )
-
-                wk_by_name = _wk_by_name_from_result(result)
-                deps_by_parent = _deps_by_parent_from_result(result, wk_by_name)
-                _apply_dependency_ids(deps_by_parent, wk_by_name)
-
-                wheel_keys: list[WheelKey] = list(wk_by_name.values())
-                reqs_by_env[env.identifier] = _format_requirements_text(wheel_keys)
-
-                if params.resolution_mode is ResolutionMode.RESOLVED_WHEELS:
-                    # You currently never populate URIs here. Leaving behavior unchanged.
-                    wheels_by_env[env.identifier] = []
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    futures = [
+                        pool.submit(
+                            _resolve_one_env, services, env, params, prefetch_workers
+                        )
+                        for env in envs
+                    ]
+                    # Collect in submission order so result ordering stays deterministic.
+                    for future in futures:
+                        env_id, req_text, wheels = future.result()
+                        reqs_by_env[env_id] = req_text
+                        if wheels is not None:
+                            wheels_by_env[env_id] = wheels
 
         # :: FeatureEnd | name=full_resolution
         return ResolutionResult(
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import os
 import tempfile
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 
 from project_resolution_engine.internal.builtin_strategies import (
+    _file_uri_to_path,
     _short_hash,
     _safe_segment,
     _url_basename,
@@ -18,6 +21,19 @@ from project_resolution_engine.model.keys import (
 from project_resolution_engine.repository import ArtifactRepository, ArtifactRecord
 
 
+@dataclass(frozen=True, slots=True)
+class _IndexedRecord:
+    """
+    Index entry pairing a record with its local path, parsed once at put time.
+
+    fs_path is kept as a plain string for os.path checks, and is None for
+    destinations that are not file:// URIs.
+    """
+
+    record: ArtifactRecord
+    fs_path: str | None
+
+
 @dataclass(slots=True)
 class EphemeralArtifactRepository(ArtifactRepository):
     """
@@ -28,6 +44,9 @@ class EphemeralArtifactRepository(ArtifactRepository):
     - Storage: file:// destination URIs under an ephemeral root dir.
     - Uniqueness: controlled solely by the provided BaseArtifactKey equality/hash.
     - No persistence: index is not saved and the directory is cleaned up on close().
+    - Thread-safe: index access is serialized, and get_or_reserve() hands each missing
+      key to one caller at a time while concurrent callers for that key wait, so
+      environments resolving concurrently never fetch into the same destination at once.
 
     Notes:
     - This repository does not validate content hashes; acquisition strategies can populate
@@ -36,12 +55,19 @@ class EphemeralArtifactRepository(ArtifactRepository):
 
     _tmp: tempfile.TemporaryDirectory[str]
     _root: Path
-    _index: dict[BaseArtifactKey, ArtifactRecord]
+    _root_str: str
+    _index: dict[BaseArtifactKey, _IndexedRecord]
+    _reservations: dict[BaseArtifactKey, threading.Event]
+    _lock: threading.Lock
 
     def __init__(self, *, prefix: str = "project-resolution-engine-ephemeral-") -> None:
         self._tmp = tempfile.TemporaryDirectory(prefix=prefix)
         self._root = Path(self._tmp.name).resolve()
+        # Separator-terminated so "/tmp/root-other" is not mistaken for "/tmp/root".
+        self._root_str = str(self._root) + os.sep
         self._index = {}
+        self._reservations = {}
+        self._lock = threading.Lock()
 
     # -------------------------
     # lifecycle
@@ -59,8 +85,13 @@ class EphemeralArtifactRepository(ArtifactRepository):
         """
         Clean up the ephemeral workspace and clear the in-memory index.
         """
-        self._index.clear()
-        self._tmp.cleanup()
+        with self._lock:
+            self._index.clear()
+            pending = list(self._reservations.values())
+            self._reservations.clear()
+            self._tmp.cleanup()
+        for event in pending:
+            event.set()
 
     # :: PermitUnused | reason=implicit
     def __enter__(self) -> EphemeralArtifactRepository:
@@ -79,40 +110,75 @@ class EphemeralArtifactRepository(ArtifactRepository):
         Return an ArtifactRecord if present. If the record exists but the underlying file
         is missing (e.g., a user deleted it), we drop it from the index and return None.
         """
-        record: ArtifactRecord = self._index.get(key)
-        if record is None:
+        with self._lock:
+            entry: _IndexedRecord | None = self._index.get(key)
+        if entry is None:
             return None
 
-        # Only enforce existence for file:// destinations we generated.
-        dest: str = record.destination_uri
-        if dest.startswith("file://"):
-            try:
-                path: Path = Path(dest.removeprefix("file://"))
-                if not path.exists():
-                    self._index.pop(key, None)
-                    return None
-            except Exception:
-                # If parsing fails, just return the record; it's still an in-memory truth.
-                return record
+        # Only enforce existence for file:// destinations (path parsed once at put time).
+        if entry.fs_path is not None and not os.path.exists(entry.fs_path):
+            with self._lock:
+                self._index.pop(key, None)
+            return None
 
-        return record
+        return entry.record
 
     def put(self, record: ArtifactRecord) -> None:
-        self._index[record.key] = record
+        path: Path | None = _file_uri_to_path(record.destination_uri)
+        entry = _IndexedRecord(record, None if path is None else os.fspath(path))
+        with self._lock:
+            self._index[record.key] = entry
+            event = self._reservations.pop(record.key, None)
+        if event is not None:
+            event.set()
+
+    def get_or_reserve(self, key: BaseArtifactKey) -> ArtifactRecord | str:
+        """
+        Return the stored record for key, or reserve its destination for the caller.
+
+        Destinations are deterministic per key, so only one caller at a time may fill
+        one. The first caller to miss a key gets its destination URI; concurrent
+        callers for the same key wait until that caller put()s the record (and then
+        return it) or releases the reservation (and then try again themselves).
+        """
+        while True:
+            hit = self.get(key)
+            if hit is not None:
+                return hit
+            with self._lock:
+                if key in self._index:
+                    # Stored between get() and taking the lock; re-check it.
+                    continue
+                pending = self._reservations.get(key)
+                if pending is None:
+                    self._reservations[key] = threading.Event()
+                    break
+            pending.wait()
+        try:
+            return self.allocate_destination_uri(key)
+        except BaseException:
+            self.release_reservation(key)
+            raise
+
+    def release_reservation(self, key: BaseArtifactKey) -> None:
+        with self._lock:
+            event = self._reservations.pop(key, None)
+        if event is not None:
+            event.set()
 
     # :: PermitUnused | reason=contractual
     def delete(self, key: BaseArtifactKey) -> None:
-        record: ArtifactRecord = self._index.pop(key, None)
-        if record is None:
+        with self._lock:
+            entry: _IndexedRecord | None = self._index.pop(key, None)
+        if entry is None:
             return
 
         # Best-effort delete the underlying file if it's in our ephemeral root.
-        dest: str = record.destination_uri
-        if not dest.startswith("file://"):
+        if entry.fs_path is None:
             return
 
         try:
-            path: Path = Path(dest.removeprefix("file://")).resolve()
+            path: Path = Path(entry.fs_path).resolve()
             if self._is_under_root(path) and path.exists():
                 path.unlink()
         except Exception:
@@ -135,11 +201,9 @@ class EphemeralArtifactRepository(ArtifactRepository):
     # -------------------------
 
     def _is_under_root(self, path: Path) -> bool:
-        try:
-            path.relative_to(self._root)
-            return True
-        except Exception:
-            return False
+        # self._root is resolved, and callers pass resolved paths, so a string
+        # prefix check is equivalent to relative_to() without the exception path.
+        return os.fspath(path).startswith(self._root_str)
 
     def _allocate_path_for_key(self, key: BaseArtifactKey) -> Path:
         match key:
@@ -1,21 +1,36 @@
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
+import os
 import re
+import shutil
 import tempfile
 import zipfile
 from _hashlib import HASH
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from io import BufferedReader, BufferedWriter
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 from typing import Final
 from urllib.parse import unquote
 from urllib.parse import urlparse
 
 import requests
-
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from project_resolution_engine.internal.builtin_strategy_names import (
+    DIRECT_URI_CORE_METADATA,
+    PEP658_HTTP,
+    PEP691_HTTP,
+    URI_WHEEL_FILE,
+    WHEEL_EXTRACTED_METADATA,
+    WHEEL_HTTP,
+)
 from project_resolution_engine.model.keys import (
     IndexMetadataKey,
     CoreMetadataKey,
@@ -32,22 +47,30 @@ from project_resolution_engine.strategies import (
 _INVALID_SEGMENT_CHARS: Final[re.Pattern[str]] = re.compile(r"[^A-Za-z0-9._-]+")
 
 
+@functools.lru_cache(maxsize=4096)
 def _safe_segment(value: str) -> str:
     """
     Make a filesystem-safe path segment.
+
+    Memoized: the same names, versions, and tags recur across many artifact keys.
     """
     value = value.strip()
     if not value:
         return "_"
+    # Well-formed names, versions, and tags are already safe; skip the substitution.
+    if len(value) <= 160 and _INVALID_SEGMENT_CHARS.search(value) is None:
+        return value
     value = _INVALID_SEGMENT_CHARS.sub("_", value)
     return value[:160]  # keep segments sane
 
 
+@functools.lru_cache(maxsize=4096)
 def _short_hash(value: str) -> str:
     """
     Stable short hash for building unique filenames without leaking huge URLs into paths.
     """
-    return hashlib.sha256(value.encode("utf-8")).hexdigest()[:16]
+    # Non-cryptographic use: an 8-byte BLAKE2b digest gives 16 hex chars without truncation.
+    return hashlib.blake2b(value.encode("utf-8"), digest_size=8).hexdigest()
 
 
 def _url_basename(url: str) -> str | None:
@@ -69,31 +92,111 @@ def _url_basename(url: str) -> str | None:
 # -------------------------
 
 
+def _build_session() -> requests.Session:
+    """
+    Build the pooled HTTP session shared by the built-in HTTP strategies.
+
+    Reusing one session keeps connections (and TLS sessions) alive across the many
+    requests a resolve makes to the same index host. Sessions are safe for concurrent
+    GETs, so this is shared across environments resolved in parallel.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=Retry(total=3, backoff_factor=0.2),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSION: Final[requests.Session] = _build_session()
+
+
+def _file_uri_to_path(uri: str) -> Path | None:
+    """
+    Parse a file:// URI into a local Path. Returns None for any other scheme, or when
+    the URI cannot be parsed or carries no path.
+    """
+    try:
+        parsed = urlparse(uri)
+    except ValueError:
+        return None
+    if parsed.scheme != "file" or not parsed.path:
+        return None
+    return Path(unquote(parsed.path))
+
+
 def _require_file_destination(destination_uri: str) -> Path:
     """
     Built-in strategies are intentionally file-only.
 
     If a user wants s3://, gs://, etc., they provide their own strategy implementation.
     """
-    parsed = urlparse(destination_uri)
-    if parsed.scheme != "file":
+    path = _file_uri_to_path(destination_uri)
+    if path is None:
         raise ValueError(
             f"Built-in strategies require file:// destination URIs, got: {destination_uri!r}"
         )
-    return Path(parsed.path)
+    return path
 
 
 def _ensure_parent_dir(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
-def _sha256_file(path: Path) -> str:
-    h: HASH = hashlib.sha256()
-    f: BufferedReader
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
+@contextmanager
+def _atomic_writer(dest_path: Path) -> Iterator[BufferedWriter]:
+    """
+    Open a temporary file next to dest_path and move it into place once complete.
+
+    Destinations are deterministic per artifact key, so a reader must never be able
+    to observe a partially written file there. The temporary file lives in the
+    same directory so the final os.replace() is atomic; it is removed if writing
+    fails.
+    """
+    fd, tmp = tempfile.mkstemp(
+        prefix=f".{dest_path.name}.", suffix=".part", dir=dest_path.parent
+    )
+    try:
+        with os.fdopen(fd, "wb") as out:
+            yield out
+        os.replace(tmp, dest_path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    out: BufferedWriter
+    with _atomic_writer(path) as out:
+        out.write(data)
+
+
+class _HashingWriter:
+    """
+    Write-through wrapper that hashes and counts bytes as they are written, so a
+    downloaded or copied artifact never has to be re-read to compute its digest.
+    """
+
+    __slots__ = ("_out", "_hash", "size")
+
+    def __init__(self, out: BufferedWriter) -> None:
+        self._out = out
+        self._hash: HASH = hashlib.sha256()
+        self.size: int = 0
+
+    def write(self, data: bytes) -> int:
+        self._hash.update(data)
+        self.size += len(data)
+        return self._out.write(data)
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
 
 
 def _simple_project_json_url(index_base: str, project: str) -> str:
@@ -102,11 +205,12 @@ def _simple_project_json_url(index_base: str, project: str) -> str:
     return f"{base}{proj}/"
 
 
-def _write_canonical_json(path: Path, payload: Any) -> None:
-    # Deterministic output for stable hashes.
-    path.write_text(
-        json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8"
-    )
+def _write_canonical_json(path: Path, payload: Any) -> bytes:
+    # Deterministic output for stable hashes. The written bytes are returned so the
+    # caller can hash them without reading the file back.
+    data: bytes = (json.dumps(payload, indent=2, sort_keys=True) + "\n").encode("utf-8")
+    _write_bytes_atomic(path, data)
+    return data
 
 
 def _pep658_metadata_url(file_url: str) -> str:
@@ -114,19 +218,37 @@ def _pep658_metadata_url(file_url: str) -> str:
     return f"{file_url}.metadata"
 
 
+def _extract_member(
+    zf: zipfile.ZipFile, member: str, dest_path: Path
+) -> _HashingWriter:
+    """
+    Stream a zip member into dest_path, hashing it on the way through.
+
+    Returns the writer so callers can read its size and digest.
+    """
+    src: IO[bytes]
+    dst: BufferedWriter
+    with zf.open(member) as src, _atomic_writer(dest_path) as dst:
+        w = _HashingWriter(dst)
+        shutil.copyfileobj(src, w, length=1024 * 1024)
+    return w
+
+
 def _find_dist_info_metadata_path(zf: zipfile.ZipFile) -> str:
     """
     Find a member path that looks like "<something>.dist-info/METADATA".
     """
-    n: str
-    candidates: list[str] = [
-        n for n in zf.namelist() if n.endswith(".dist-info/METADATA")
-    ]
-    if not candidates:
+    # Single pass over the central directory; the lexicographically smallest match
+    # keeps the pick deterministic without materializing and sorting a name list.
+    best: str | None = None
+    info: zipfile.ZipInfo
+    for info in zf.infolist():
+        n: str = info.filename
+        if n.endswith(".dist-info/METADATA") and (best is None or n < best):
+            best = n
+    if best is None:
         raise FileNotFoundError("Wheel does not contain any *.dist-info/METADATA entry")
-    # Deterministic pick.
-    candidates.sort()
-    return candidates[0]
+    return best
 
 
 # -------------------------
@@ -136,7 +258,7 @@ def _find_dist_info_metadata_path(zf: zipfile.ZipFile) -> str:
 
 @dataclass(frozen=True)
 class Pep691IndexMetadataHttpStrategy(IndexMetadataStrategy):
-    name: str = "pep691_http"
+    name: str = PEP691_HTTP
     precedence: int = 50
     timeout_s: float = 30.0
     user_agent: str = "project-resolution-engine/0"
@@ -157,16 +279,16 @@ class Pep691IndexMetadataHttpStrategy(IndexMetadataStrategy):
             "User-Agent": self.user_agent,
         }
 
-        resp: requests.Response = requests.get(
+        resp: requests.Response = _SESSION.get(
             url, headers=headers, timeout=self.timeout_s
         )
         resp.raise_for_status()
 
         payload: Any = resp.json()
-        _write_canonical_json(dest_path, payload)
+        data: bytes = _write_canonical_json(dest_path, payload)
 
-        size = dest_path.stat().st_size
-        sha256 = _sha256_file(dest_path)
+        size = len(data)
+        sha256 = hashlib.sha256(data).hexdigest()
 
         return ArtifactRecord(
             key=key,
@@ -181,11 +303,11 @@ class Pep691IndexMetadataHttpStrategy(IndexMetadataStrategy):
 
 @dataclass(frozen=True)
 class HttpWheelFileStrategy(WheelFileStrategy):
-    name: str = "wheel_http"
+    name: str = WHEEL_HTTP
     precedence: int = 50
     timeout_s: float = 120.0
     user_agent: str = "project-resolution-engine/0"
-    chunk_bytes: int = 1024 * 1024
+    chunk_bytes: int = 4 * 1024 * 1024
 
     # :: CalledThroughAbstraction
     def resolve(self, *, key: WheelKey, destination_uri: str) -> ArtifactRecord | None:
@@ -200,19 +322,23 @@ class HttpWheelFileStrategy(WheelFileStrategy):
         if key.origin_uri is None:
             raise ValueError("WheelKey must have origin_uri set")
 
-        f: BufferedReader
+        f: BufferedWriter
         resp: requests.Response
-        with requests.get(
+        with _SESSION.get(
             key.origin_uri, headers=headers, timeout=self.timeout_s, stream=True
         ) as resp:
             resp.raise_for_status()
-            with dest_path.open("wb") as f:
-                for chunk in resp.iter_content(chunk_size=self.chunk_bytes):
+            # Wheels are already compressed, so read the raw stream and skip the content
+            # decoder unless the server actually applied a Content-Encoding.
+            decode: bool = bool(resp.headers.get("Content-Encoding"))
+            with _atomic_writer(dest_path) as f:
+                w = _HashingWriter(f)
+                for chunk in resp.raw.stream(self.chunk_bytes, decode_content=decode):
                     if chunk:
-                        f.write(chunk)
+                        w.write(chunk)
 
-        size: int = dest_path.stat().st_size
-        sha256: str = _sha256_file(dest_path)
+        size: int = w.size
+        sha256: str = w.hexdigest()
 
         return ArtifactRecord(
             key=key,
@@ -231,7 +357,7 @@ class Pep658CoreMetadataHttpStrategy(CoreMetadataStrategy):
     Download core metadata via PEP 658 sidecar (<file_url>.metadata).
     """
 
-    name: str = "pep658_http"
+    name: str = PEP658_HTTP
     precedence: int = 50
     timeout_s: float = 30.0
     user_agent: str = "project-resolution-engine/0"
@@ -249,7 +375,7 @@ class Pep658CoreMetadataHttpStrategy(CoreMetadataStrategy):
         url = _pep658_metadata_url(key.file_url)
         headers = {"User-Agent": self.user_agent}
 
-        resp: requests.Response = requests.get(
+        resp: requests.Response = _SESSION.get(
             url, headers=headers, timeout=self.timeout_s
         )
         if resp.status_code == 404:
@@ -257,10 +383,11 @@ class Pep658CoreMetadataHttpStrategy(CoreMetadataStrategy):
             raise StrategyNotApplicable()
 
         resp.raise_for_status()
-        dest_path.write_bytes(resp.content)
+        metadata_bytes: bytes = resp.content
+        _write_bytes_atomic(dest_path, metadata_bytes)
 
-        size = dest_path.stat().st_size
-        sha256 = _sha256_file(dest_path)
+        size = len(metadata_bytes)
+        sha256 = hashlib.sha256(metadata_bytes).hexdigest()
 
         return ArtifactRecord(
             key=key,
@@ -280,7 +407,7 @@ class WheelExtractedCoreMetadataStrategy(CoreMetadataStrategy):
     *.dist-info/METADATA into destination_uri.
     """
 
-    name: str = "wheel_extracted_metadata"
+    name: str = WHEEL_EXTRACTED_METADATA
     precedence: int = 90
     source: ArtifactSource = ArtifactSource.WHEEL_EXTRACTED
     wheel_strategy: WheelFileStrategy = field(kw_only=True)
@@ -309,12 +436,10 @@ class WheelExtractedCoreMetadataStrategy(CoreMetadataStrategy):
 
             with zipfile.ZipFile(wheel_path, mode="r") as zf:
                 meta_member = _find_dist_info_metadata_path(zf)
-                metadata_bytes = zf.read(meta_member)
-
-            dest_path.write_bytes(metadata_bytes)
+                w = _extract_member(zf, meta_member, dest_path)
 
-        size = dest_path.stat().st_size
-        sha256 = _sha256_file(dest_path)
+        size = w.size
+        sha256 = w.hexdigest()
 
         return ArtifactRecord(
             key=key,
@@ -329,7 +454,7 @@ class WheelExtractedCoreMetadataStrategy(CoreMetadataStrategy):
 
 @dataclass(frozen=True)
 class DirectUriWheelFileStrategy(WheelFileStrategy):
-    name: str = "uri_wheel_file"
+    name: str = URI_WHEEL_FILE
     precedence: int = 40  # higher priority than HTTP
     chunk_bytes: int = 1024 * 1024
     source: ArtifactSource = ArtifactSource.URI_WHEEL
@@ -360,12 +485,12 @@ class DirectUriWheelFileStrategy(WheelFileStrategy):
         # copy
         w: BufferedWriter
         r: BufferedReader
-        with src_path.open("rb") as r, dest_path.open("wb") as w:
-            for chunk in iter(lambda: r.read(self.chunk_bytes), b""):
-                w.write(chunk)
+        with src_path.open("rb") as r, _atomic_writer(dest_path) as w:
+            hw = _HashingWriter(w)
+            shutil.copyfileobj(r, hw, length=self.chunk_bytes)
 
-        size = dest_path.stat().st_size
-        sha256 = _sha256_file(dest_path)
+        size = hw.size
+        sha256 = hw.hexdigest()
 
         return ArtifactRecord(
             key=key,
@@ -385,7 +510,7 @@ class DirectUriCoreMetadataStrategy(CoreMetadataStrategy):
     or file:// URI by extracting *.dist-info/METADATA directly from the wheel.
     """
 
-    name: str = "direct_uri_core_metadata"
+    name: str = DIRECT_URI_CORE_METADATA
     precedence: int = 40
     source: ArtifactSource = ArtifactSource.URI_WHEEL
 
@@ -416,11 +541,10 @@ class DirectUriCoreMetadataStrategy(CoreMetadataStrategy):
         zf: zipfile.ZipFile
         with zipfile.ZipFile(wheel_path, mode="r") as zf:
             member = _find_dist_info_metadata_path(zf)
-            metadata_bytes = zf.read(member)
-            dest_path.write_bytes(metadata_bytes)
+            w = _extract_member(zf, member, dest_path)
 
-        size = dest_path.stat().st_size
-        sha256 = _sha256_file(dest_path)
+        size = w.size
+        sha256 = w.hexdigest()
 
         return ArtifactRecord(
             key=key,
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
-from typing import Any, ClassVar
-
-from project_resolution_engine.internal.builtin_strategies import (
-    DirectUriCoreMetadataStrategy,
-    DirectUriWheelFileStrategy,
-    HttpWheelFileStrategy,
-    Pep658CoreMetadataHttpStrategy,
-    Pep691IndexMetadataHttpStrategy,
-    WheelExtractedCoreMetadataStrategy,
+import functools
+import sys
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass, replace
+from types import MappingProxyType
+from typing import Any, ClassVar, Final, TypedDict, get_type_hints
+
+from project_resolution_engine.internal.builtin_strategy_names import (
+    DIRECT_URI_CORE_METADATA,
+    PEP658_HTTP,
+    PEP691_HTTP,
+    URI_WHEEL_FILE,
+    WHEEL_EXTRACTED_METADATA,
+    WHEEL_HTTP,
 )
 from project_resolution_engine.internal.util.strategy import (
     BaseArtifactResolutionStrategyConfig,
@@ -26,44 +30,75 @@ class StrategyConfigError(ValueError):
     pass
 
 
-_RESERVED_KEYS: set[str] = {"instance_id", "precedence"}
+_RESERVED_KEYS: frozenset[str] = frozenset({"instance_id", "precedence"})
 
+# Schema type kinds; each names an entry in _TYPES.
+_STR: Final[str] = "str"
+_INT: Final[str] = "int"
+_FLOAT: Final[str] = "float"
 
-def _unknown_keys(cfg: Mapping[str, Any], allowed: set[str], *, ctx: str) -> None:
-    extra = set(cfg.keys()) - allowed
-    if extra:
-        raise StrategyConfigError(f"{ctx}: unknown config keys: {sorted(extra)}")
+# Accepted runtime types per kind (ints are promoted for float fields).
+_TYPES: Final[Mapping[str, tuple[type, ...]]] = {
+    _STR: (str,),
+    _INT: (int,),
+    _FLOAT: (int, float),
+}
 
+# Annotation type -> kind, for deriving schemas from the config shapes below.
+_KIND_BY_TYPE: Final[Mapping[type, str]] = {str: _STR, int: _INT, float: _FLOAT}
 
-def _opt_str(cfg: Mapping[str, Any], key: str) -> str | None:
-    if key not in cfg:
-        return None
-    v = cfg[key]
-    if not isinstance(v, str):
-        raise StrategyConfigError(f"{key}: expected str, got {type(v).__name__}")
-    return v
+_MISSING: Final = object()
 
+# (config key, kind, ctor kwarg name)
+_SchemaEntry = tuple[str, str, str]
 
-def _opt_int(cfg: Mapping[str, Any], key: str) -> int | None:
-    if key not in cfg:
-        return None
-    v = cfg[key]
-    if not isinstance(v, int):
-        raise StrategyConfigError(f"{key}: expected int, got {type(v).__name__}")
-    return v
+
+def _unknown_keys(cfg: Mapping[str, Any], allowed: frozenset[str], *, ctx: str) -> None:
+    # Key views support set operations directly; the clean case is one subset check.
+    keys = cfg.keys()
+    if keys <= allowed:
+        return
+    extra = keys - allowed
+    raise StrategyConfigError(f"{ctx}: unknown config keys: {sorted(extra)}")
 
 
-def _opt_float(cfg: Mapping[str, Any], key: str) -> float | None:
-    if key not in cfg:
+def _opt(cfg: Mapping[str, Any], key: str, kind: str) -> Any:
+    v = cfg.get(key, _MISSING)
+    if v is _MISSING:
         return None
-    v = cfg[key]
-    if isinstance(v, int):
+    accepted = _TYPES[kind]
+    # Exact type hit is the common case; isinstance only covers subclasses.
+    if type(v) not in accepted and not isinstance(v, accepted):
+        raise StrategyConfigError(f"{key}: expected {kind}, got {type(v).__name__}")
+    if kind == _FLOAT and type(v) is not float:
         return float(v)
-    if not isinstance(v, float):
-        raise StrategyConfigError(f"{key}: expected float, got {type(v).__name__}")
     return v
 
 
+def _ctor_from_schema(
+    config: Mapping[str, Any], schema: tuple[_SchemaEntry, ...]
+) -> dict[str, Any]:
+    # Single pass over the class schema precompiled at import time.
+    return {
+        ctor_name: v
+        for key, kind, ctor_name in schema
+        if (v := _opt(config, key, kind)) is not None
+    }
+
+
+@functools.lru_cache(maxsize=64)
+def _wheel_ref(wheel_sid: str) -> tuple[StrategyRef, str]:
+    # Only a handful of wheel strategy ids exist; StrategyRef is frozen, so share it.
+    ref = StrategyRef(strategy_name=wheel_sid, instance_id=wheel_sid)
+    return ref, ref.normalized_instance_id()
+
+
+@functools.lru_cache(maxsize=None)
+def _default_precedence(strategy_cls: type) -> Any:
+    # Strategy classes are few and stable; resolve the class default once.
+    return getattr(strategy_cls, "precedence", 100)
+
+
 def _plan_single(
     *,
     strategy_name: str,
@@ -71,16 +106,36 @@ def _plan_single(
     config: Mapping[str, Any],
     ctor_kwargs: Mapping[str, Any],
     depends_on: tuple[str, ...] = (),
-) -> list[StrategyPlan]:
-    instance_id = str(config.get("instance_id") or "") or strategy_name
-    precedence = int(config.get("precedence", getattr(strategy_cls, "precedence", 100)))
+) -> tuple[StrategyPlan, ...]:
+    # Config-sourced ids are interned so depends_on/instance_id dict hits compare by identity.
+    iid = config.get("instance_id")
+    if isinstance(iid, str):
+        instance_id = sys.intern(iid) if iid else strategy_name
+    elif iid is None:
+        instance_id = strategy_name
+    else:
+        raise StrategyConfigError(
+            f"instance_id: expected str, got {type(iid).__name__}"
+        )
+    p = config.get("precedence", _MISSING)
+    if p is _MISSING:
+        p = _default_precedence(strategy_cls)
+    precedence = p if type(p) is int else int(p)
 
     # Always push precedence/instance_id into ctor kwargs so the instance matches the plan deterministically.
-    full_kwargs: dict[str, Any] = dict(ctor_kwargs)
-    full_kwargs.setdefault("instance_id", instance_id)
-    full_kwargs.setdefault("precedence", precedence)
+    full_kwargs: Mapping[str, Any]
+    if "instance_id" in ctor_kwargs and "precedence" in ctor_kwargs:
+        # Explicit values win anyway; no copy needed.
+        full_kwargs = ctor_kwargs
+    else:
+        # Computed values first so explicit ctor_kwargs entries win.
+        full_kwargs = {
+            "instance_id": instance_id,
+            "precedence": precedence,
+            **ctor_kwargs,
+        }
 
-    return [
+    return (
         StrategyPlan(
             strategy_name=strategy_name,
             instance_id=instance_id,
@@ -88,188 +143,281 @@ def _plan_single(
             ctor_kwargs=full_kwargs,
             depends_on=depends_on,
             precedence=precedence,
-        )
-    ]
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _reserved_only_plan(
+    strategy_cls: type, strategy_name: str, instance_id: Any, precedence: Any
+) -> tuple[StrategyPlan, ...]:
+    config: dict[str, Any] = {}
+    if instance_id is not _MISSING:
+        config["instance_id"] = instance_id
+    if precedence is not _MISSING:
+        config["precedence"] = precedence
+    (plan,) = _plan_single(
+        strategy_name=strategy_name,
+        strategy_cls=strategy_cls,
+        config=config,
+        ctor_kwargs={},
+    )
+    # The plan is shared by every caller with the same inputs; keep its kwargs read-only.
+    return (replace(plan, ctor_kwargs=MappingProxyType(dict(plan.ctor_kwargs))),)
+
+
+def _plan_reserved_only(
+    *, strategy_name: str, strategy_cls: type, config: Mapping[str, Any]
+) -> tuple[StrategyPlan, ...]:
+    # With only reserved keys the plan is fully determined by its inputs, so cache
+    # well-typed ones; anything else takes the normal path so coercion errors surface.
+    iid = config.get("instance_id", _MISSING)
+    precedence = config.get("precedence", _MISSING)
+    if (iid is _MISSING or type(iid) is str) and (
+        precedence is _MISSING or type(precedence) is int
+    ):
+        return _reserved_only_plan(strategy_cls, strategy_name, iid, precedence)
+    return _plan_single(
+        strategy_name=strategy_name,
+        strategy_cls=strategy_cls,
+        config=config,
+        ctor_kwargs={},
+    )
+
+
+def _schema_from(
+    shape: type, *, skip: frozenset[str] = frozenset()
+) -> tuple[_SchemaEntry, ...]:
+    # Resolved once per class at import time; reserved keys are handled by _plan_single.
+    return tuple(
+        (key, _KIND_BY_TYPE[tp], key)
+        for key, tp in get_type_hints(shape).items()
+        if key not in _RESERVED_KEYS and key not in skip
+    )
+
+
+def _allowed_keys(shape: type) -> frozenset[str]:
+    # Every TypedDict key is annotated, required or not.
+    return frozenset(get_type_hints(shape))
 
 
 # --------------------------------------------------------------------------- #
-# builtin config specs (these are what discover_config_specs loads)
+# config shapes (the single source of truth for accepted keys and their types)
 # --------------------------------------------------------------------------- #
 
 
-class Pep691IndexMetadataHttpStrategyConfig(BaseArtifactResolutionStrategyConfig[Any]):
-    strategy_name: ClassVar[str] = Pep691IndexMetadataHttpStrategy.name
-
-    @classmethod
-    def defaults(cls) -> Mapping[str, Any]:
-        # Canonical defaults live here (not “magic” in strategy classes).
-        return {
-            "timeout_s": 30.0,
-            "user_agent": "project-resolution-engine/0",
-            "precedence": 50,
-        }
-
-    @classmethod
-    def plan(
-        cls, *, strategy_cls: type, config: Mapping[str, Any]
-    ) -> list[StrategyPlan]:
-        allowed = _RESERVED_KEYS | {"timeout_s", "user_agent"}
-        _unknown_keys(config, allowed, ctx=cls.strategy_name)
+class _ReservedCfg(TypedDict, total=False):
+    instance_id: str
+    precedence: int
 
-        ctor: dict[str, Any] = {}
-        if (v_timeout := _opt_float(config, "timeout_s")) is not None:
-            ctor["timeout_s"] = v_timeout
-        if (v_agent := _opt_str(config, "user_agent")) is not None:
-            ctor["user_agent"] = v_agent
 
-        return _plan_single(
-            strategy_name=cls.strategy_name,
-            strategy_cls=strategy_cls,
-            config=config,
-            ctor_kwargs=ctor,
-        )
+class _Pep691Cfg(_ReservedCfg, total=False):
+    timeout_s: float
+    user_agent: str
 
 
-class HttpWheelFileStrategyConfig(BaseArtifactResolutionStrategyConfig[Any]):
-    strategy_name: ClassVar[str] = HttpWheelFileStrategy.name
+class _HttpWheelCfg(_ReservedCfg, total=False):
+    timeout_s: float
+    user_agent: str
+    chunk_bytes: int
 
-    @classmethod
-    def defaults(cls) -> Mapping[str, Any]:
-        return {
-            "timeout_s": 120.0,
-            "user_agent": "project-resolution-engine/0",
-            "chunk_bytes": 1024 * 1024,
-            "precedence": 50,
-        }
 
-    @classmethod
-    def plan(
-        cls, *, strategy_cls: type, config: Mapping[str, Any]
-    ) -> list[StrategyPlan]:
-        allowed = _RESERVED_KEYS | {"timeout_s", "user_agent", "chunk_bytes"}
-        _unknown_keys(config, allowed, ctx=cls.strategy_name)
-
-        ctor: dict[str, Any] = {}
-        if (v_timeout := _opt_float(config, "timeout_s")) is not None:
-            ctor["timeout_s"] = v_timeout
-        if (v_agent := _opt_str(config, "user_agent")) is not None:
-            ctor["user_agent"] = v_agent
-        if (v_chunk_bytes := _opt_int(config, "chunk_bytes")) is not None:
-            ctor["chunk_bytes"] = v_chunk_bytes
-
-        return _plan_single(
-            strategy_name=cls.strategy_name,
-            strategy_cls=strategy_cls,
-            config=config,
-            ctor_kwargs=ctor,
-        )
+class _Pep658Cfg(_ReservedCfg, total=False):
+    timeout_s: float
+    user_agent: str
 
 
-class Pep658CoreMetadataHttpStrategyConfig(BaseArtifactResolutionStrategyConfig[Any]):
-    strategy_name: ClassVar[str] = Pep658CoreMetadataHttpStrategy.name
+class _WheelExtractedCfg(_ReservedCfg, total=False):
+    wheel_strategy_id: str
+    wheel_timeout_s: float
 
-    @classmethod
-    def defaults(cls) -> Mapping[str, Any]:
-        return {
-            "timeout_s": 30.0,
-            "user_agent": "project-resolution-engine/0",
-            "precedence": 50,
-        }
 
-    @classmethod
-    def plan(
-        cls, *, strategy_cls: type, config: Mapping[str, Any]
-    ) -> list[StrategyPlan]:
-        allowed = _RESERVED_KEYS | {"timeout_s", "user_agent"}
-        _unknown_keys(config, allowed, ctx=cls.strategy_name)
+class _DirectUriWheelCfg(_ReservedCfg, total=False):
+    chunk_bytes: int
 
-        ctor: dict[str, Any] = {}
-        if (v_timeout := _opt_float(config, "timeout_s")) is not None:
-            ctor["timeout_s"] = v_timeout
-        if (v_agent := _opt_str(config, "user_agent")) is not None:
-            ctor["user_agent"] = v_agent
 
-        return _plan_single(
-            strategy_name=cls.strategy_name,
-            strategy_cls=strategy_cls,
-            config=config,
-            ctor_kwargs=ctor,
-        )
+# --------------------------------------------------------------------------- #
+# declarative spec table (one planning path for every builtin config)
+# --------------------------------------------------------------------------- #
 
+# Post hook: may add injected ctor kwargs and returns the plan's depends_on.
+_PostHook = Callable[[Mapping[str, Any], dict[str, Any]], tuple[str, ...]]
 
-class WheelExtractedCoreMetadataStrategyConfig(
-    BaseArtifactResolutionStrategyConfig[Any]
-):
-    strategy_name: ClassVar[str] = WheelExtractedCoreMetadataStrategy.name
 
-    @classmethod
-    def defaults(cls) -> Mapping[str, Any]:
-        # The key point: this strategy must be configured with a wheel strategy to delegate to.
-        return {
-            "wheel_strategy_id": "wheel_http",
-            "wheel_timeout_s": 120.0,
-            "precedence": 90,
-        }
+@dataclass(frozen=True, slots=True)
+class _ConfigSpec:
+    """
+    Everything needed to plan one builtin strategy, frozen at import time.
+    """
 
-    @classmethod
-    def plan(
-        cls, *, strategy_cls: type, config: Mapping[str, Any]
-    ) -> list[StrategyPlan]:
-        allowed = _RESERVED_KEYS | {"wheel_strategy_id", "wheel_timeout_s"}
-        _unknown_keys(config, allowed, ctx=cls.strategy_name)
+    name: str
+    defaults: Mapping[str, Any]
+    allowed: frozenset[str]
+    schema: tuple[_SchemaEntry, ...]
+    post: _PostHook | None = None
 
-        wheel_sid = _opt_str(config, "wheel_strategy_id") or "wheel_http"
 
-        # Injection is via StrategyRef, not by directly fetching instances here.
-        wheel_ref: StrategyRef = StrategyRef(
-            strategy_name=wheel_sid, instance_id=wheel_sid
+def _config_spec(
+    name: str,
+    shape: type,
+    defaults: Mapping[str, Any],
+    *,
+    skip: frozenset[str] = frozenset(),
+    post: _PostHook | None = None,
+) -> _ConfigSpec:
+    return _ConfigSpec(
+        name=name,
+        defaults=MappingProxyType(dict(defaults)),
+        allowed=_allowed_keys(shape),
+        schema=_schema_from(shape, skip=skip),
+        post=post,
+    )
+
+
+def _inject_wheel_ref(
+    config: Mapping[str, Any], ctor: dict[str, Any]
+) -> tuple[str, ...]:
+    wheel_sid = _opt(config, "wheel_strategy_id", _STR) or WHEEL_HTTP
+
+    # Injection is via StrategyRef, not by directly fetching instances here.
+    wheel_ref, wheel_dep_id = _wheel_ref(wheel_sid)
+    ctor["wheel_strategy"] = wheel_ref
+    return (wheel_dep_id,)
+
+
+def _plan_from_spec(
+    spec: _ConfigSpec, strategy_cls: type, config: Mapping[str, Any]
+) -> tuple[StrategyPlan, ...]:
+    _unknown_keys(config, spec.allowed, ctx=spec.name)
+
+    ctor = _ctor_from_schema(config, spec.schema)
+    depends_on: tuple[str, ...] = ()
+    if spec.post is not None:
+        depends_on = spec.post(config, ctor)
+    elif not ctor:
+        # Nothing beyond reserved keys was configured.
+        return _plan_reserved_only(
+            strategy_name=spec.name, strategy_cls=strategy_cls, config=config
         )
 
-        ctor: dict[str, Any] = {
-            "wheel_strategy": wheel_ref,
-        }
-        if (v := _opt_float(config, "wheel_timeout_s")) is not None:
-            ctor["wheel_timeout_s"] = v
+    return _plan_single(
+        strategy_name=spec.name,
+        strategy_cls=strategy_cls,
+        config=config,
+        ctor_kwargs=ctor,
+        depends_on=depends_on,
+    )
 
-        return _plan_single(
-            strategy_name=cls.strategy_name,
-            strategy_cls=strategy_cls,
-            config=config,
-            ctor_kwargs=ctor,
-            depends_on=(wheel_ref.normalized_instance_id(),),
-        )
 
+class _BuiltinStrategyConfig(BaseArtifactResolutionStrategyConfig[Any]):
+    """
+    Shared base for the builtin config specs.
 
-class DirectUriWheelFileStrategyConfig(BaseArtifactResolutionStrategyConfig[Any]):
-    strategy_name: ClassVar[str] = DirectUriWheelFileStrategy.name
+    Subclasses declare strategy_name, SHAPE (a TypedDict) and DEFAULTS, plus SKIP and
+    POST when a key needs custom handling. __init_subclass__ freezes these into _SPEC
+    once per class, so plan() does no per-call schema work.
+    """
+
+    __slots__ = ()
+
+    strategy_name: ClassVar[str]
+    SHAPE: ClassVar[type] = _ReservedCfg
+    DEFAULTS: ClassVar[Mapping[str, Any]] = {}
+    SKIP: ClassVar[frozenset[str]] = frozenset()
+    POST: ClassVar[_PostHook | None] = None
+    _SPEC: ClassVar[_ConfigSpec]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._SPEC = _config_spec(
+            cls.strategy_name,
+            cls.SHAPE,
+            cls.DEFAULTS,
+            skip=cls.SKIP,
+            post=cls.POST,
+        )
 
     @classmethod
     def defaults(cls) -> Mapping[str, Any]:
-        return {
-            "chunk_bytes": 1024 * 1024,
-            "precedence": 40,
-        }
+        return cls._SPEC.defaults
 
     @classmethod
     def plan(
         cls, *, strategy_cls: type, config: Mapping[str, Any]
+    ) -> Sequence[StrategyPlan]:
+        return _plan_from_spec(cls._SPEC, strategy_cls, config)
+
+    @classmethod
+    def plan_all(
+        cls, *, strategy_cls: type, configs: Iterable[Mapping[str, Any]]
     ) -> list[StrategyPlan]:
-        allowed = _RESERVED_KEYS | {"chunk_bytes"}
-        _unknown_keys(config, allowed, ctx=cls.strategy_name)
+        spec = cls._SPEC
+        plans: list[StrategyPlan] = []
+        for config in configs:
+            plans.extend(_plan_from_spec(spec, strategy_cls, config))
+        return plans
 
-        ctor: dict[str, Any] = {}
-        if (v := _opt_int(config, "chunk_bytes")) is not None:
-            ctor["chunk_bytes"] = v
 
-        return _plan_single(
-            strategy_name=cls.strategy_name,
-            strategy_cls=strategy_cls,
-            config=config,
-            ctor_kwargs=ctor,
-        )
+# --------------------------------------------------------------------------- #
+# builtin config specs (these are what discover_config_specs loads)
+# --------------------------------------------------------------------------- #
 
 
-class DirectUriCoreMetadataStrategyConfig(BaseArtifactResolutionStrategyConfig[Any]):
+class Pep691IndexMetadataHttpStrategyConfig(_BuiltinStrategyConfig):
+    strategy_name: ClassVar[str] = PEP691_HTTP
+    SHAPE = _Pep691Cfg
+    # Canonical defaults live here (not “magic” in strategy classes).
+    DEFAULTS = {
+        "timeout_s": 30.0,
+        "user_agent": "project-resolution-engine/0",
+        "precedence": 50,
+    }
+
+
+class HttpWheelFileStrategyConfig(_BuiltinStrategyConfig):
+    strategy_name: ClassVar[str] = WHEEL_HTTP
+    SHAPE = _HttpWheelCfg
+    DEFAULTS = {
+        "timeout_s": 120.0,
+        "user_agent": "project-resolution-engine/0",
+        "chunk_bytes": 4 * 1024 * 1024,
+        "precedence": 50,
+    }
+
+
+class Pep658CoreMetadataHttpStrategyConfig(_BuiltinStrategyConfig):
+    strategy_name: ClassVar[str] = PEP658_HTTP
+    SHAPE = _Pep658Cfg
+    DEFAULTS = {
+        "timeout_s": 30.0,
+        "user_agent": "project-resolution-engine/0",
+        "precedence": 50,
+    }
+
+
+class WheelExtractedCoreMetadataStrategyConfig(_BuiltinStrategyConfig):
+    strategy_name: ClassVar[str] = WHEEL_EXTRACTED_METADATA
+    SHAPE = _WheelExtractedCfg
+    # The key point: this strategy must be configured with a wheel strategy to delegate to.
+    DEFAULTS = {
+        "wheel_strategy_id": WHEEL_HTTP,
+        "wheel_timeout_s": 120.0,
+        "precedence": 90,
+    }
+    SKIP = frozenset({"wheel_strategy_id"})
+    POST = _inject_wheel_ref
+
+
+class DirectUriWheelFileStrategyConfig(_BuiltinStrategyConfig):
+    strategy_name: ClassVar[str] = URI_WHEEL_FILE
+    SHAPE = _DirectUriWheelCfg
+    DEFAULTS = {
+        "chunk_bytes": 1024 * 1024,
+        "precedence": 40,
+    }
+
+
+class DirectUriCoreMetadataStrategyConfig(_BuiltinStrategyConfig):
     """
     DirectUriCoreMetadataStrategyConfig is a configuration class for managing the artifact
     resolution strategy using direct URI core metadata.
@@ -283,24 +431,7 @@ class DirectUriCoreMetadataStrategyConfig(BaseArtifactResolutionStrategyConfig[A
         strategy_name (ClassVar[str]): The name of the strategy leveraged by the class.
     """
 
-    strategy_name: ClassVar[str] = DirectUriCoreMetadataStrategy.name
-
-    @classmethod
-    def defaults(cls) -> Mapping[str, Any]:
-        return {
-            "precedence": 40,
-        }
-
-    @classmethod
-    def plan(
-        cls, *, strategy_cls: type, config: Mapping[str, Any]
-    ) -> list[StrategyPlan]:
-        allowed = _RESERVED_KEYS
-        _unknown_keys(config, allowed, ctx=cls.strategy_name)
-
-        return _plan_single(
-            strategy_name=cls.strategy_name,
-            strategy_cls=strategy_cls,
-            config=config,
-            ctor_kwargs={},
-        )
+    strategy_name: ClassVar[str] = DIRECT_URI_CORE_METADATA
+    DEFAULTS = {
+        "precedence": 40,
+    }
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from typing import Final
+
+# Canonical names of the builtin strategies.
+#
+# Kept dependency-free so config specs can refer to strategies by name without
+# importing the strategy implementations (and their HTTP/zip machinery).
+
+PEP691_HTTP: Final[str] = "pep691_http"
+WHEEL_HTTP: Final[str] = "wheel_http"
+PEP658_HTTP: Final[str] = "pep658_http"
+WHEEL_EXTRACTED_METADATA: Final[str] = "wheel_extracted_metadata"
+URI_WHEEL_FILE: Final[str] = "uri_wheel_file"
+DIRECT_URI_CORE_METADATA: Final[str] = "direct_uri_core_metadata"
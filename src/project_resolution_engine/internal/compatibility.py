@@ -1,13 +1,19 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, TypedDict, cast
+from typing import Any, TypedDict, TypeVar, cast
 
 from packaging.markers import Environment
 
-from project_resolution_engine.internal.util.multiformat import MultiformatModelMixin
+from project_resolution_engine.internal.util.multiformat import (
+    MappingFieldKind,
+    MultiformatModelMixin,
+)
+
+# Allowed key sets per TypedDict class; annotations are fixed once the class exists.
+_ALLOWED_KEYS_CACHE: dict[type, frozenset[str]] = {}
 
 
 # :: MechanicalOperation | type=validation
@@ -34,16 +40,26 @@ def validate_typed_dict(
         ValueError: If there are keys in the mapping that are not allowed by the TypedDict
             definition, or if the values in the mapping do not match the expected type(s).
     """
-    allowed_env_keys = set(validation_type.__annotations__.keys())
-    bad_keys = set(mapping.keys()) - allowed_env_keys
-    if bad_keys:
-        raise ValueError(f"Invalid {desc} keys: {bad_keys}")
-    bad_vals = [
-        (k, type(v).__name__)
-        for k, v in mapping.items()
-        if not isinstance(v, value_type)
-    ]
-    if bad_vals:
+    allowed_env_keys = _ALLOWED_KEYS_CACHE.get(validation_type)
+    if allowed_env_keys is None:
+        allowed_env_keys = _ALLOWED_KEYS_CACHE[validation_type] = frozenset(
+            validation_type.__annotations__
+        )
+    # Single pass; error containers are only allocated once something fails.
+    bad_keys: list[str] | None = None
+    bad_vals: list[tuple[str, str]] | None = None
+    for k, v in mapping.items():
+        if k not in allowed_env_keys:
+            if bad_keys is None:
+                bad_keys = []
+            bad_keys.append(k)
+        elif not isinstance(v, value_type):
+            if bad_vals is None:
+                bad_vals = []
+            bad_vals.append((k, type(v).__name__))
+    if bad_keys is not None:
+        raise ValueError(f"Invalid {desc} keys: {set(bad_keys)}")
+    if bad_vals is not None:
         details = ", ".join(f"{k} (got {t})" for k, t in bad_vals)
         expected = (
             value_type.__name__
@@ -53,6 +69,30 @@ def validate_typed_dict(
         raise ValueError(f"Invalid {desc} values: expected {expected}; {details}")
 
 
+_T = TypeVar("_T")
+
+
+# :: MechanicalOperation | type=deserialization
+def _optional(
+    mapping: Mapping[str, Any],
+    key: str,
+    factory: Callable[[Mapping[str, Any]], _T],
+) -> _T | None:
+    """
+    Builds an optional nested model from `mapping[key]` with a single lookup.
+
+    Args:
+        mapping: Mapping to read the nested value from.
+        key: Key of the nested value.
+        factory: Callable that builds the model from the nested mapping.
+
+    Returns:
+        The built model, or None if the key is absent or its value is falsy.
+    """
+    value = mapping.get(key)
+    return factory(value) if value else None
+
+
 class MarkerModeType(Enum):
     """
     Defines a set of enumeration values for marker mode types.
@@ -71,6 +111,10 @@ class MarkerModeType(Enum):
     EXACT = "exact"
 
 
+# Direct value lookup; skips Enum.__call__ for the common string case.
+_MODE_BY_VALUE: dict[str, MarkerModeType] = {m.value: m for m in MarkerModeType}
+
+
 class EnvironmentOverrides(Environment, total=False):
     """
     Typed dictionary for overriding the Environment typed dictionary
@@ -84,8 +128,10 @@ class EnvironmentOverrides(Environment, total=False):
     """
 
 
-@dataclass
-class MarkerEnvConfig(MultiformatModelMixin):
+@dataclass(slots=True)
+class MarkerEnvConfig(
+    MultiformatModelMixin, mapping_fields={"mode": MappingFieldKind.ENUM}
+):
     """
     Represents the configuration for a marker environment.
 
@@ -108,37 +154,31 @@ class MarkerEnvConfig(MultiformatModelMixin):
     )
     mode: MarkerModeType = MarkerModeType.MERGE
 
-    # :: MechanicalOperation | type=serialization
-    # :: PermitUnused
-    def to_mapping(self) -> Mapping[str, Any]:
-        return {
-            "overrides": self.overrides,
-            "mode": self.mode.value,
-        }
-
     # :: MechanicalOperation | type=deserialization
     # :: PermitUnused
     @classmethod
     def from_mapping(cls, mapping: Mapping[str, Any], **_: Any) -> MarkerEnvConfig:
         overrides = mapping.get("overrides", {})
-        if not isinstance(overrides, dict):
+        if not isinstance(overrides, Mapping):
             raise ValueError(
-                f"Invalid overrides value: expected dict; got {type(overrides).__name__}"
+                f"Invalid overrides value: expected mapping; got {type(overrides).__name__}"
             )
-        overrides_map = overrides
         validate_typed_dict(
-            "marker_env overrides", overrides_map, EnvironmentOverrides, str
+            "marker_env overrides", overrides, EnvironmentOverrides, str
         )
-        env_overrides = cast(EnvironmentOverrides, cast(object, overrides_map))
 
-        return cls(
-            overrides=env_overrides,
-            mode=MarkerModeType(mapping.get("mode", MarkerModeType.MERGE.value)),
-        )
+        mode_value = mapping.get("mode", MarkerModeType.MERGE.value)
+        mode = _MODE_BY_VALUE.get(mode_value) if isinstance(mode_value, str) else None
+        if mode is None:
+            # Members and invalid values take the Enum path (and its error).
+            mode = MarkerModeType(mode_value)
+
+        # Validated above, so overrides is an EnvironmentOverrides at runtime.
+        return cls(overrides=overrides, mode=mode)  # type: ignore[arg-type]
 
 
-@dataclass
-class Filter(MultiformatModelMixin):
+@dataclass(slots=True)
+class Filter(MultiformatModelMixin, mapping_fields={}):
     """
     Represents a unified include/exclude pattern.
 
@@ -160,28 +200,26 @@ class Filter(MultiformatModelMixin):
         False  # If true, ignore generation and only use the include list
     )
 
-    # :: MechanicalOperation | type=serialization
-    # :: PermitUnused
-    def to_mapping(self) -> Mapping[str, Any]:
-        return {
-            "include": self.include,
-            "exclude": self.exclude,
-            "specific_only": self.specific_only,
-        }
-
     # :: MechanicalOperation | type=deserialization
     # :: PermitUnused
     @classmethod
     def from_mapping(cls, mapping: Mapping[str, Any], **_: Any) -> Filter:
+        get = mapping.get
         return cls(
-            include=mapping.get("include", []),
-            exclude=mapping.get("exclude", []),
-            specific_only=mapping.get("specific_only", False),
+            include=get("include", []),
+            exclude=get("exclude", []),
+            specific_only=get("specific_only", False),
         )
 
 
-@dataclass
-class VersionSpec(MultiformatModelMixin):
+@dataclass(slots=True)
+class VersionSpec(
+    MultiformatModelMixin,
+    mapping_fields={
+        "range": MappingFieldKind.OPT,
+        "filters": MappingFieldKind.OPT_MODEL,
+    },
+):
     """
     Version specification with range and filters.
 
@@ -201,28 +239,23 @@ class VersionSpec(MultiformatModelMixin):
     range: str | None = None  # PEP 440: ">=3.10,<4.0" or None for "all"
     filters: Filter | None = None
 
-    # :: MechanicalOperation | type=serialization
-    # :: PermitUnused
-    def to_mapping(self) -> Mapping[str, Any]:
-        result: dict[str, Any] = {}
-        if self.range is not None:
-            result["range"] = self.range
-        if self.filters is not None:
-            result["filters"] = self.filters.to_mapping()
-        return result
-
     # :: MechanicalOperation | type=deserialization
     # :: PermitUnused
     @classmethod
     def from_mapping(cls, mapping: Mapping[str, Any], **_: Any) -> VersionSpec:
-        filters_data: Mapping[str, Any] | None = mapping.get("filters")
-        filters = Filter.from_mapping(filters_data) if filters_data else None
+        filters = _optional(mapping, "filters", Filter.from_mapping)
 
         return cls(range=mapping.get("range"), filters=filters)
 
 
-@dataclass
-class InterpreterConfig(MultiformatModelMixin):
+@dataclass(slots=True)
+class InterpreterConfig(
+    MultiformatModelMixin,
+    mapping_fields={
+        "python_version": MappingFieldKind.MODEL,
+        "filters": MappingFieldKind.OPT_MODEL,
+    },
+):
     """
     Represents a Python interpreter configuration.
 
@@ -244,35 +277,25 @@ class InterpreterConfig(MultiformatModelMixin):
     accept_universal: bool = True
     filters: Filter | None = None
 
-    # :: MechanicalOperation | type=serialization
-    # :: PermitUnused
-    def to_mapping(self) -> Mapping[str, Any]:
-        result: dict[str, Any] = {
-            "python_version": self.python_version.to_mapping(),
-            "types": self.types,
-            "accept_universal": self.accept_universal,
-        }
-        if self.filters is not None:
-            result["filters"] = self.filters.to_mapping()
-        return result
-
     # :: MechanicalOperation | type=deserialization
     # :: PermitUnused
     @classmethod
     def from_mapping(cls, mapping: Mapping[str, Any], **_: Any) -> InterpreterConfig:
-        filters_data: Mapping[str, Any] | None = mapping.get("filters")
-        filters = Filter.from_mapping(filters_data) if filters_data else None
+        get = mapping.get
+        filters = _optional(mapping, "filters", Filter.from_mapping)
 
         return cls(
             python_version=VersionSpec.from_mapping(mapping["python_version"]),
-            types=mapping.get("types", ["cp"]),
-            accept_universal=mapping.get("accept_universal", True),
+            types=get("types", ["cp"]),
+            accept_universal=get("accept_universal", True),
             filters=filters,
         )
 
 
-@dataclass
-class AbiConfig(MultiformatModelMixin):
+@dataclass(slots=True)
+class AbiConfig(
+    MultiformatModelMixin, mapping_fields={"filters": MappingFieldKind.OPT_MODEL}
+):
     """
     ABI configuration class, derived from `InterpreterConfig`.
 
@@ -296,33 +319,24 @@ class AbiConfig(MultiformatModelMixin):
     include_stable: bool = True  # abi3
     filters: Filter | None = None
 
-    # :: MechanicalOperation | type=serialization
-    # :: PermitUnused
-    def to_mapping(self) -> Mapping[str, Any]:
-        result: dict[str, Any] = {
-            "include_debug": self.include_debug,
-            "include_stable": self.include_stable,
-        }
-        if self.filters is not None:
-            result["filters"] = self.filters.to_mapping()
-        return result
-
     # :: MechanicalOperation | type=deserialization
     # :: PermitUnused
     @classmethod
     def from_mapping(cls, mapping: Mapping[str, Any], **_: Any) -> AbiConfig:
-        filters_data: Mapping[str, Any] | None = mapping.get("filters")
-        filters = Filter.from_mapping(filters_data) if filters_data else None
+        get = mapping.get
+        filters = _optional(mapping, "filters", Filter.from_mapping)
 
         return cls(
-            include_debug=mapping.get("include_debug", False),
-            include_stable=mapping.get("include_stable", True),
+            include_debug=get("include_debug", False),
+            include_stable=get("include_stable", True),
             filters=filters,
         )
 
 
-@dataclass
-class PlatformVariant(MultiformatModelMixin):
+@dataclass(slots=True)
+class PlatformVariant(
+    MultiformatModelMixin, mapping_fields={"version": MappingFieldKind.OPT_MODEL}
+):
     """
     Represents a platform variant such as manylinux or musllinux.
 
@@ -340,28 +354,23 @@ class PlatformVariant(MultiformatModelMixin):
     enabled: bool = True
     version: VersionSpec | None = None
 
-    # :: MechanicalOperation | type=serialization
-    # :: PermitUnused
-    def to_mapping(self) -> Mapping[str, Any]:
-        result: dict[str, Any] = {
-            "enabled": self.enabled,
-        }
-        if self.version is not None:
-            result["version"] = self.version.to_mapping()
-        return result
-
     # :: MechanicalOperation | type=deserialization
     # :: PermitUnused
     @classmethod
     def from_mapping(cls, mapping: Mapping[str, Any], **_: Any) -> PlatformVariant:
-        version_data: Mapping[str, Any] | None = mapping.get("version")
-        version = VersionSpec.from_mapping(version_data) if version_data else None
+        version = _optional(mapping, "version", VersionSpec.from_mapping)
 
         return cls(enabled=mapping.get("enabled", True), version=version)
 
 
-@dataclass
-class PlatformConfig(MultiformatModelMixin):
+@dataclass(slots=True)
+class PlatformConfig(
+    MultiformatModelMixin,
+    mapping_fields={
+        "variants": MappingFieldKind.OPT_MODEL_DICT,
+        "filters": MappingFieldKind.OPT_MODEL,
+    },
+):
     """
     Represents platform-specific configuration details.
 
@@ -388,42 +397,37 @@ class PlatformConfig(MultiformatModelMixin):
     )  # "manylinux", "musllinux", etc.
     filters: Filter | None = None
 
-    # :: MechanicalOperation | type=serialization
-    # :: PermitUnused
-    def to_mapping(self) -> Mapping[str, Any]:
-        result: dict[str, Any] = {
-            "enabled": self.enabled,
-            "arches": self.arches,
-            "variants": {
-                name: variant.to_mapping() for name, variant in self.variants.items()
-            },
-        }
-        if self.filters is not None:
-            result["filters"] = self.filters.to_mapping()
-        return result
-
     # :: MechanicalOperation | type=deserialization
     # :: PermitUnused
     @classmethod
     def from_mapping(cls, mapping: Mapping[str, Any], **_: Any) -> PlatformConfig:
-        filters_data: Mapping[str, Any] | None = mapping.get("filters")
-        filters = Filter.from_mapping(filters_data) if filters_data else None
-        variants_data = mapping.get("variants", {})
+        get = mapping.get
+        filters = _optional(mapping, "filters", Filter.from_mapping)
+        variants_data = get("variants", {})
         variants = {
             name: PlatformVariant.from_mapping(variant_data)
             for name, variant_data in variants_data.items()
         }
 
         return cls(
-            enabled=mapping.get("enabled", True),
-            arches=mapping.get("arches", []),
+            enabled=get("enabled", True),
+            arches=get("arches", []),
             variants=variants,
             filters=filters,
         )
 
 
-@dataclass
-class PlatformContext(MultiformatModelMixin):
+@dataclass(slots=True)
+class PlatformContext(
+    MultiformatModelMixin,
+    mapping_fields={
+        "interpreter": MappingFieldKind.OPT_MODEL,
+        "abi": MappingFieldKind.OPT_MODEL,
+        "platform": MappingFieldKind.OPT_MODEL,
+        "compatibility_tags": MappingFieldKind.OPT_MODEL,
+        "marker_env": MappingFieldKind.OPT_MODEL,
+    },
+):
     """
     Represents configuration for a specific platform or a universal context.
 
@@ -447,42 +451,17 @@ class PlatformContext(MultiformatModelMixin):
     compatibility_tags: Filter | None = None
     marker_env: MarkerEnvConfig | None = None
 
-    # :: MechanicalOperation | type=serialization
-    # :: PermitUnused
-    def to_mapping(self) -> Mapping[str, Any]:
-        result: dict[str, Any] = {}
-        if self.interpreter is not None:
-            result["interpreter"] = self.interpreter.to_mapping()
-        if self.abi is not None:
-            result["abi"] = self.abi.to_mapping()
-        if self.platform is not None:
-            result["platform"] = self.platform.to_mapping()
-        if self.compatibility_tags is not None:
-            result["compatibility_tags"] = self.compatibility_tags.to_mapping()
-        if self.marker_env is not None:
-            result["marker_env"] = self.marker_env.to_mapping()
-        return result
-
     # :: MechanicalOperation | type=deserialization
     # :: PermitUnused
     @classmethod
     def from_mapping(cls, mapping: Mapping[str, Any], **_: Any) -> PlatformContext:
-        interpreter_data: Mapping[str, Any] | None = mapping.get("interpreter")
-        interpreter = (
-            InterpreterConfig.from_mapping(interpreter_data)
-            if interpreter_data
-            else None
-        )
-        abi_data: Mapping[str, Any] | None = mapping.get("abi")
-        abi = AbiConfig.from_mapping(abi_data) if abi_data else None
-        platform_data: Mapping[str, Any] | None = mapping.get("platform")
-        platform = PlatformConfig.from_mapping(platform_data) if platform_data else None
-        tags_data: Mapping[str, Any] | None = mapping.get("compatibility_tags")
-        compatibility_tags = Filter.from_mapping(tags_data) if tags_data else None
-        marker_env_data: Mapping[str, Any] | None = mapping.get("marker_env")
-        marker_env = (
-            MarkerEnvConfig.from_mapping(marker_env_data) if marker_env_data else None
+        interpreter = _optional(mapping, "interpreter", InterpreterConfig.from_mapping)
+        abi = _optional(mapping, "abi", AbiConfig.from_mapping)
+        platform = _optional(mapping, "platform", PlatformConfig.from_mapping)
+        compatibility_tags = _optional(
+            mapping, "compatibility_tags", Filter.from_mapping
         )
+        marker_env = _optional(mapping, "marker_env", MarkerEnvConfig.from_mapping)
 
         return cls(
             interpreter=interpreter,
@@ -523,8 +502,18 @@ class PlatformOverrides(TypedDict, total=False):
     windows: PlatformContext
 
 
-@dataclass
-class ResolutionContext(MultiformatModelMixin):
+# Platform names accepted as platform_overrides keys
+_ALLOWED_PLATFORMS: frozenset[str] = frozenset(PlatformOverrides.__annotations__)
+
+
+@dataclass(slots=True)
+class ResolutionContext(
+    MultiformatModelMixin,
+    mapping_fields={
+        "universal": MappingFieldKind.MODEL,
+        "platform_overrides": MappingFieldKind.OPT_MODEL_DICT,
+    },
+):
     """Represents a resolution context with universal defaults and platform-specific overrides.
 
     This class provides a structured way to define resolution contexts, including
@@ -542,25 +531,7 @@ class ResolutionContext(MultiformatModelMixin):
 
     name: str
     universal: PlatformContext
-    platform_overrides: PlatformOverrides = field(
-        default_factory=lambda: cast(PlatformOverrides, cast(object, {}))
-    )
-
-    # :: MechanicalOperation | type=serialization
-    # :: PermitUnused
-    def to_mapping(self) -> Mapping[str, Any]:
-        out: dict[str, Any] = {
-            "name": self.name,
-            "universal": self.universal.to_mapping(),
-        }
-        if self.platform_overrides:
-            out.update(
-                platform_overrides={
-                    k: cast(PlatformContext, v).to_mapping()
-                    for k, v in self.platform_overrides.items()
-                }
-            )
-        return out
+    platform_overrides: PlatformOverrides = field(default_factory=PlatformOverrides)
 
     # :: MechanicalOperation | type=deserialization
     # :: PermitUnused
@@ -578,14 +549,17 @@ class ResolutionContext(MultiformatModelMixin):
                 raise ValueError(
                     f"platform_overrides.{platform_name} must be a mapping"
                 )
+            # Reject unknown platforms before building their PlatformContext;
+            # values are PlatformContext by construction, so no later pass is needed.
+            if platform_name not in _ALLOWED_PLATFORMS:
+                raise ValueError(
+                    f"Invalid platform overrides keys: {{{platform_name!r}}}"
+                )
             parsed[platform_name] = PlatformContext.from_mapping(value)
 
-        validate_typed_dict(
-            "platform overrides", parsed, PlatformOverrides, PlatformContext
-        )
-
         return cls(
             name=mapping["name"],
             universal=PlatformContext.from_mapping(mapping["universal"]),
-            platform_overrides=cast(PlatformOverrides, cast(object, parsed)),
+            # Keys were validated above, so parsed is a PlatformOverrides at runtime.
+            platform_overrides=parsed,  # type: ignore[arg-type]
         )
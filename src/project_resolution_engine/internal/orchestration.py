@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Generic, Sequence
 
 from project_resolution_engine.model.keys import ArtifactKeyType
@@ -17,6 +17,8 @@ from project_resolution_engine.strategies import (
     StrategyNotApplicable,
 )
 
+_log = logging.getLogger(__name__)
+
 
 @dataclass(frozen=True, slots=True)
 class StrategyChainArtifactResolver(
@@ -32,51 +34,62 @@ class StrategyChainArtifactResolver(
     """
 
     strategies: Sequence[BaseArtifactResolutionStrategy[ArtifactKeyType]]
-
-    def resolve(self, key: ArtifactKeyType, destination_uri: str) -> ArtifactRecord:
-        # :: FeatureStart | name=resolution_orchestration
-        causes: list[BaseException] = []
-
-        # Validate no mixing of imperative/non-imperative strategies
-        criticalities = {s.criticality for s in self.strategies}
-        if (
-            StrategyCriticality.IMPERATIVE in criticalities
-            and len(
-                criticalities
-                - {StrategyCriticality.IMPERATIVE, StrategyCriticality.DISABLED}
-            )
-            > 0
-        ):
-            # :: FeatureEnd | name=resolution_orchestration | outcome=invalid_strategy_config
+    # Non-disabled strategies in order; derived from `strategies` in __post_init__.
+    _active: tuple[BaseArtifactResolutionStrategy[ArtifactKeyType], ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Strategies are fixed for the resolver's lifetime, so validate the
+        # imperative/non-imperative mix and drop disabled strategies once here
+        # instead of on every resolve().
+        imperative = StrategyCriticality.IMPERATIVE
+        disabled = StrategyCriticality.DISABLED
+        saw_imperative = saw_non_imperative = False
+        active: list[BaseArtifactResolutionStrategy[ArtifactKeyType]] = []
+        for s in self.strategies:
+            criticality = s.criticality
+            if criticality is disabled:
+                _log.debug("strategy disabled: %s", s.name)
+                continue
+            if criticality is imperative:
+                saw_imperative = True
+            else:
+                saw_non_imperative = True
+            active.append(s)
+        if saw_imperative and saw_non_imperative:
             raise RuntimeError(
                 "All strategies must be imperative or all must be non-imperative, but not both"
             )
+        object.__setattr__(self, "_active", tuple(active))
 
-        for strategy in self.strategies:
-            if strategy.criticality is StrategyCriticality.DISABLED:
-                logging.debug(f"strategy disabled: {strategy.name} key={key!r}")
-                continue
+    def resolve(self, key: ArtifactKeyType, destination_uri: str) -> ArtifactRecord:
+        # :: FeatureStart | name=resolution_orchestration
+        causes: list[BaseException] = []
 
+        for strategy in self._active:
             try:
                 record: ArtifactRecord | None = strategy.resolve(
                     key=key, destination_uri=destination_uri
                 )
                 if record is None:
-                    logging.debug(
-                        f"strategy returned None: {strategy.name} key={key!r}"
-                    )
+                    _log.debug("strategy returned None: %s key=%r", strategy.name, key)
                     continue
                 # :: FeatureEnd | name=resolution_orchestration | outcome=success
                 return record
 
             except StrategyNotApplicable:
-                logging.debug(f"strategy not applicable: {strategy.name} key={key!r}")
+                _log.debug("strategy not applicable: %s key=%r", strategy.name, key)
                 continue
 
             except BaseException as e:
                 causes.append(e)
-                logging.debug(
-                    f"strategy failed: {strategy.name} key={key!r} err={type(e).__name__}: {e}"
+                _log.debug(
+                    "strategy failed: %s key=%r err=%s: %s",
+                    strategy.name,
+                    key,
+                    type(e).__name__,
+                    e,
                 )
                 continue
 
@@ -108,10 +121,10 @@ class ArtifactCoordinator(Generic[ArtifactKeyType]):
 
     Methods:
         resolve(key: ArtifactKeyType) -> ArtifactRecord:
-            Resolves an artifact identified by the given key. First, it attempts to
-            fetch the artifact from the repository cache. If the artifact is not
-            found, it uses the resolver to fetch the artifact and stores it in the
-            repository.
+            Resolves an artifact identified by the given key. A single
+            repository get_or_reserve() call either returns the cached record or
+            a destination URI; on a miss, the resolver fetches the artifact to
+            that destination and the record is stored in the repository.
     """
 
     repo: ArtifactRepository
@@ -119,13 +132,18 @@ class ArtifactCoordinator(Generic[ArtifactKeyType]):
 
     def resolve(self, key: ArtifactKeyType) -> ArtifactRecord:
         # :: FeatureStart | name=artifact_coordination
-        hit = self.repo.get(key)
-        if hit is not None:
+        hit_or_dest = self.repo.get_or_reserve(key)
+        if not isinstance(hit_or_dest, str):
             # :: FeatureEnd | name=artifact_coordination | outcome=cache_hit
-            return hit
-
-        dest_uri = self.repo.allocate_destination_uri(key)
-        record = self.resolver.resolve(key=key, destination_uri=dest_uri)
-        self.repo.put(record)
+            return hit_or_dest
+
+        try:
+            record = self.resolver.resolve(key=key, destination_uri=hit_or_dest)
+            self.repo.put(record)
+        finally:
+            # put() settles a reservation for record.key; release the reserved key too
+            # so waiters never block forever if resolving or storing failed, or if the
+            # record came back under a different key.
+            self.repo.release_reservation(key)
         # :: FeatureEnd | name=artifact_coordination | outcome=resolved_and_stored
         return record
@@ -7,6 +7,9 @@ from project_resolution_engine.repository import ArtifactRepository
 
 RepoFactory: TypeAlias = Callable[..., ArtifactRepository]
 
+# EphemeralArtifactRepository, cached by _create_ephemeral after its first (lazy) import
+_ephemeral_repository_cls: type[ArtifactRepository] | None = None
+
 
 # :: PermitUnused | reason=called during class initialization
 def _create_ephemeral(
@@ -25,18 +28,45 @@ def _create_ephemeral(
     Returns:
     ArtifactRepository: An instance of an ephemeral artifact repository.
     """
-    from project_resolution_engine.internal.builtin_repository import (
-        EphemeralArtifactRepository,
-    )
+    global _ephemeral_repository_cls
+    if _ephemeral_repository_cls is None:
+        from project_resolution_engine.internal.builtin_repository import (
+            EphemeralArtifactRepository,
+        )
+
+        _ephemeral_repository_cls = EphemeralArtifactRepository
 
     # Just create and return
-    return EphemeralArtifactRepository()
+    return _ephemeral_repository_cls()
 
 
 # The name of the default repository
 DEFAULT_REPOSITORY_ID = "ephemeral"
 
 # Dictionary of the name of the factory to its factory function
-BUILTIN_REPOSITORY_FACTORIES: dict[str, Callable[..., ArtifactRepository]] = {
+BUILTIN_REPOSITORY_FACTORIES: dict[str, RepoFactory] = {
     "ephemeral": _create_ephemeral,
 }
+
+# Factory for DEFAULT_REPOSITORY_ID, bound directly for the default path
+DEFAULT_FACTORY: RepoFactory = _create_ephemeral
+
+
+def get_builtin_factory(repo_id: str = DEFAULT_REPOSITORY_ID) -> RepoFactory:
+    """
+    Returns the builtin repository factory registered under the given id.
+
+    The default id resolves to DEFAULT_FACTORY without a dictionary lookup.
+
+    Parameters:
+    repo_id: Identifier of the builtin repository. Defaults to DEFAULT_REPOSITORY_ID.
+
+    Returns:
+    RepoFactory: The factory function for the repository.
+
+    Raises:
+    KeyError: If no builtin repository is registered under repo_id.
+    """
+    if repo_id == DEFAULT_REPOSITORY_ID:
+        return DEFAULT_FACTORY
+    return BUILTIN_REPOSITORY_FACTORIES[repo_id]
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
-from contextlib import contextmanager
-from dataclasses import dataclass
-from typing import Any, Iterator, Literal, Mapping
+from contextlib import AbstractContextManager
+from dataclasses import dataclass, field
+from typing import Any, Mapping
 
 from project_resolution_engine.internal.repositories.builtin import (
     DEFAULT_REPOSITORY_ID,
     RepoFactory,
 )
 from project_resolution_engine.internal.repositories.registry import (
+    RepositoryOrigin,
     RepositoryRegistry,
     RepositoryRegistryError,
     build_repository_registry,
@@ -46,7 +47,7 @@ class RepositorySelection:
     """
 
     repo_id: str
-    origin: Literal["builtin", "entrypoint"]
+    origin: RepositoryOrigin
     factory: RepoFactory
 
 
@@ -70,29 +71,63 @@ def _select_repository(
 
     Raises:
     RepositorySelectionError
-        If the provided or default repository ID does not exist in the merged registry.
+        If the provided or default repository ID is not registered.
     """
     rid = repo_id or DEFAULT_REPOSITORY_ID
 
-    merged = registry.merged()
-    if rid not in merged:
+    hit = registry.lookup(rid)
+    if hit is None:
         raise RepositorySelectionError(
-            f"unknown repository id {rid!r}. available={sorted(merged)}"
+            f"unknown repository id {rid!r}. available={sorted(registry.merged())}"
         )
 
-    origin: Literal["builtin", "entrypoint"] = (
-        "builtin" if rid in registry.builtins else "entrypoint"
-    )
-    return RepositorySelection(repo_id=rid, origin=origin, factory=merged[rid])
+    origin, factory = hit
+    return RepositorySelection(repo_id=rid, origin=origin, factory=factory)
+
+
+@dataclass(slots=True)
+class _RepositoryContext:
+    """
+    Context manager returned by open_repository().
+
+    A plain __enter__/__exit__ pair rather than a @contextmanager generator, so
+    entering and leaving the block does not go through generator resumption and
+    gen.throw() exception re-injection.
+    """
+
+    repo_id: str | None
+    config: Mapping[str, Any] | None
+    registry: RepositoryRegistry | None
+    _repo: ArtifactRepository | None = field(default=None, init=False, repr=False)
+
+    # :: PermitUnused | reason=implicit
+    def __enter__(self) -> ArtifactRepository:
+        registry = self.registry
+        if registry is None:
+            registry = build_repository_registry()
+
+        selection: RepositorySelection
+        try:
+            selection = _select_repository(repo_id=self.repo_id, registry=registry)
+        except RepositoryRegistryError as e:
+            raise RepositorySelectionError(str(e)) from e
+
+        self._repo = selection.factory(config=self.config)
+        return self._repo
+
+    # :: PermitUnused | reason=implicit
+    def __exit__(self, _exc_type, _exc, _tb) -> None:
+        repo, self._repo = self._repo, None
+        if repo is not None:
+            repo.close()
 
 
-@contextmanager
 def open_repository(
     *,
     repo_id: str | None,
     config: Mapping[str, Any] | None = None,
     registry: RepositoryRegistry | None = None,
-) -> Iterator[ArtifactRepository]:
+) -> AbstractContextManager[ArtifactRepository]:
     """
     Create exactly one repository instance for the run and manage its lifecycle.
 
@@ -100,19 +135,8 @@ def open_repository(
       - repo_id: None means "use the default"
       - config: passed to the selected RepoFactory (keyword arg `config`)
       - registry: test seam. If provided, enable_entrypoints is ignored.
-    """
-    if registry is None:
-        registry = build_repository_registry()
 
-    selection: RepositorySelection
-    try:
-        selection = _select_repository(repo_id=repo_id, registry=registry)
-    except RepositoryRegistryError as e:
-        raise RepositorySelectionError(str(e)) from e
-
-    repo: ArtifactRepository = selection.factory(config=config)
-
-    try:
-        yield repo
-    finally:
-        repo.close()
+    Selection and construction happen when the returned context is entered; the
+    repository is closed when the block exits, whether or not it raised.
+    """
+    return _RepositoryContext(repo_id=repo_id, config=config, registry=registry)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import inspect
-from dataclasses import dataclass
-from importlib.metadata import entry_points, EntryPoint
-from typing import Mapping
+import sys
+from dataclasses import dataclass, field
+from functools import cache, lru_cache
+from importlib.metadata import EntryPoint, EntryPoints, entry_points
+from typing import Any, Literal, Mapping
 
 from project_resolution_engine.internal.repositories.builtin import (
     BUILTIN_REPOSITORY_FACTORIES,
@@ -11,8 +13,11 @@ from project_resolution_engine.internal.repositories.builtin import (
 )
 from project_resolution_engine.repository import (
     REPOSITORY_ENTRYPOINT_GROUP,
+    ArtifactRepository,
 )
 
+RepositoryOrigin = Literal["builtin", "entrypoint"]
+
 
 class RepositoryRegistryError(RuntimeError):
     pass
@@ -33,8 +38,14 @@ class RepositoryRegistry:
 
     builtins: Mapping[str, RepoFactory]
     externals: Mapping[str, RepoFactory]
+    _merged: dict[str, RepoFactory] = field(init=False, repr=False, compare=False)
+    _by_id: dict[str, tuple[RepositoryOrigin, RepoFactory]] = field(
+        init=False, repr=False, compare=False
+    )
 
-    def merged(self) -> dict[str, RepoFactory]:
+    def __post_init__(self) -> None:
+        # Validate and merge once; the registry is frozen, so merged() can hand out
+        # the same dict for every repository selection.
         dupes: set[str] = set(self.builtins).intersection(self.externals)
         if dupes:
             raise RepositoryRegistryError(
@@ -42,7 +53,54 @@ class RepositoryRegistry:
             )
         merged: dict[str, RepoFactory] = dict(self.builtins)
         merged.update(self.externals)
-        return merged
+        by_id: dict[str, tuple[RepositoryOrigin, RepoFactory]] = {
+            rid: ("builtin", f) for rid, f in self.builtins.items()
+        }
+        by_id.update((rid, ("entrypoint", f)) for rid, f in self.externals.items())
+        object.__setattr__(self, "_merged", merged)
+        object.__setattr__(self, "_by_id", by_id)
+
+    def merged(self) -> dict[str, RepoFactory]:
+        """
+        Return all factories keyed by repository id.
+
+        The mapping is computed at construction and shared between calls; callers
+        must not mutate it.
+        """
+        return self._merged
+
+    def lookup(self, repo_id: str) -> tuple[RepositoryOrigin, RepoFactory] | None:
+        """
+        Return the (origin, factory) pair registered under repo_id, or None.
+
+        Entry point factories are imported and validated here, on first selection,
+        so a RepositoryEntrypointError surfaces from lookup() rather than discovery.
+        """
+        hit = self._by_id.get(repo_id)
+        if hit is not None and isinstance(hit[1], _LazyEntryPointFactory):
+            return hit[0], hit[1].load()
+        return hit
+
+
+def _has_keywordable_config(factory_obj: object) -> bool:
+    """
+    Cheaply check a plain Python function for a keywordable `config` parameter.
+
+    Reads the function's code object instead of building an inspect.Signature. Only
+    answers True for undecorated functions whose code object is authoritative; any
+    other callable (partials, callable instances, C functions, functions carrying
+    __wrapped__ or __signature__) gets False so the caller falls back to
+    inspect.signature().
+    """
+    if not inspect.isfunction(factory_obj):
+        return False
+    if hasattr(factory_obj, "__wrapped__") or hasattr(factory_obj, "__signature__"):
+        return False
+    code = factory_obj.__code__
+    keywordable = code.co_varnames[
+        code.co_posonlyargcount : code.co_argcount + code.co_kwonlyargcount
+    ]
+    return "config" in keywordable
 
 
 def _enforce_repo_factory_callable(repo_id: str, factory_obj: object) -> RepoFactory:
@@ -65,6 +123,9 @@ def _enforce_repo_factory_callable(repo_id: str, factory_obj: object) -> RepoFac
             f"repo entry point '{repo_id}' must load a callable factory; got class {factory_obj.__name__}"
         )
 
+    if _has_keywordable_config(factory_obj):
+        return factory_obj
+
     sig = inspect.signature(factory_obj)
     params = sig.parameters
 
@@ -85,6 +146,53 @@ def _enforce_repo_factory_callable(repo_id: str, factory_obj: object) -> RepoFac
     return factory_obj
 
 
+@dataclass(slots=True)
+class _LazyEntryPointFactory:
+    """
+    RepoFactory stand-in that defers importing an entry point until it is needed.
+
+    Discovery only records the entry point; the target module is imported and the
+    loaded object validated by _enforce_repo_factory_callable the first time the
+    factory is loaded or called. The validated factory is kept for later calls.
+    """
+
+    repo_id: str
+    entry_point: EntryPoint
+    _factory: RepoFactory | None = field(default=None, init=False, repr=False)
+
+    def load(self) -> RepoFactory:
+        if self._factory is None:
+            self._factory = _enforce_repo_factory_callable(
+                self.repo_id, self.entry_point.load()
+            )
+        return self._factory
+
+    def __call__(
+        self, *, config: Mapping[str, Any] | None = None
+    ) -> ArtifactRepository:
+        return self.load()(config=config)
+
+
+if sys.version_info >= (3, 12):
+    _InstalledEntryPoints = EntryPoints
+else:
+    # Before 3.12, entry_points() returns SelectableGroups; select(group=...) on it
+    # still yields EntryPoints.
+    from importlib.metadata import SelectableGroups as _InstalledEntryPoints
+
+
+@cache
+def _all_entry_points() -> _InstalledEntryPoints:
+    """
+    Return every installed entry point, scanning installed distributions only once.
+
+    entry_points() re-reads the metadata of every distribution on each call; the
+    result is fixed for the life of the process, so callers select their group
+    from this shared snapshot instead.
+    """
+    return entry_points()
+
+
 def _load_entrypoint_repo_factories(*, group: str) -> dict[str, RepoFactory]:
     """
     Discover repository factories from entry points.
@@ -92,22 +200,21 @@ def _load_entrypoint_repo_factories(*, group: str) -> dict[str, RepoFactory]:
     Determinism rules:
       - entry point name is the repo id
       - duplicate ids within the same group are an error
-      - loaded object must be a valid RepoFactory callable
+      - loaded object must be a valid RepoFactory callable (checked lazily, when the
+        factory is first selected or called, so unused plugins are never imported)
     """
     factories: dict[str, RepoFactory] = {}
     dupes: set[str] = set()
 
     ep: EntryPoint
-    for ep in entry_points().select(group=group):
+    for ep in _all_entry_points().select(group=group):
         repo_id = ep.name
-        factory_obj = ep.load()
-        factory = _enforce_repo_factory_callable(repo_id, factory_obj)
 
         if repo_id in factories:
             dupes.add(repo_id)
             continue
 
-        factories[repo_id] = factory
+        factories[repo_id] = _LazyEntryPointFactory(repo_id, ep)
 
     if dupes:
         raise RepositoryEntrypointError(
@@ -117,11 +224,17 @@ def _load_entrypoint_repo_factories(*, group: str) -> dict[str, RepoFactory]:
     return factories
 
 
+@lru_cache(maxsize=1)
 def build_repository_registry() -> RepositoryRegistry:
     """
     Build the repository registry for a run.
 
     This is intentionally the only place that knows about REPOSITORY_ENTRYPOINT_GROUP.
+
+    The registry is built once per process: entry point discovery scans every
+    installed distribution, and the set of installed factories does not change
+    while the process runs. Failures are not cached. Call
+    build_repository_registry.cache_clear() to force rediscovery (e.g. in tests).
     """
     externals: dict[str, RepoFactory] = _load_entrypoint_repo_factories(
         group=REPOSITORY_ENTRYPOINT_GROUP
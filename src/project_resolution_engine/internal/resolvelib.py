@@ -1,17 +1,34 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
-from collections.abc import Iterable, Iterator, Mapping, Sequence
+import operator
+import os
+import pickle
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, reduce
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable, Iterator, Mapping, Sequence
 from pathlib import Path
-from typing import cast
+from types import ModuleType
+from typing import Any, ClassVar, Generic, TypeVar, cast
 from urllib.parse import unquote, urlparse
 from urllib.request import url2pathname
 
+from packaging.markers import Marker
 from packaging.requirements import Requirement
 from packaging.specifiers import SpecifierSet
 from packaging.tags import Tag
-from packaging.utils import canonicalize_name, parse_wheel_filename, NormalizedName
+from packaging.utils import (
+    BuildTag,
+    canonicalize_name,
+    parse_wheel_filename,
+    NormalizedName,
+)
 from packaging.version import InvalidVersion, Version
 from resolvelib import AbstractProvider, Resolver
 from resolvelib.resolvers import Result
@@ -40,56 +57,217 @@ from project_resolution_engine.model.resolution import (
 )
 from project_resolution_engine.services import ResolutionServices
 
+_orjson: ModuleType | None
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    _orjson = None
+
+# canonicalize_name is a regex substitution; index files repeat the same few
+# distribution names, so memoize it for the per-file name checks.
+_canonicalize_name = lru_cache(maxsize=8192)(canonicalize_name)
+
+_log = logging.getLogger(__name__)
+
+# Shared empty incompatibility set for the common "nothing known to be bad" case.
+_NO_BAD: frozenset[tuple[str, str, str]] = frozenset()
+
+_ParsedWheelFilename = tuple[NormalizedName, Version, BuildTag, frozenset[Tag]]
+
+_K = TypeVar("_K", bound=Hashable)
+_V = TypeVar("_V")
+
+
+class _BoundedCache(Generic[_K, _V]):
+    """
+    Thread-safe least-recently-used mapping holding at most maxsize entries.
 
-def _expand_tags_for_context(
-    *, python_version: Version, context_tag: Tag
-) -> frozenset[Tag]:
+    Used for the metadata caches shared by every provider in the process, so that a
+    long-lived process touching many projects does not grow them without limit.
     """
-    Generates an expanded set of tags based on the provided Python version and context tag.
 
-    This function creates a set of platform and interpreter-specific tags
-    that are derived from a base context tag. The expanded tags ensure compatibility
-    with various Python interpreters, versions, and platforms while considering
-    universal pure-Python tags and CPython ABI fallbacks.
+    __slots__ = ("_maxsize", "_data", "_lock")
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._data: OrderedDict[_K, _V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: _K) -> _V | None:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: _K, value: _V) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
 
-    Arguments:
-        python_version (Version): The version of the Python interpreter in use.
-        context_tag (Tag): The base context-specific tag to expand.
+
+@lru_cache(maxsize=65536)
+def _parse_wheel_filename_cached(filename: str) -> _ParsedWheelFilename | str:
+    """
+    Parses a wheel filename once per process, memoizing failures as well.
+
+    Backtracking revisits the same index files many times, and parsing a wheel
+    filename (regex matching, name canonicalization, Version and tag construction)
+    is not cheap. Invalid filenames are cached as their ValueError so repeated
+    visits do not re-run the parser just to fail again. Only the error message is
+    kept, so callers raise a fresh exception each time instead of sharing one
+    instance (and its growing traceback) across threads.
+
+    Args:
+        filename (str): The wheel filename to parse.
 
     Returns:
-        frozenset[Tag]: A set of expanded tags derived from the provided
-        context tag and Python version.
+        _ParsedWheelFilename | str: The result of
+            packaging.utils.parse_wheel_filename, or the message of the ValueError
+            it raised.
+    """
+    try:
+        return parse_wheel_filename(filename)
+    except ValueError as exc:
+        return str(exc)
+
+
+def _load_json_bytes(path: Path) -> Any:
+    """
+    Decodes a JSON document from a file, using orjson when it is installed.
+
+    The raw bytes are handed to the decoder directly (both decoders detect the
+    encoding themselves) rather than decoding the whole document through a text
+    wrapper first. orjson is an optional accelerator for large index pages; the
+    stdlib decoder produces the same result without it.
+
+    Args:
+        path (Path): The JSON file to read.
+
+    Returns:
+        Any: The decoded JSON value.
+    """
+    data = path.read_bytes()
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def _read_pickled_pep691(path: Path) -> Pep691Metadata | None:
+    """
+    Reads a Pep691Metadata previously stored by _write_pickled_pep691.
+
+    The on-disk cache is an optimization only: a missing, unreadable, corrupt or
+    foreign entry yields None so the caller parses the index JSON instead.
+    """
+    try:
+        with path.open("rb") as fh:
+            obj = pickle.load(fh)
+    except Exception:
+        return None
+    return obj if isinstance(obj, Pep691Metadata) else None
+
+
+def _write_pickled_pep691(path: Path, pep691: Pep691Metadata) -> None:
+    """
+    Best-effort atomic write of a parsed index page to the on-disk cache.
+
+    The entry is written to a temporary file in the same directory and moved into
+    place with os.replace, so concurrent readers never see a partial file. Errors
+    are swallowed; a failed write only means the next run parses the JSON again.
+    """
+    tmp: str | None = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as fh:
+            pickle.dump(pep691, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except (OSError, pickle.PicklingError):
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+
+@lru_cache(maxsize=1024)
+def _marker_uses_extra(marker: Marker) -> bool:
+    """
+    Report whether a marker may depend on the "extra" variable, memoized per marker.
+
+    A textual check is enough: a marker that references extra must spell the variable
+    name. A false positive (e.g. "extra" inside a quoted value) only costs the
+    per-extra evaluation the caller would have done anyway.
+    """
+    return "extra" in str(marker)
+
+
+@lru_cache(maxsize=1024)
+def _merged_specifier_set(specs: frozenset[SpecifierSet]) -> SpecifierSet:
+    """
+    Intersect a set of already-parsed SpecifierSets into one, memoized.
+
+    The resolver revisits the same requirement combinations while backtracking; a
+    SpecifierSet is order-insensitive, so the set of specifier sets is a complete
+    key. Merging with & unions the parsed Specifier objects directly instead of
+    re-tokenizing their string forms.
+    """
+    return reduce(operator.and_, specs)
+
+
+@lru_cache(maxsize=32768)
+def _specifier_contains(spec: SpecifierSet, version: Version) -> bool:
+    """
+    Return whether a SpecifierSet admits a version, memoized.
+
+    Backtracking asks the same (merged specifier, candidate version) questions over
+    and over; _merged_specifier_set hands out shared SpecifierSet objects, so the
+    pair is a cheap, stable key.
+    """
+    return spec.contains(version)
+
+
+@lru_cache(maxsize=32768)
+def _requires_python_allows(requires_python: str, py_version: str) -> bool:
+    """
+    Return whether a file's Requires-Python admits the target Python, memoized.
+
+    Index files repeat a handful of Requires-Python strings across hundreds of
+    files, so each distinct (requires_python, py_version) pair is parsed and
+    evaluated once. Unparseable values do not exclude the file.
+    """
+    try:
+        return SpecifierSet(requires_python).contains(py_version)
+    except Exception:
+        return True
+
+
+@lru_cache(maxsize=4096)
+def _tag_str(tag: Tag) -> str:
     """
-    major = python_version.major
-    minor = python_version.minor
-    plat = context_tag.platform
-
-    py_maj = f"py{major}"
-    py_maj_min = f"py{major}{minor}"
-
-    # universal pure-Python
-    tags = {
-        Tag(py_maj, "none", "any"),
-        Tag(py_maj_min, "none", "any"),
-        Tag(py_maj, "none", plat),
-        Tag(py_maj_min, "none", plat),
-        context_tag,
-    }
-
-    # CPython-ish ABI fallbacks when the seed is cpXY-...
-    if (
-        context_tag.interpreter.startswith("cp")
-        and context_tag.interpreter[2:].isdigit()
-    ):
-        cp = context_tag.interpreter  # e.g. "cp311"
-        tags |= {
-            Tag(cp, "abi3", plat),
-            Tag(cp, "none", plat),
-        }
-
-    return frozenset(tags)
+    Return the string form of a wheel tag, memoized.
+
+    Index files for one project share a small set of tags, so formatting each
+    distinct Tag once avoids a str() call per tag per file on every find_matches.
+    """
+    return str(tag)
 
 
+@lru_cache(maxsize=1024)
 def _safe_url_basename(url: str) -> str:
     """
     Extracts the basename from a URL path, ensuring it is safe for use.
@@ -106,6 +284,9 @@ def _safe_url_basename(url: str) -> str:
 
     Raises:
         ValueError: If the URL has no valid path basename.
+
+    Results are memoized per URL; direct URI requirements are re-examined on every
+    find_matches call for their project.
     """
     parsed = urlparse(url)
     base = Path(unquote(parsed.path)).name
@@ -174,6 +355,7 @@ def _env_python_version(env: ResolutionEnv) -> Version:
         return Version("0")
 
 
+@lru_cache(maxsize=4096)
 def _version_sort_key(v: str) -> tuple[int, Version | str]:
     """
     Generates a sorting key for version strings.
@@ -193,6 +375,9 @@ def _version_sort_key(v: str) -> tuple[int, Version | str]:
     Raises:
         InvalidVersion: Raised internally if the version string cannot be parsed
         as a valid version, resulting in a fallback tuple.
+
+    Keys are memoized: the same version strings are re-sorted on every find_matches
+    call for a project, and Version parsing is regex-based.
     """
     try:
         return 1, Version(v)
@@ -200,6 +385,25 @@ def _version_sort_key(v: str) -> tuple[int, Version | str]:
         return 0, v
 
 
+@dataclass(frozen=True, slots=True)
+class _ParsedFile:
+    """
+    A project's wheel file from an index page, with the filename parsed once.
+
+    Everything here depends only on the file itself, so one table per index page
+    is shared by every provider, environment and backtracking step; only the
+    environment-specific checks (yanked policy, Requires-Python, tag choice) are
+    left to do per provider.
+    """
+
+    file: Pep691FileMetadata
+    dist: NormalizedName
+    version: Version
+    version_str: str
+    tag_strs: frozenset[str]
+    hash_spec: tuple[str, str] | None
+
+
 class ProjectResolutionProvider(
     AbstractProvider[ResolverRequirement, ResolverCandidate, str]
 ):
@@ -217,14 +421,59 @@ class ProjectResolutionProvider(
             dependency resolution process.
         env (ResolutionEnv): The environment configuration used for dependency resolution.
         index_base (str): The base URL for the package index utilized during resolution.
+        pep691_cache_dir (Path | None): Optional directory for parsed PEP 691 index
+            pages, so later processes can skip JSON parsing. Entries are pickles; only
+            point this at a directory you trust.
+        prefetch_workers (int): Number of threads used to load index pages for a
+            batch of newly seen projects concurrently; 0 disables prefetching.
     """
 
+    # Parsed index and core metadata are shared by every provider in the process, so
+    # repeated resolutions against the same index parse each document only once.
+    # Entries never expire: a long-lived process keeps serving the index pages it
+    # first saw (missing newer releases) until clear_caches() runs, which
+    # ProjectResolutionEngine.clear_caches() exposes. Each cache is bounded and
+    # evicts its least recently used entries.
+    # Index entries are keyed by (index_base, project) to keep indexes apart; core
+    # metadata is keyed by the wheel's origin URI, which already pins the index.
+    # Prefetch threads and environments resolving concurrently share these caches.
+    # Index pages are loaded at most once per key: _index_lock guards _index_loads,
+    # which holds a future for every page being loaded, and later callers for the
+    # same page wait on it instead of loading it again. Core metadata and parsed
+    # file lists are cheap to rebuild, so a race on those only repeats the work.
+    _index_cache: ClassVar[_BoundedCache[tuple[str, str], Pep691Metadata]] = (
+        _BoundedCache(2048)
+    )
+    _index_loads: ClassVar[dict[tuple[str, str], Future[Pep691Metadata]]] = {}
+    _index_lock: ClassVar[threading.Lock] = threading.Lock()
+    _core_metadata_cache: ClassVar[_BoundedCache[str, Pep658Metadata]] = _BoundedCache(
+        16384
+    )
+    _parsed_files_cache: ClassVar[
+        _BoundedCache[tuple[str, str], tuple[Pep691Metadata, tuple[_ParsedFile, ...]]]
+    ] = _BoundedCache(2048)
+
+    @classmethod
+    def clear_caches(cls) -> None:
+        """
+        Drops the process-wide index and core metadata caches, so that later
+        resolutions re-read metadata from the artifact services.
+        """
+        cls._index_cache.clear()
+        cls._core_metadata_cache.clear()
+        cls._parsed_files_cache.clear()
+        _parse_wheel_filename_cached.cache_clear()
+        _specifier_contains.cache_clear()
+        _requires_python_allows.cache_clear()
+
     def __init__(
         self,
         *,
         services: ResolutionServices,
         env: ResolutionEnv,
         index_base: str = "https://pypi.org/simple",
+        pep691_cache_dir: str | os.PathLike[str] | None = None,
+        prefetch_workers: int = 0,
     ) -> None:
         """
         Initializes the class with the provided resolution services, environment, and optional
@@ -235,13 +484,35 @@ class ProjectResolutionProvider(
                 resolution process.
             env (ResolutionEnv): The environment configuration for dependency resolution.
             index_base (str): The base URL for the index used during dependency resolution.
+            pep691_cache_dir (str | os.PathLike[str] | None): Directory for the on-disk
+                parsed index cache, or None (the default) to keep it in memory only.
+            prefetch_workers (int): Threads used by prefetch_indexes; 0 (the default)
+                disables prefetching.
         """
         self._services = services
         self._env = env
         self._index_base = index_base
+        self._pep691_cache_dir: Path | None = (
+            None if pep691_cache_dir is None else Path(pep691_cache_dir)
+        )
+        self._prefetch_workers = prefetch_workers
         self._policy = env.policy
-        self._index_cache: dict[str, Pep691Metadata] = {}
-        self._core_metadata_cache: dict[tuple[str, str, str, str], Pep658Metadata] = {}
+        # The env is fixed for the provider's lifetime; parse its Python version once.
+        self._py_version: Version = _env_python_version(env)
+        self._py_version_str: str = str(self._py_version)
+        # Resolve the preferred tag order once (falling back to the possibly unordered
+        # supported_tags), then rank each tag (first occurrence wins) so _best_tag
+        # only has to look at the handful of tags a wheel file carries.
+        self._ordered_tags: tuple[str, ...] = tuple(
+            getattr(env, "supported_tags_ordered", None) or env.supported_tags
+        )
+        self._tag_rank: dict[str, int] = {}
+        for rank, tag in enumerate(self._ordered_tags):
+            self._tag_rank.setdefault(tag, rank)
+        self._index_wheels_cache: dict[
+            tuple[str, str],
+            tuple[Pep691Metadata, list[tuple[Version, ResolverCandidate]]],
+        ] = {}
         self._requested_extras_by_name: dict[str, frozenset[str]] = {}
 
     # :: FrameworkCallback | contract=AbstractProvider
@@ -321,7 +592,7 @@ class ProjectResolutionProvider(
             An iterable of ResolverCandidate objects that fulfill the specified requirements
             and are compatible based on the provided incompatibilities.
         """
-        name = canonicalize_name(identifier)
+        name = _canonicalize_name(identifier)
 
         req_list = self._materialize_requirements(requirements, name)
         self._update_requested_extras(name, req_list)
@@ -337,13 +608,12 @@ class ProjectResolutionProvider(
         combined_spec = self._combined_spec(req_list)
 
         pep691 = self._load_pep691(name)
-        py_version = _env_python_version(self._env)
 
         named_candidates = self._build_index_candidates(
             name=name,
             pep691=pep691,
             combined_spec=combined_spec,
-            py_version=str(py_version),
+            py_version=self._py_version_str,
             bad=bad,
         )
 
@@ -408,7 +678,7 @@ class ProjectResolutionProvider(
     @staticmethod
     def _compute_bad_set(
         name: str, incompatibilities: Mapping[str, Iterator[ResolverCandidate]]
-    ) -> set[tuple[str, str, str]]:
+    ) -> frozenset[tuple[str, str, str]]:
         """
         Computes a set of incompatible candidate details for a specific package name.
 
@@ -423,21 +693,23 @@ class ProjectResolutionProvider(
             incompatibilities.
 
         Returns:
-        set[tuple[str, str, str]]: A set of tuples, where each tuple consists of
+        frozenset[tuple[str, str, str]]: A set of tuples, where each tuple consists of
             the candidate name, version, and tag for an incompatible candidate. If
             no incompatibilities are found for the specified name, returns an
             empty set.
         """
-        return {
-            (c.name, c.wheel_key.version, c.wheel_key.tag)
-            for c in incompatibilities.get(name, iter(()))
-        }
+        incompatible = incompatibilities.get(name)
+        if incompatible is None:
+            return _NO_BAD
+        return frozenset(
+            (c.name, c.wheel_key.version, c.wheel_key.tag) for c in incompatible
+        )
 
     def _build_uri_candidates(
         self,
         name: str,
         req_list: Sequence[ResolverRequirement],
-        bad: set[tuple[str, str, str]],
+        bad: frozenset[tuple[str, str, str]],
     ) -> list[ResolverCandidate] | None:
         """
         Constructs a list of potential resolver candidates based on URI-based requirements.
@@ -478,7 +750,11 @@ class ProjectResolutionProvider(
         return candidates
 
     def _candidate_from_uri_req(
-        self, *, name: str, req: ResolverRequirement, bad: set[tuple[str, str, str]]
+        self,
+        *,
+        name: str,
+        req: ResolverRequirement,
+        bad: frozenset[tuple[str, str, str]],
     ) -> ResolverCandidate | None:
         """
         Processes a direct URI requirement to generate a resolver candidate if the
@@ -499,16 +775,16 @@ class ProjectResolutionProvider(
 
         try:
             filename = _safe_url_basename(req.uri)
-            dist, ver, _build, tags = parse_wheel_filename(filename)
+            dist, ver, _build, tags = self._parse_wheel_filename(filename)
         except Exception:
             raise ValueError(
                 f"Direct URI requirement does not look like a wheel file for {name!r}: {req.uri!r}"
             )
 
-        if canonicalize_name(dist) != name:
+        if _canonicalize_name(dist) != name:
             return None
 
-        file_tag_set = {str(t) for t in tags}
+        file_tag_set = frozenset(_tag_str(t) for t in tags)
         best_tag = self._best_tag(file_tag_set)
         if best_tag is None:
             return None
@@ -518,7 +794,7 @@ class ProjectResolutionProvider(
             version=str(ver),
             tag=best_tag,
             requires_python=None,
-            satisfied_tags=frozenset(file_tag_set),
+            satisfied_tags=file_tag_set,
             origin_uri=req.uri,
         )
 
@@ -527,7 +803,7 @@ class ProjectResolutionProvider(
             return None
 
         req_version: SpecifierSet | None = req.version
-        if req_version is not None and not req_version.contains(wk.version):
+        if req_version is not None and not _specifier_contains(req_version, ver):
             return None
 
         return ResolverCandidate(wheel_key=wk)
@@ -551,16 +827,12 @@ class ProjectResolutionProvider(
             SpecifierSet | None: A combined SpecifierSet representing all version
                 constraints, or None if no version constraints are provided.
         """
-        combined_spec: SpecifierSet | None = None
-        for r in req_list:
-            if r.version is None:
-                continue
-            combined_spec = (
-                r.version
-                if combined_spec is None
-                else SpecifierSet(f"{combined_spec},{r.version}")
-            )
-        return combined_spec
+        specs = [r.version for r in req_list if r.version is not None]
+        if not specs:
+            return None
+        if len(specs) == 1:
+            return specs[0]
+        return _merged_specifier_set(frozenset(specs))
 
     def _load_pep691(self, name: str) -> Pep691Metadata:
         """
@@ -574,19 +846,136 @@ class ProjectResolutionProvider(
         Returns:
             Pep691Metadata: The metadata information for the specified project name.
         """
-        pep691 = self._index_cache.get(name)
+        cache_key = (self._index_base, name)
+        pep691 = self._index_cache.get(cache_key)
         if pep691 is not None:
             return pep691
 
+        with self._index_lock:
+            pep691 = self._index_cache.get(cache_key)
+            if pep691 is not None:
+                return pep691
+            in_flight = self._index_loads.get(cache_key)
+            if in_flight is None:
+                loading: Future[Pep691Metadata] = Future()
+                self._index_loads[cache_key] = loading
+        if in_flight is not None:
+            return in_flight.result()
+
+        try:
+            pep691 = self._read_pep691(name)
+        except BaseException as exc:
+            with self._index_lock:
+                del self._index_loads[cache_key]
+            loading.set_exception(exc)
+            raise
+
+        with self._index_lock:
+            self._index_cache[cache_key] = pep691
+            del self._index_loads[cache_key]
+        loading.set_result(pep691)
+        return pep691
+
+    def _read_pep691(self, name: str) -> Pep691Metadata:
+        """
+        Resolves the index page of a project through the index metadata service and
+        parses it, going through the on-disk parsed index cache when one is configured.
+
+        Args:
+            name (str): The name of the project whose index page is read.
+
+        Returns:
+            Pep691Metadata: The parsed index page.
+        """
         idx_key = IndexMetadataKey(project=name, index_base=self._index_base)
         idx_record = self._services.index_metadata.resolve(idx_key)
         idx_path = path_from_file_uri(idx_record.destination_uri)
 
-        payload = json.loads(idx_path.read_text(encoding="utf-8"))
-        pep691 = Pep691Metadata.from_mapping(payload)
-        self._index_cache[name] = pep691
+        pep691: Pep691Metadata | None = None
+        disk_path = self._pep691_disk_path(name, idx_record, idx_path)
+        if disk_path is not None:
+            pep691 = _read_pickled_pep691(disk_path)
+
+        if pep691 is None:
+            pep691 = Pep691Metadata.from_mapping(_load_json_bytes(idx_path))
+            if disk_path is not None:
+                _write_pickled_pep691(disk_path, pep691)
         return pep691
 
+    def prefetch_indexes(self, names: Iterable[str]) -> None:
+        """
+        Loads the index pages of several projects concurrently.
+
+        Index pages are fetched through the index metadata service (usually network
+        I/O), so loading a batch of projects on a thread pool overlaps those fetches
+        instead of paying for them one find_matches call at a time. Pages already in
+        the index cache are skipped. This is best-effort: a page that fails to load
+        here is simply loaded (and its error raised) by find_matches later.
+
+        Args:
+            names (Iterable[str]): Project names (canonicalized here) to prefetch.
+
+        Returns:
+            None
+        """
+        if self._prefetch_workers < 1:
+            return
+
+        pending = sorted(
+            {
+                name
+                for name in map(_canonicalize_name, names)
+                if (self._index_base, name) not in self._index_cache
+            }
+        )
+        # A single page gains nothing from a pool; find_matches will load it.
+        if len(pending) < 2:
+            return
+
+        workers = min(len(pending), self._prefetch_workers)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(self._load_pep691, name) for name in pending]
+        for name, future in zip(pending, futures):
+            exc = future.exception()
+            if exc is not None:
+                _log.debug("Prefetching the index page for %s failed: %r", name, exc)
+
+    def _pep691_disk_path(
+        self, name: str, idx_record: Any, idx_path: Path
+    ) -> Path | None:
+        """
+        Computes the on-disk cache entry for a project's parsed index page.
+
+        The entry name hashes the index base, the project and a validator for the
+        index file: the record's content_sha256 when the repository provides one,
+        otherwise the file's size and modification time. A changed index document
+        therefore maps to a new entry instead of a stale one.
+
+        Args:
+            name (str): The canonical project name.
+            idx_record: The ArtifactRecord for the project's index metadata.
+            idx_path (Path): Local path of the index metadata file.
+
+        Returns:
+            Path | None: The cache file to use, or None when the on-disk cache is
+                disabled or the index file cannot be stat'ed.
+        """
+        if self._pep691_cache_dir is None:
+            return None
+
+        validator = getattr(idx_record, "content_sha256", None)
+        if not validator:
+            try:
+                st = idx_path.stat()
+            except OSError:
+                return None
+            validator = f"{st.st_size}:{st.st_mtime_ns}"
+
+        digest = hashlib.sha256(
+            f"{self._index_base}|{name}|{validator}".encode("utf-8")
+        ).hexdigest()
+        return self._pep691_cache_dir / f"{digest}.pickle"
+
     def _build_index_candidates(
         self,
         *,
@@ -594,7 +983,7 @@ class ProjectResolutionProvider(
         pep691: Pep691Metadata,
         combined_spec: SpecifierSet | None,
         py_version: str,
-        bad: set[tuple[str, str, str]],
+        bad: frozenset[tuple[str, str, str]],
     ) -> list[ResolverCandidate]:
         """
         Builds a list of resolver candidates from the given index data.
@@ -612,26 +1001,81 @@ class ProjectResolutionProvider(
             to filter files based on their compatibility. If None, no filtering is applied.
         py_version (str): The Python version string to evaluate the compatibility of
             candidates.
-        bad (set[tuple[str, str, str]]): A set of tuples representing combinations of
+        bad (frozenset[tuple[str, str, str]]): A set of tuples representing combinations of
             package versions and Python versions that should be excluded.
 
         Returns:
         list[ResolverCandidate]: A list of resolver candidates created from the index
             data that meet the specified conditions.
         """
+        wheels = self._index_wheel_candidates(
+            name=name, pep691=pep691, py_version=py_version
+        )
+        # Most calls have no known incompatibilities for the project; skip building
+        # a (name, version, tag) tuple per candidate just to probe an empty set.
+        if not bad:
+            if combined_spec is None:
+                return [c for _ver, c in wheels]
+            return [c for ver, c in wheels if _specifier_contains(combined_spec, ver)]
+
         candidates: list[ResolverCandidate] = []
-        for f in pep691.files:
-            c = self._candidate_from_index_file(
-                name=name,
-                f=f,
-                combined_spec=combined_spec,
-                py_version=py_version,
-                bad=bad,
-            )
-            if c is not None:
-                candidates.append(c)
+        for ver, c in wheels:
+            if combined_spec is not None and not _specifier_contains(
+                combined_spec, ver
+            ):
+                continue
+            if (c.name, c.wheel_key.version, c.wheel_key.tag) in bad:
+                continue
+            candidates.append(c)
         return candidates
 
+    def _index_wheel_candidates(
+        self, *, name: str, pep691: Pep691Metadata, py_version: str
+    ) -> list[tuple[Version, ResolverCandidate]]:
+        """
+        Returns every usable wheel of a project's index page as a candidate, computed
+        once per (project, Python version) and reused across backtracking.
+
+        Everything _candidate_from_index_file checks apart from the requirement's
+        version specifiers and the incompatibility set depends only on the file, the
+        provider's environment and the Python version. Those checks are done once here,
+        over the shared pre-parsed table from _parsed_index_files, so each find_matches
+        only filters this (usually much shorter) list. The parsed Version is kept next
+        to each candidate for the specifier check.
+
+        Parameters:
+        name : str
+            The canonical project name.
+        pep691 : Pep691Metadata
+            The project's index metadata. A different object than the one the cached
+            list was built from invalidates the entry.
+        py_version : str
+            The Python version string used for requires_python checks.
+
+        Returns:
+        list[tuple[Version, ResolverCandidate]]
+            The parsed version and candidate for each accepted wheel file.
+        """
+        cache_key = (name, py_version)
+        cached = self._index_wheels_cache.get(cache_key)
+        if cached is not None and cached[0] is pep691:
+            return cached[1]
+
+        wheels: list[tuple[Version, ResolverCandidate]] = []
+        for parsed in self._parsed_index_files(name, pep691):
+            if not self._is_non_yanked_wheel_file(parsed.file):
+                continue
+            result = self._accept_parsed_wheel(
+                parsed, name=name, combined_spec=None, py_version=py_version
+            )
+            if result is not None:
+                wheels.append(
+                    (parsed.version, self._index_candidate(name, parsed.file, result))
+                )
+
+        self._index_wheels_cache[cache_key] = (pep691, wheels)
+        return wheels
+
     @staticmethod
     def _matches_tag(
         f: Pep691FileMetadata,
@@ -661,21 +1105,16 @@ class ProjectResolutionProvider(
             A boolean value indicating whether all criteria are satisfied and the provided
             information matches the defined specifications.
         """
-        if canonicalize_name(dist) != name:
+        if _canonicalize_name(dist) != name:
             return False
 
-        combined_spec_contains_ver: bool = (
-            combined_spec.contains(str(ver)) if combined_spec is not None else True
-        )
-        if not combined_spec_contains_ver:
+        if combined_spec is not None and not _specifier_contains(combined_spec, ver):
             return False
 
-        if f.requires_python:
-            try:
-                if not SpecifierSet(f.requires_python).contains(py_version):
-                    return False
-            except Exception:
-                pass
+        if f.requires_python and not _requires_python_allows(
+            f.requires_python, py_version
+        ):
+            return False
 
         return True
 
@@ -731,25 +1170,131 @@ class ProjectResolutionProvider(
             # :: FeatureEnd | name=index_wheel_candidate_filtering | outcome=rejected_by_yanked_wheel_policy
             return None
 
+        parsed = self._parse_index_file(f, name)
+        if parsed is None:
+            return None
+
+        return self._accept_parsed_wheel(
+            parsed, name=name, combined_spec=combined_spec, py_version=py_version
+        )
+
+    @staticmethod
+    def _parse_index_file(f: Pep691FileMetadata, name: str) -> _ParsedFile | None:
+        """
+        Parses the environment-independent parts of an index file entry.
+
+        Parameters:
+        f : Pep691FileMetadata
+            The index file entry.
+        name : str
+            The canonical project name the file must belong to.
+
+        Returns:
+        _ParsedFile | None
+            The parsed wheel, or None for files that are not wheels of this project
+            or whose filename is not a valid wheel filename.
+        """
+        filename: str = f.filename
+        if not filename.lower().endswith(".whl"):
+            return None
+
+        # Wheel filenames start with the distribution name, so files for another
+        # project are rejected here without paying for a full filename parse.
+        # :: FeatureBranch | name=index_wheel_candidate_filtering | branch=wheel_other_project | control_polarity=true
+        if _canonicalize_name(filename.partition("-")[0]) != name:
+            # :: FeatureEnd | name=index_wheel_candidate_filtering | outcome=rejected_by_project_name
+            return None
+
         try:
-            dist, ver, _build, tags = parse_wheel_filename(f.filename)
+            dist, ver, _build, tags = ProjectResolutionProvider._parse_wheel_filename(
+                filename
+            )
         except Exception:
             # :: FeatureEnd | name=index_wheel_candidate_filtering | outcome=invalid_wheel_filename
             return None
 
+        return _ParsedFile(
+            file=f,
+            dist=dist,
+            version=ver,
+            version_str=str(ver),
+            tag_strs=frozenset(_tag_str(t) for t in tags),
+            hash_spec=ProjectResolutionProvider._best_hash(f),
+        )
+
+    def _parsed_index_files(
+        self, name: str, pep691: Pep691Metadata
+    ) -> tuple[_ParsedFile, ...]:
+        """
+        Returns the pre-parsed wheel table for a project's index page.
+
+        The table is built once per index page and shared by all providers through
+        a class-level cache, like the index page itself. Files that are not wheels
+        of this project are dropped while building it.
+
+        Parameters:
+        name : str
+            The canonical project name.
+        pep691 : Pep691Metadata
+            The project's index metadata. A different object than the one the cached
+            table was built from invalidates the entry.
+
+        Returns:
+        tuple[_ParsedFile, ...]
+            The parsed wheel files, in index order.
+        """
+        cache_key = (self._index_base, name)
+        cached = self._parsed_files_cache.get(cache_key)
+        if cached is not None and cached[0] is pep691:
+            return cached[1]
+
+        table = tuple(
+            parsed
+            for f in pep691.files
+            if (parsed := self._parse_index_file(f, name)) is not None
+        )
+        self._parsed_files_cache[cache_key] = (pep691, table)
+        return table
+
+    def _accept_parsed_wheel(
+        self,
+        parsed: _ParsedFile,
+        *,
+        name: str,
+        combined_spec: SpecifierSet | None,
+        py_version: str,
+    ) -> tuple[str, str, frozenset[str], tuple[str, str]] | None:
+        """
+        Applies the environment-specific checks to a pre-parsed wheel.
+
+        Parameters:
+        parsed : _ParsedFile
+            The pre-parsed wheel file.
+        name : str
+            The canonical project name.
+        combined_spec : SpecifierSet | None
+            Version constraints to apply, or None to skip them.
+        py_version : str
+            The targeted Python version for the requires_python check.
+
+        Returns:
+        tuple[str, str, frozenset[str], tuple[str, str]] | None
+            The wheel version, best matching tag, applicable tags and best hash spec,
+            or None if the wheel is not usable in this environment.
+        """
+        f = parsed.file
         # :: FeatureBranch | name=index_wheel_candidate_filtering | branch=wheel_rejected | control_polarity=true
-        if not self._matches_tag(f, name, combined_spec, py_version, dist, ver):
+        if not self._matches_tag(
+            f, name, combined_spec, py_version, parsed.dist, parsed.version
+        ):
             # :: FeatureEnd | name=index_wheel_candidate_filtering | outcome=rejected_by_tag_compatibility
             return None
 
-        # TODO: Need to figure out how to get the context tag!
-        expanded_tags = _expand_tags_for_context(
-            python_version=Version(py_version),
-            context_tag=Tag(py_version, "none", "any"),
-        )
-        file_tag_set = {str(t) for t in tags}
-        best_tag = self._best_tag(file_tag_set)
-        hash_spec = self._best_hash(f)
+        # TODO: Need to figure out how to get the context tag! Wheels should also be
+        # matched against the tags implied by the environment's context tag (pyXY and
+        # cpXY-abi3 fallbacks), which is not implemented yet.
+        best_tag = self._best_tag(parsed.tag_strs)
+        hash_spec = parsed.hash_spec
 
         # :: FeatureBranch | name=index_wheel_candidate_filtering | branch=wheel_no_tag_or_spec | control_polarity=true
         if best_tag is None or hash_spec is None:
@@ -757,7 +1302,7 @@ class ProjectResolutionProvider(
             return None
 
         # :: FeatureEnd | name=index_wheel_candidate_filtering | outcome=accepted
-        return str(ver), best_tag, frozenset(file_tag_set), hash_spec
+        return parsed.version_str, best_tag, parsed.tag_strs, hash_spec
 
     def _candidate_from_index_file(
         self,
@@ -766,7 +1311,7 @@ class ProjectResolutionProvider(
         f: Pep691FileMetadata,
         combined_spec: SpecifierSet | None,
         py_version: str,
-        bad: set[tuple[str, str, str]],
+        bad: frozenset[tuple[str, str, str]],
     ) -> ResolverCandidate | None:
         """
         Generates a resolver candidate from metadata in the provided index file.
@@ -788,7 +1333,7 @@ class ProjectResolutionProvider(
             required constraints. If None, version checks are skipped.
         py_version : str
             The version of Python used to determine compatibility with the wheel.
-        bad : set[tuple[str, str, str]]
+        bad : frozenset[tuple[str, str, str]]
             A collection of tuples identifying "bad" candidates by their name, version,
             and tags. These candidates are excluded from resolution.
 
@@ -809,33 +1354,58 @@ class ProjectResolutionProvider(
         if result is None:
             return None
 
-        ver_str, best_tag, file_tag_set, hash_spec = result
-        alg, h = hash_spec
+        if (name, result[0], result[1]) in bad:
+            return None
 
-        wk = WheelKey(
-            name=name,
-            version=ver_str,
-            tag=best_tag,
-            requires_python=f.requires_python,
-            satisfied_tags=file_tag_set,
-            origin_uri=f.url,
-            content_hash=h,
-            hash_algorithm=alg,
-        )
+        return self._index_candidate(name, f, result)
 
-        if (wk.name, wk.version, wk.tag) in bad:
-            return None
+    @staticmethod
+    def _index_candidate(
+        name: str,
+        f: Pep691FileMetadata,
+        result: tuple[str, str, frozenset[str], tuple[str, str]],
+    ) -> ResolverCandidate:
+        """
+        Builds the resolver candidate for an accepted index wheel.
 
-        return ResolverCandidate(wheel_key=wk)
+        Parameters:
+        name : str
+            The canonical project name.
+        f : Pep691FileMetadata
+            The index file entry the wheel came from.
+        result : tuple[str, str, frozenset[str], tuple[str, str]]
+            The version, best tag, applicable tags and hash spec of the wheel.
+
+        Returns:
+        ResolverCandidate
+            The candidate, keyed by a WheelKey carrying the file's origin and hash.
+        """
+        ver_str, best_tag, file_tag_set, hash_spec = result
+        alg, h = hash_spec
+        return ResolverCandidate(
+            wheel_key=WheelKey(
+                name=name,
+                version=ver_str,
+                tag=best_tag,
+                requires_python=f.requires_python,
+                satisfied_tags=file_tag_set,
+                origin_uri=f.url,
+                content_hash=h,
+                hash_algorithm=alg,
+            )
+        )
 
-    def _best_tag(self, file_tag_set: set[str]) -> str | None:
+    def _best_tag(self, file_tag_set: Iterable[str]) -> str | None:
         """
         Determines the best matching tag from a provided set of tags based on a predefined
         order of preference.
 
+        The preference order is held as a tag -> rank map built once per provider, so
+        this is one hash probe per file tag, never a scan of the environment's tags.
+
         Parameters:
-        file_tag_set : set[str]
-            A set of tags to be evaluated against the preferred order.
+        file_tag_set : Iterable[str]
+            The file's tags to be evaluated against the preferred order.
 
         Returns:
         str or None
@@ -846,10 +1416,32 @@ class ProjectResolutionProvider(
         Raises:
             None
         """
-        ordered = getattr(self._env, "supported_tags_ordered", None)
-        if ordered is None:
-            ordered = self._env.supported_tags  # fallback, possibly unordered
-        return next((t for t in ordered if t in file_tag_set), None)
+        tag_rank = self._tag_rank
+        best = min((tag_rank[t] for t in file_tag_set if t in tag_rank), default=None)
+        return None if best is None else self._ordered_tags[best]
+
+    @staticmethod
+    def _parse_wheel_filename(filename: str) -> _ParsedWheelFilename:
+        """
+        Parses a wheel filename through the process-wide memo.
+
+        Parameters:
+        filename : str
+            The wheel filename to parse.
+
+        Returns:
+        _ParsedWheelFilename
+            The result of packaging.utils.parse_wheel_filename for the filename.
+
+        Raises:
+        ValueError
+            If the filename is not a valid wheel filename (a new error carrying
+            the memoized message).
+        """
+        parsed = _parse_wheel_filename_cached(filename)
+        if isinstance(parsed, str):
+            raise ValueError(parsed)
+        return parsed
 
     @staticmethod
     def _sort_candidates(
@@ -971,13 +1563,16 @@ class ProjectResolutionProvider(
         if req.marker is None:
             return True
 
-        if not requested_extras:
+        # Without requested extras, or when the marker cannot depend on extra, every
+        # per-extra evaluation would give the same answer: evaluate once.
+        if not requested_extras or not _marker_uses_extra(req.marker):
             is_marker_env: bool = req.marker.evaluate(environment=marker_env_base)
             return is_marker_env
 
-        # Check if marker evaluates true for any requested extra
+        # Check if marker evaluates true for any requested extra. evaluate() copies the
+        # environment it is given, so one scratch dict serves every extra.
+        marker_env = dict(marker_env_base)
         for extra in requested_extras:
-            marker_env = dict(marker_env_base)
             marker_env["extra"] = extra
             is_marker_env: bool = req.marker.evaluate(environment=marker_env)
             if is_marker_env:
@@ -1039,8 +1634,10 @@ class ProjectResolutionProvider(
             # :: FeatureEnd | name=candidate_dependency_resolution | outcome=no_origin_uri
             return ()
 
-        cache_key = (wk.name, wk.version, wk.tag, wk.origin_uri)
-        meta = self._core_metadata_cache.get(cache_key)
+        # The origin URI names one wheel file (and so one metadata document); keying
+        # on it alone reuses a string whose hash is already cached, and lets
+        # environments that picked a different best tag for the file share the entry.
+        meta = self._core_metadata_cache.get(wk.origin_uri)
         if meta is None:
             cm_key = CoreMetadataKey(
                 name=wk.name, version=wk.version, tag=wk.tag, file_url=wk.origin_uri
@@ -1049,7 +1646,7 @@ class ProjectResolutionProvider(
             cm_path = path_from_file_uri(cm_record.destination_uri)
             text = cm_path.read_text(encoding="utf-8", errors="replace")
             meta = Pep658Metadata.from_core_metadata_text(text)
-            self._core_metadata_cache[cache_key] = meta
+            self._core_metadata_cache[wk.origin_uri] = meta
 
         requested_extras = self._requested_extras_by_name.get(wk.name, frozenset())
         marker_env_base: dict[str, str] = cast(
@@ -1070,6 +1667,10 @@ class ProjectResolutionProvider(
 
             deps.append(self._requirement_to_resolver_requirement(req))
 
+        # The resolver will ask for matches of each new dependency soon; fetch their
+        # index pages together now instead of one at a time later.
+        self.prefetch_indexes(d.name for d in deps if d.uri is None)
+
         # :: FeatureEnd | name=candidate_dependency_resolution | outcome=resolved
         return deps
 
@@ -1151,7 +1752,12 @@ class ProjectResolutionProvider(
 
 
 def resolve(
-    *, services, env: ResolutionEnv, roots: Sequence[ResolverRequirement]
+    *,
+    services,
+    env: ResolutionEnv,
+    roots: Sequence[ResolverRequirement],
+    pep691_cache_dir: str | os.PathLike[str] | None = None,
+    prefetch_workers: int = 0,
 ) -> Result[ResolverRequirement, ResolverCandidate, str]:
     """
     Resolve a sequence of requirements into resolved candidates using the given services
@@ -1166,12 +1772,24 @@ def resolve(
         env: The resolution environment providing configuration and context for the
              resolution process.
         roots: A sequence of requirements that need to be resolved into candidates.
+        pep691_cache_dir: Optional directory for the provider's on-disk parsed index
+             cache; None keeps the cache in memory only.
+        prefetch_workers: Threads used to fetch index pages of the roots and of newly
+             discovered dependencies concurrently; 0 (the default) disables
+             prefetching. Every call gets its own pool, so callers resolving several
+             environments at once should keep this small.
 
     Returns:
         A `Result` object containing resolved requirements, candidates, and
         associated resolution metadata (represented as strings).
     """
-    provider = ProjectResolutionProvider(services=services, env=env)
+    provider = ProjectResolutionProvider(
+        services=services,
+        env=env,
+        pep691_cache_dir=pep691_cache_dir,
+        prefetch_workers=prefetch_workers,
+    )
+    provider.prefetch_indexes(r.name for r in roots if r.uri is None)
     reporter = ProjectResolutionReporter()
     resolver: Resolver[ResolverRequirement, ResolverCandidate, str] = Resolver(
         provider, reporter
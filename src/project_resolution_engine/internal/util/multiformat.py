@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+import inspect
+from collections.abc import Callable, Mapping
 from datetime import datetime, date
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar, get_origin
 
 from typing_extensions import Self
 
@@ -84,6 +85,119 @@ def _normalize(value: Any) -> Any:
             return value
 
 
+class MappingFieldKind(Enum):
+    """
+    How a field is written by a generated `to_mapping`.
+
+    Attributes:
+        PLAIN: Always emitted as-is.
+        ENUM: Always emitted as the member's `.value`.
+        MODEL: Always emitted as `.to_mapping()`.
+        MODEL_DICT: Always emitted as `{name: model.to_mapping()}`.
+        OPT: Emitted as-is when not None.
+        OPT_MODEL: Emitted as `.to_mapping()` when not None.
+        OPT_MODEL_DICT: Emitted as `{name: model.to_mapping()}` when truthy.
+    """
+
+    PLAIN = "plain"
+    ENUM = "enum"
+    MODEL = "model"
+    MODEL_DICT = "model_dict"
+    OPT = "opt"
+    OPT_MODEL = "opt_model"
+    OPT_MODEL_DICT = "opt_model_dict"
+
+
+_ALWAYS_TEMPLATES: dict[MappingFieldKind, str] = {
+    MappingFieldKind.PLAIN: "self.{name}",
+    MappingFieldKind.ENUM: "self.{name}.value",
+    MappingFieldKind.MODEL: "self.{name}.to_mapping()",
+    MappingFieldKind.MODEL_DICT: (
+        "{{k: m.to_mapping() for k, m in self.{name}.items()}}"
+    ),
+}
+_OPTIONAL_TEMPLATES: dict[MappingFieldKind, str] = {
+    MappingFieldKind.OPT: (
+        "    if (v := self.{name}) is not None:\n        r[{name!r}] = v"
+    ),
+    MappingFieldKind.OPT_MODEL: (
+        "    if (v := self.{name}) is not None:\n        r[{name!r}] = v.to_mapping()"
+    ),
+    MappingFieldKind.OPT_MODEL_DICT: (
+        "    if v := self.{name}:\n"
+        "        r[{name!r}] = {{k: m.to_mapping() for k, m in v.items()}}"
+    ),
+}
+
+
+# :: MechanicalOperation | type=introspection
+def _is_class_var(annotation: Any) -> bool:
+    """
+    Returns True if an annotation (evaluated or stringified) declares a ClassVar.
+    """
+    if isinstance(annotation, str):
+        return annotation.startswith(("ClassVar", "typing.ClassVar"))
+    return annotation is ClassVar or get_origin(annotation) is ClassVar
+
+
+# :: MechanicalOperation | type=code_generation
+def _generate_to_mapping(
+    cls: type, kinds: Mapping[str, MappingFieldKind]
+) -> Callable[[Any], Mapping[str, Any]]:
+    """
+    Generates a specialized `to_mapping` function for a model class.
+
+    Fields are the class's own annotated, non-ClassVar attributes in declaration
+    order, which is the dataclass field order. The generated function builds a
+    single dict display for the always-present fields, then appends the optional
+    ones with inline None/truthiness checks, so serialization does no per-call
+    dispatch on field kinds.
+
+    Args:
+        cls: The model class whose fields are serialized.
+        kinds: Field name to MappingFieldKind. Unnamed fields are PLAIN.
+
+    Returns:
+        The generated `to_mapping` function.
+
+    Raises:
+        ValueError: If kinds names a field the class does not declare, or a kind
+            is not a MappingFieldKind.
+    """
+    names = [
+        name
+        for name, annotation in inspect.get_annotations(cls).items()
+        if not _is_class_var(annotation)
+    ]
+    if unknown := kinds.keys() - set(names):
+        raise ValueError(f"{cls.__name__}: unknown to_mapping fields {unknown}")
+    always: list[str] = []
+    optional: list[str] = []
+    for name in names:
+        kind = kinds.get(name, MappingFieldKind.PLAIN)
+        if kind in _ALWAYS_TEMPLATES:
+            always.append(f"{name!r}: {_ALWAYS_TEMPLATES[kind].format(name=name)}")
+        elif kind in _OPTIONAL_TEMPLATES:
+            optional.append(_OPTIONAL_TEMPLATES[kind].format(name=name))
+        else:
+            raise ValueError(f"{cls.__name__}.{name}: unknown kind {kind!r}")
+    src = "\n".join(
+        [
+            "def to_mapping(self):",
+            f"    r = {{{', '.join(always)}}}",
+            *optional,
+            "    return r",
+        ]
+    )
+    namespace: dict[str, Any] = {}
+    exec(compile(src, f"<to_mapping:{cls.__name__}>", "exec"), namespace)
+    to_mapping: Callable[[Any], Mapping[str, Any]] = namespace["to_mapping"]
+    to_mapping.__qualname__ = f"{cls.__qualname__}.to_mapping"
+    to_mapping.__module__ = cls.__module__
+    to_mapping.__doc__ = f"Serialize {cls.__name__} to a mapping (generated)."
+    return to_mapping
+
+
 class MultiformatSerializableMixin:
     """
     A mixin to add multi-format serialization support for custom objects.
@@ -94,6 +208,9 @@ class MultiformatSerializableMixin:
     implement specific methods to use this mixin effectively.
     """
 
+    # Empty slots so slotted dataclass models stay free of an instance __dict__.
+    __slots__ = ()
+
     # :: PermitUnused
     def mapping_hash(self) -> str:
         """
@@ -368,6 +485,8 @@ class MultiformatDeserializableMixin:
         deserialization steps, such as preprocessing mappings or postprocessing instances.
     """
 
+    __slots__ = ()
+
     # ---- core contract ----
 
     # :: MechanicalOperation | type=deserialization
@@ -723,4 +842,29 @@ class MultiformatDeserializableMixin:
 class MultiformatModelMixin(
     MultiformatSerializableMixin, MultiformatDeserializableMixin
 ):
-    pass
+    """
+    Combined serialization and deserialization mixin for model classes.
+
+    Subclasses may pass `mapping_fields` as a class keyword to have `to_mapping`
+    generated once at class creation instead of writing it by hand:
+
+        class Spec(MultiformatModelMixin, mapping_fields={"range": MappingFieldKind.OPT}):
+            ...
+
+    Every annotated field is serialized; `mapping_fields` only names the fields
+    that are not PLAIN.
+    """
+
+    __slots__ = ()
+
+    def __init_subclass__(
+        cls,
+        *,
+        mapping_fields: Mapping[str, MappingFieldKind] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init_subclass__(**kwargs)
+        # Classes rebuilt without the keyword (e.g. by dataclass(slots=True))
+        # carry over the already-generated method in their namespace.
+        if mapping_fields is not None:
+            setattr(cls, "to_mapping", _generate_to_mapping(cls, mapping_fields))
@@ -3,10 +3,11 @@ from __future__ import annotations
 import importlib
 import inspect
 import pkgutil
+import sys
 from abc import ABC
 from collections import defaultdict, deque
 from collections.abc import Mapping, Sequence, Iterable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from importlib.metadata import entry_points, EntryPoint
 from typing import Any, TypeVar, Generic
 
@@ -37,10 +38,18 @@ class StrategyRef:
 
     strategy_name: str = ""
     instance_id: str = ""
+    # Resolved (and interned) once; refs are compared by id throughout planning.
+    _normalized_iid: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        iid = self.instance_id or self.strategy_name
+        if type(iid) is str:
+            iid = sys.intern(iid)
+        object.__setattr__(self, "_normalized_iid", iid)
 
     # :: UtilityOperation | type=normalization
     def normalized_instance_id(self) -> str:
-        iid = self.instance_id or self.strategy_name
+        iid = self._normalized_iid
         if not iid:
             raise StrategyConfigError(
                 "StrategyRef requires strategy_name or instance_id"
@@ -77,6 +86,9 @@ class BaseArtifactResolutionStrategyConfig(Generic[ArtifactStrategyType], ABC):
       - PROTOTYPE strategies may plan one or more instances.
     """
 
+    # Specs are used through classmethods only; never grow a per-instance __dict__.
+    __slots__ = ()
+
     # :: CalledThroughAbstraction
     @classmethod
     def defaults(cls) -> Mapping[str, Any]:
@@ -88,9 +100,27 @@ class BaseArtifactResolutionStrategyConfig(Generic[ArtifactStrategyType], ABC):
         *,
         strategy_cls: type[BaseArtifactResolutionStrategy],
         config: Mapping[str, Any],
-    ) -> list[StrategyPlan]:
+    ) -> Sequence[StrategyPlan]:
         raise NotImplementedError
 
+    @classmethod
+    def plan_all(
+        cls,
+        *,
+        strategy_cls: type[BaseArtifactResolutionStrategy],
+        configs: Iterable[Mapping[str, Any]],
+    ) -> list[StrategyPlan]:
+        """
+        Plan every configured instance of one strategy in a single call.
+
+        The default delegates to plan() per config; specs with fixed per-class setup
+        can override it to hoist that work out of the loop.
+        """
+        plans: list[StrategyPlan] = []
+        for config in configs:
+            plans.extend(cls.plan(strategy_cls=strategy_cls, config=config))
+        return plans
+
 
 StrategyCls = type[BaseArtifactResolutionStrategy[Any]]
 ConfigSpecCls = type[BaseArtifactResolutionStrategyConfig[Any]]
@@ -509,6 +539,7 @@ def _plan_all_strategies(
 
         _enforce_singleton_policy(strategy_name=strategy_name, policy=policy, iids=iids)
 
+        merged_cfgs: list[dict[str, object]] = []
         for iid in iids:
             raw = cfg_by_instance_id.get(iid) or defaults_cfg_by_iid.get(iid)
             if raw is None:
@@ -521,8 +552,13 @@ def _plan_all_strategies(
             merged["strategy_name"] = strategy_name
             merged["instance_id"] = iid
             effective_cfg_by_iid[iid] = merged
-            planned = spec_cls.plan(strategy_cls=strategy_cls, config=merged)
-            plans.extend(planned)
+            merged_cfgs.append(merged)
+
+        # One batched call per strategy instead of one plan() per instance.
+        if merged_cfgs:
+            plans.extend(
+                spec_cls.plan_all(strategy_cls=strategy_cls, configs=merged_cfgs)
+            )
 
     return plans, effective_cfg_by_iid
 
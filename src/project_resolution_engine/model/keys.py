@@ -5,7 +5,7 @@ from abc import ABC
 from collections.abc import Callable
 from dataclasses import dataclass, field, fields
 from enum import Enum
-from functools import total_ordering
+from functools import lru_cache, total_ordering
 from typing import Mapping, Any, TypeVar, Iterable
 
 from packaging.utils import canonicalize_name
@@ -34,15 +34,30 @@ def _is_empty_collection(v: object) -> bool:
 
 
 # :: UtilityOperation | type=normalization
+@lru_cache(maxsize=8192)
 def normalize_project_name(project: str) -> str:
     """
     Normalize a project name for consistent keying.
 
     This uses packaging's canonicalize_name, which is what pip uses for normalization.
+    Every key construction normalizes its name, and resolution builds many keys for
+    the same few projects, so results are memoized.
     """
     return canonicalize_name(project)
 
 
+# :: UtilityOperation | type=normalization
+@lru_cache(maxsize=16384)
+def _normalize_version(version: str) -> str:
+    """
+    Normalize a version string, leaving invalid versions unchanged (memoized).
+    """
+    try:
+        return str(Version(version))
+    except InvalidVersion:
+        return version
+
+
 # :: PermitUnused | reason=called during class initialization
 def reqtxt(*, key: str | None = None, fmt: str | None = None) -> dict[str, object]:
     md: dict[str, object] = {"reqtxt": True}
@@ -230,12 +245,7 @@ class WheelKey(BaseArtifactKey):
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "name", normalize_project_name(self.name))
-        normalized_version: str = self.version
-        try:
-            normalized_version = str(Version(self.version))
-        except InvalidVersion:
-            pass
-        object.__setattr__(self, "version", normalized_version)
+        object.__setattr__(self, "version", _normalize_version(self.version))
         self._validate_hash_and_set_spec()
 
     # --------------------------------------------------------------------- #
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import Enum
@@ -248,6 +249,12 @@ class ResolutionParams:
         repo_config (Mapping[str, Any] | None): Optional configuration mapping for the repository.
         strategy_configs (Iterable[ResolutionStrategyConfig] | None): Optional set of per-instance
             configurations for resolution strategies.
+        pep691_cache_dir (str | os.PathLike[str] | None): Optional directory where parsed
+            index pages are kept between runs, so later resolutions can skip JSON parsing.
+            Entries are pickles; only point this at a directory you trust.
+        prefetch_workers (int): Threads used, across all concurrently resolved
+            environments, to fetch index pages of root and newly discovered projects
+            ahead of the resolver; 0 disables prefetching.
     """
 
     root_wheels: list[WheelSpec]
@@ -256,6 +263,8 @@ class ResolutionParams:
     repo_id: str | None = None
     repo_config: Mapping[str, Any] | None = None
     strategy_configs: Iterable[ResolutionStrategyConfig] | None = field(default=None)
+    pep691_cache_dir: str | os.PathLike[str] | None = None
+    prefetch_workers: int = 16
 
 
 @dataclass(frozen=True, slots=True)
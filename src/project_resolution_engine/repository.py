@@ -35,6 +35,32 @@ class ArtifactRepository(ABC):
     @abstractmethod
     def allocate_destination_uri(self, key: BaseArtifactKey) -> str: ...
 
+    def get_or_reserve(self, key: BaseArtifactKey) -> ArtifactRecord | str:
+        """
+        Return the stored record for key, or a destination URI to fill on a miss.
+
+        Lets callers do the hit check and the destination allocation in one repository
+        call. The default implementation composes get() and allocate_destination_uri();
+        repositories that can do both in one round trip (or must reserve the
+        destination atomically) should override it.
+        """
+        hit = self.get(key)
+        if hit is not None:
+            return hit
+        return self.allocate_destination_uri(key)
+
+    def release_reservation(self, key: BaseArtifactKey) -> None:
+        """
+        Settle a destination handed out by get_or_reserve().
+
+        Callers invoke this once they are done with the destination, whether or not a
+        record was stored for the key; it must be a no-op if put() already settled
+        the reservation. The default implementation does not reserve anything, so
+        there is nothing to release; repositories whose get_or_reserve() blocks other
+        callers on an in-flight key must override it to wake them.
+        """
+        return None
+
     # :: PermitUnused | reason=handled implicitly by repository @contextmanager
     def close(self) -> None:
         """
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from types import SimpleNamespace
 from typing import Any, Mapping, MutableMapping, Sequence
 
 import pytest
@@ -349,6 +350,19 @@ _RESOLVE_CASES: list[dict[str, Any]] = [
         "resolution_mode": ResolutionMode.RESOLVED_WHEELS,
         "covers": ["C001M001B0002", "C001M001B0003"],
     },
+    {
+        "id": "multiple_envs_resolved_wheels_mode",
+        "target_envs": [
+            mh.FakeResolutionEnv(
+                identifier=f"env{i}",
+                supported_tags=frozenset({"py3-none-any"}),
+                marker_environment={"python_version": "3.11"},
+            )
+            for i in range(3)
+        ],
+        "resolution_mode": ResolutionMode.RESOLVED_WHEELS,
+        "covers": ["C001M001B0002", "C001M001B0003"],
+    },
 ]
 
 
@@ -372,15 +386,20 @@ def test_normalize_strategy_configs(case: dict[str, Any]) -> None:
     assert got == case["expect"]
 
 
+def test_normalize_strategy_configs_keeps_normalized_config_without_copy() -> None:
+    # Covers: C000F001B0004 (instance_id already present)
+    cfg = {"instance_id": "iid", "strategy_name": "s1"}
+    got = uut._normalize_strategy_configs([cfg])  # type: ignore[list-item]
+    assert got["iid"] is cfg
+
+
 @pytest.mark.parametrize("case", _ROOTS_CASES, ids=[c["id"] for c in _ROOTS_CASES])
 def test_roots_for_env(case: dict[str, Any], monkeypatch: pytest.MonkeyPatch) -> None:
     # Covers: see case["covers"]
 
-    # Patch the ResolverRequirement that _roots_for_env imports at call time.
-    from project_resolution_engine.internal import resolvelib_types as rlt
-
+    # Patch the ResolverRequirement that api.py imports at module scope.
     monkeypatch.setattr(
-        rlt, "ResolverRequirement", mh.FakeResolverRequirement, raising=True
+        uut, "ResolverRequirement", mh.FakeResolverRequirement, raising=True
     )
 
     class _Env:
@@ -474,15 +493,34 @@ def test_format_requirements_text(case: dict[str, Any]) -> None:
     assert "\n\n" in out  # double-newline join between blocks
 
 
+def test_lazy_imports_bind_module_globals() -> None:
+    from project_resolution_engine.internal import resolvelib as internal_resolvelib
+
+    assert uut._lazy("rl_resolve") is internal_resolvelib.resolve
+    assert "rl_resolve" in vars(uut)
+    with pytest.raises(AttributeError):
+        uut._lazy("not_a_lazy_name")
+
+
+def test_engine_clear_caches_delegates_to_provider(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[str] = []
+    provider = SimpleNamespace(clear_caches=lambda: calls.append("cleared"))
+    monkeypatch.setattr(uut, "rl_provider", provider, raising=False)
+
+    uut.ProjectResolutionEngine.clear_caches()
+
+    assert calls == ["cleared"]
+
+
 @pytest.mark.parametrize("case", _RESOLVE_CASES, ids=[c["id"] for c in _RESOLVE_CASES])
 def test_project_resolution_engine_resolve(
     case: dict[str, Any], monkeypatch: pytest.MonkeyPatch
 ) -> None:
     # Covers: see case["covers"]
 
-    # ---- patch open_repository context manager ----
-    from project_resolution_engine.internal.repositories import factory as repo_factory
-
+    # ---- patch open_repository context manager (lazily bound in api.py) ----
     class _RepoCtx:
         def __init__(self, repo: object) -> None:
             self._repo = repo
@@ -500,7 +538,7 @@ def test_project_resolution_engine_resolve(
         open_repo_calls.append((repo_id, config))
         return _RepoCtx(repo_obj)
 
-    monkeypatch.setattr(repo_factory, "open_repository", _open_repository, raising=True)
+    monkeypatch.setattr(uut, "open_repository", _open_repository, raising=True)
 
     # ---- patch load_services (imported at module scope in api.py) ----
     load_services_calls: list[dict[str, Any]] = []
@@ -513,13 +551,26 @@ def test_project_resolution_engine_resolve(
 
     monkeypatch.setattr(uut, "load_services", _load_services, raising=True)
 
-    # ---- patch internal resolvelib resolver ----
-    from project_resolution_engine.internal import resolvelib as internal_resolvelib
-
+    # ---- patch internal resolvelib resolver (lazily bound in api.py) ----
     rl_calls: list[dict[str, Any]] = []
 
-    def _rl_resolve(*, services: Any, env: Any, roots: Any) -> _FakeResult:
-        rl_calls.append({"services": services, "env": env, "roots": roots})
+    def _rl_resolve(
+        *,
+        services: Any,
+        env: Any,
+        roots: Any,
+        pep691_cache_dir: Any,
+        prefetch_workers: int,
+    ) -> _FakeResult:
+        rl_calls.append(
+            {
+                "services": services,
+                "env": env,
+                "roots": roots,
+                "pep691_cache_dir": pep691_cache_dir,
+                "prefetch_workers": prefetch_workers,
+            }
+        )
         return _FakeResult(
             mapping={
                 "a": mh.FakeResolverCandidate(
@@ -536,7 +587,7 @@ def test_project_resolution_engine_resolve(
             criteria={},  # keep dependency graph empty for unit isolation
         )
 
-    monkeypatch.setattr(internal_resolvelib, "resolve", _rl_resolve, raising=True)
+    monkeypatch.setattr(uut, "rl_resolve", _rl_resolve, raising=True)
 
     # ---- params ----
     params = mh.FakeResolutionParams(
@@ -546,6 +597,8 @@ def test_project_resolution_engine_resolve(
         repo_id="repo1",
         repo_config={"k": "v"},
         strategy_configs=[{"strategy_name": "s1"}],
+        pep691_cache_dir="/tmp/pep691-cache",
+        prefetch_workers=12,
     )
 
     res = uut.ProjectResolutionEngine.resolve(params)  # type: ignore[arg-type]
@@ -567,6 +620,12 @@ def test_project_resolution_engine_resolve(
 
     # env loop >= 1 (C001M001B0002)
     assert len(rl_calls) == len(case["target_envs"])
+    assert all(c["pep691_cache_dir"] == "/tmp/pep691-cache" for c in rl_calls)
+    # The prefetch budget is split between the environments resolved at once.
+    assert all(
+        c["prefetch_workers"] == 12 // len(case["target_envs"]) for c in rl_calls
+    )
+    assert list(res.requirements_by_env) == [e.identifier for e in case["target_envs"]]
     for env in case["target_envs"]:
         assert env.identifier in res.requirements_by_env
         assert res.requirements_by_env[env.identifier].endswith("\n")
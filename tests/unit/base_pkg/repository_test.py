@@ -31,10 +31,52 @@ class _FakeBaseArtifactKey:
         return _FakeKey(mapping)
 
 
+class _DictRepository(uut.ArtifactRepository):
+    """
+    Minimal concrete repository that records get/allocate calls, so the default
+    get_or_reserve() composition can be observed.
+    """
+
+    def __init__(self, stored: Any) -> None:
+        self.stored = stored
+        self.calls: list[str] = []
+
+    def get(self, key: Any) -> Any:
+        self.calls.append("get")
+        return self.stored
+
+    def put(self, record: Any) -> None:
+        raise AssertionError("not used")
+
+    def delete(self, key: Any) -> None:
+        raise AssertionError("not used")
+
+    def allocate_destination_uri(self, key: Any) -> str:
+        self.calls.append("allocate")
+        return "dst://allocated"
+
+
 # ==============================================================================
 # Case matrices (mandatory per contract)
 # ==============================================================================
 
+GET_OR_RESERVE_CASES = [
+    {
+        "id": "hit-returns-record",
+        "stored": "record",
+        "expected": "record",
+        "expected_calls": ["get"],
+        "covers": ["C003M006B0001"],
+    },
+    {
+        "id": "miss-allocates-destination",
+        "stored": None,
+        "expected": "dst://allocated",
+        "expected_calls": ["get", "allocate"],
+        "covers": ["C003M006B0002"],
+    },
+]
+
 TO_MAPPING_CASES = [
     {
         "id": "no-content-hashes",
@@ -134,6 +176,21 @@ def test_artifact_repository_close_is_noop() -> None:
     assert uut.ArtifactRepository.close(object()) is None
 
 
+# noinspection PyTypeChecker
+def test_artifact_repository_release_reservation_is_noop() -> None:
+    # Covers: C003M007B0001
+    assert uut.ArtifactRepository.release_reservation(object(), object()) is None
+
+
+@pytest.mark.parametrize("case", GET_OR_RESERVE_CASES, ids=lambda c: c["id"])
+def test_artifact_repository_get_or_reserve_default(case: dict[str, Any]) -> None:
+    # Covers: see case["covers"]
+    repo = _DictRepository(case["stored"])
+
+    assert repo.get_or_reserve(object()) == case["expected"]
+    assert repo.calls == case["expected_calls"]
+
+
 # noinspection PyTypeChecker
 def test_abstract_placeholder_methods_execute_as_noops_when_called_unbound() -> None:
     """
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import hashlib
+import os
 from abc import ABC
 from collections.abc import Callable
 from dataclasses import dataclass, field, fields
@@ -685,6 +686,8 @@ class FakeResolutionParams(MirrorValidatableFake):
     strategy_configs: Iterable[FakeResolutionStrategyConfig] | None = field(
         default=None
     )
+    pep691_cache_dir: str | os.PathLike[str] | None = None
+    prefetch_workers: int = 16
 
 
 @dataclass(frozen=True, slots=True)
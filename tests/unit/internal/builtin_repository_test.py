@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -26,7 +27,7 @@ from unit.helpers.models_helper import (
 # ## EphemeralArtifactRepository.__init__(self, *, prefix: str = "project-resolution-engine-ephemeral-")
 #    (Class ID: C001, Method ID: M001)
 # ------------------------------------------------------------------------------
-# C001M001B0001: (linear execution) -> initializes _tmp, _root, and _index (empty dict)
+# C001M001B0001: (linear execution) -> initializes _tmp, _root, _root_str, _index (empty dict), _reservations (empty dict), and _lock
 #
 # ------------------------------------------------------------------------------
 # ## EphemeralArtifactRepository.root_path(self)
@@ -44,7 +45,7 @@ from unit.helpers.models_helper import (
 # ## EphemeralArtifactRepository.close(self)
 #    (Class ID: C001, Method ID: M004)
 # ------------------------------------------------------------------------------
-# C001M004B0001: (linear execution) -> clears self._index and calls self._tmp.cleanup()
+# C001M004B0001: (linear execution) -> clears self._index and self._reservations, calls self._tmp.cleanup(), and sets every pending reservation event
 #
 # ------------------------------------------------------------------------------
 # ## EphemeralArtifactRepository.__enter__(self)
@@ -62,28 +63,30 @@ from unit.helpers.models_helper import (
 # ## EphemeralArtifactRepository.get(self, key: BaseArtifactKey)
 #    (Class ID: C001, Method ID: M007)
 # ------------------------------------------------------------------------------
-# C001M007B0001: record is None -> returns None
-# C001M007B0002: record is not None -> continues with dest = record.destination_uri
-# C001M007B0003: dest.startswith("file://") is False -> returns record
-# C001M007B0004: dest.startswith("file://") is True -> enters try block to validate underlying file exists
-# C001M007B0005: not path.exists() -> self._index.pop(key, None) and returns None
-# C001M007B0006: path.exists() -> returns record
-# C001M007B0007: except Exception: -> returns record
+# C001M007B0001: entry is None -> returns None
+# C001M007B0002: entry is not None -> continues with entry.fs_path
+# C001M007B0003: entry.fs_path is None (non-file destination) -> returns entry.record
+# C001M007B0004: entry.fs_path is not None (file:// destination parsed at put time) -> validates underlying file exists
+# C001M007B0005: not os.path.exists(entry.fs_path) -> self._index.pop(key, None) and returns None
+# C001M007B0006: os.path.exists(entry.fs_path) -> returns entry.record
+# C001M007B0007: entry.fs_path is None (file:// URI without a usable path) -> returns entry.record
 #
 # ------------------------------------------------------------------------------
 # ## EphemeralArtifactRepository.put(self, record: ArtifactRecord)
 #    (Class ID: C001, Method ID: M008)
 # ------------------------------------------------------------------------------
-# C001M008B0001: (linear execution) -> stores record in self._index under record.key
+# C001M008B0001: (linear execution) -> stores _IndexedRecord(record, fspath of _file_uri_to_path(record.destination_uri) or None) in self._index under record.key
+# C001M008B0002: a reservation is pending for record.key -> pops it and sets its event
+# C001M008B0003: no reservation is pending for record.key -> no event is set
 #
 # ------------------------------------------------------------------------------
 # ## EphemeralArtifactRepository.delete(self, key: BaseArtifactKey)
 #    (Class ID: C001, Method ID: M009)
 # ------------------------------------------------------------------------------
-# C001M009B0001: record is None -> returns (no deletion)
-# C001M009B0002: record is not None -> continues with dest = record.destination_uri
-# C001M009B0003: not dest.startswith("file://") -> returns (no file deletion attempted)
-# C001M009B0004: dest.startswith("file://") -> enters try block to best-effort delete file
+# C001M009B0001: entry is None -> returns (no deletion)
+# C001M009B0002: entry is not None -> continues with entry.fs_path
+# C001M009B0003: entry.fs_path is None -> returns (no file deletion attempted)
+# C001M009B0004: entry.fs_path is not None -> enters try block to best-effort delete file
 # C001M009B0005: self._is_under_root(path) and path.exists() -> calls path.unlink()
 # C001M009B0006: not (self._is_under_root(path) and path.exists()) -> does nothing and returns None
 # C001M009B0007: except Exception: -> returns (swallows cleanup error)
@@ -98,8 +101,8 @@ from unit.helpers.models_helper import (
 # ## EphemeralArtifactRepository._is_under_root(self, path: Path)
 #    (Class ID: C001, Method ID: M011)
 # ------------------------------------------------------------------------------
-# C001M011B0001: try: path.relative_to(self._root) succeeds -> returns True
-# C001M011B0002: except Exception: -> returns False
+# C001M011B0001: os.fspath(path).startswith(self._root_str) -> returns True
+# C001M011B0002: not os.fspath(path).startswith(self._root_str) -> returns False
 #
 # ------------------------------------------------------------------------------
 # ## EphemeralArtifactRepository._allocate_path_for_key(self, key: BaseArtifactKey)
@@ -115,6 +118,23 @@ from unit.helpers.models_helper import (
 # C001M012B0008: (WheelKey path return) -> returns self._root / "wheels" / _safe_segment(k.name) / _safe_segment(k.version) / _safe_segment(k.tag) / filename
 # C001M012B0009: case _: -> raises TypeError (message contains "Unsupported artifact key type:")
 #
+# ------------------------------------------------------------------------------
+# ## EphemeralArtifactRepository.get_or_reserve(self, key: BaseArtifactKey)
+#    (Class ID: C001, Method ID: M013)
+# ------------------------------------------------------------------------------
+# C001M013B0001: self.get(key) is not None -> returns the stored record
+# C001M013B0002: key in self._index after taking the lock -> loops and re-checks self.get(key)
+# C001M013B0003: no pending reservation for key -> registers an Event and returns self.allocate_destination_uri(key)
+# C001M013B0004: a reservation is pending for key -> waits on its event, then loops
+# C001M013B0005: self.allocate_destination_uri(key) raises -> releases the reservation and re-raises
+#
+# ------------------------------------------------------------------------------
+# ## EphemeralArtifactRepository.release_reservation(self, key: BaseArtifactKey)
+#    (Class ID: C001, Method ID: M014)
+# ------------------------------------------------------------------------------
+# C001M014B0001: a reservation is pending for key -> pops it and sets its event
+# C001M014B0002: no reservation is pending for key -> does nothing
+#
 
 # ==============================================================================
 # Case matrices (per TESTING_CONTRACT.md)
@@ -203,7 +223,7 @@ DELETE_CASES: list[dict[str, Any]] = [
     },
     {
         "name": "delete_hit_file_dest_path_exception_swallowed",
-        "dest_uri": "file://this-will-trigger-path-construction",
+        "dest_uri": "file://{path}",
         "create_file": False,
         "expect_file_deleted": False,
         "force_path_exception": True,
@@ -340,6 +360,7 @@ def test_init_sets_root_and_empty_index(
     assert repo._tmp is fake_tmp
     assert repo.root_path == Path(fake_tmp.name).resolve()
     assert repo._index == {}
+    assert repo._reservations == {}
 
 
 def test_root_path_and_root_uri(
@@ -361,10 +382,14 @@ def test_close_clears_index_and_cleans_tempdir(
     _install_fake_tempdir(monkeypatch, tmp_path)
     repo = uut.EphemeralArtifactRepository()
     repo._index["k"] = "v"
+    event = threading.Event()
+    repo._reservations["r"] = event
 
     repo.close()
 
     assert repo._index == {}
+    assert repo._reservations == {}
+    assert event.is_set()
     assert repo._tmp.cleanup_calls == 1
 
 
@@ -431,7 +456,7 @@ def test_get_branches(
 def test_put_stores_record_by_key(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    # covers: C001M008B0001
+    # covers: C001M008B0001, C001M008B0003
     _install_fake_tempdir(monkeypatch, tmp_path)
     repo = uut.EphemeralArtifactRepository()
 
@@ -440,7 +465,40 @@ def test_put_stores_record_by_key(
 
     repo.put(record)
 
-    assert repo._index[key] is record
+    assert repo._index[key].record is record
+    assert repo._index[key].fs_path is None
+
+
+# noinspection PyTypeChecker
+def test_put_caches_file_destination_path(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # covers: C001M008B0001
+    _install_fake_tempdir(monkeypatch, tmp_path)
+    repo = uut.EphemeralArtifactRepository()
+
+    key = FakeIndexMetadataKey(project="requests")
+    p = repo.root_path / "with space" / "file.bin"
+    repo.put(_mk_record(key=key, destination_uri=p.as_uri()))
+    assert repo._index[key].fs_path == str(p)
+
+
+# noinspection PyTypeChecker
+def test_put_signals_pending_reservation(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # covers: C001M008B0001, C001M008B0002
+    _install_fake_tempdir(monkeypatch, tmp_path)
+    repo = uut.EphemeralArtifactRepository()
+
+    key = FakeIndexMetadataKey(project="requests")
+    event = threading.Event()
+    repo._reservations[key] = event
+
+    repo.put(_mk_record(key=key, destination_uri="mem://artifact/x"))
+
+    assert event.is_set()
+    assert key not in repo._reservations
 
 
 # noinspection PyTypeChecker
@@ -473,10 +531,11 @@ def test_delete_branches(
 
     if case["force_path_exception"]:
 
-        def _boom_path(*args: Any, **kwargs: Any) -> Any:
-            raise RuntimeError("boom")
+        class _BoomPath:
+            def __fspath__(self) -> str:
+                raise RuntimeError("boom")
 
-        monkeypatch.setattr(uut, "Path", _boom_path)
+        repo._index[key] = uut._IndexedRecord(record, _BoomPath())  # type: ignore[arg-type]
 
     repo.delete(key)
     assert key not in repo._index
@@ -534,6 +593,8 @@ def test_is_under_root_branches(
     if case["rel"] is None:
         outside = tmp_path / "outside.txt"
         assert repo._is_under_root(outside) is False
+        sibling = Path(str(repo.root_path) + "-sibling") / "x.txt"
+        assert repo._is_under_root(sibling) is False
     else:
         inside = repo.root_path / case["rel"]
         assert repo._is_under_root(inside) is True
@@ -586,3 +647,154 @@ def test_allocate_path_for_key_branches(
         assert "wheels" in path.parts
         expected_hash = uut._short_hash(key.origin_uri)  # type: ignore[arg-type]
         assert path.name == f"{expected_hash}.whl"
+
+
+# noinspection PyTypeChecker
+def test_get_or_reserve_returns_stored_record(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # covers: C001M013B0001
+    _install_fake_tempdir(monkeypatch, tmp_path)
+    repo = uut.EphemeralArtifactRepository()
+
+    key = FakeIndexMetadataKey(project="requests")
+    record = _mk_record(key=key, destination_uri="mem://artifact/x")
+    repo.put(record)
+
+    assert repo.get_or_reserve(key) is record
+    assert repo._reservations == {}
+
+
+# noinspection PyTypeChecker
+def test_get_or_reserve_rechecks_when_stored_before_lock(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # covers: C001M013B0002, C001M013B0001
+    _install_fake_tempdir(monkeypatch, tmp_path)
+    repo = uut.EphemeralArtifactRepository()
+
+    key = FakeIndexMetadataKey(project="requests")
+    record = _mk_record(key=key, destination_uri="mem://artifact/x")
+    repo._index[key] = uut._IndexedRecord(record, None)
+    results = iter([None, record])
+    monkeypatch.setattr(repo, "get", lambda _key: next(results))
+
+    assert repo.get_or_reserve(key) is record
+    assert repo._reservations == {}
+
+
+# noinspection PyTypeChecker
+def test_get_or_reserve_reserves_and_returns_destination(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # covers: C001M013B0003
+    _install_fake_tempdir(monkeypatch, tmp_path)
+    _patch_key_types(monkeypatch)
+    repo = uut.EphemeralArtifactRepository()
+
+    key = FakeIndexMetadataKey(project="requests", index_base="https://pypi.org/simple")
+    dest = repo.get_or_reserve(key)
+
+    assert dest == repo.allocate_destination_uri(key)
+    assert isinstance(repo._reservations[key], threading.Event)
+
+
+# noinspection PyTypeChecker
+def test_get_or_reserve_waits_for_in_flight_put(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # covers: C001M013B0004, C001M013B0001
+    _install_fake_tempdir(monkeypatch, tmp_path)
+    _patch_key_types(monkeypatch)
+    repo = uut.EphemeralArtifactRepository()
+
+    key = FakeIndexMetadataKey(project="requests", index_base="https://pypi.org/simple")
+    dest = repo.get_or_reserve(key)
+    assert isinstance(dest, str)
+    record = _mk_record(key=key, destination_uri="mem://artifact/x")
+
+    results: list[Any] = []
+    waiter = threading.Thread(target=lambda: results.append(repo.get_or_reserve(key)))
+    waiter.start()
+    waiter.join(timeout=0.05)
+    assert waiter.is_alive()
+
+    repo.put(record)
+    waiter.join(timeout=5)
+
+    assert results == [record]
+
+
+# noinspection PyTypeChecker
+def test_get_or_reserve_retries_after_release(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # covers: C001M013B0004, C001M013B0003, C001M014B0001
+    _install_fake_tempdir(monkeypatch, tmp_path)
+    _patch_key_types(monkeypatch)
+    repo = uut.EphemeralArtifactRepository()
+
+    key = FakeIndexMetadataKey(project="requests", index_base="https://pypi.org/simple")
+    dest = repo.get_or_reserve(key)
+    first_event = repo._reservations[key]
+
+    results: list[Any] = []
+    waiter = threading.Thread(target=lambda: results.append(repo.get_or_reserve(key)))
+    waiter.start()
+    waiter.join(timeout=0.05)
+    assert waiter.is_alive()
+
+    repo.release_reservation(key)
+    waiter.join(timeout=5)
+
+    assert first_event.is_set()
+    assert results == [dest]
+    assert repo._reservations[key] is not first_event
+
+
+# noinspection PyTypeChecker
+def test_release_reservation_without_pending_is_noop(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # covers: C001M014B0002
+    _install_fake_tempdir(monkeypatch, tmp_path)
+    repo = uut.EphemeralArtifactRepository()
+
+    repo.release_reservation(FakeIndexMetadataKey(project="requests"))
+
+    assert repo._reservations == {}
+
+
+# noinspection PyTypeChecker
+def test_get_or_reserve_releases_when_allocation_fails(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # covers: C001M013B0005, C001M013B0003
+    _install_fake_tempdir(monkeypatch, tmp_path)
+    _patch_key_types(monkeypatch)
+    repo = uut.EphemeralArtifactRepository()
+    key = FakeIndexMetadataKey(project="requests", index_base="https://pypi.org/simple")
+
+    real_allocate = repo.allocate_destination_uri
+    failures = iter([OSError("mkdir failed")])
+
+    def _allocate(k: Any) -> str:
+        exc = next(failures, None)
+        if exc is not None:
+            raise exc
+        return real_allocate(k)
+
+    monkeypatch.setattr(repo, "allocate_destination_uri", _allocate)
+
+    with pytest.raises(OSError, match="mkdir failed"):
+        repo.get_or_reserve(key)
+    assert repo._reservations == {}
+
+    # A second caller for the same key must get the destination, not block.
+    results: list[Any] = []
+    caller = threading.Thread(target=lambda: results.append(repo.get_or_reserve(key)))
+    caller.start()
+    caller.join(timeout=5)
+
+    assert not caller.is_alive()
+    assert results == [real_allocate(key)]
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import hashlib
+import io
 import json
+import zipfile
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Iterable
@@ -19,13 +21,14 @@ import project_resolution_engine.internal.builtin_strategies as mod
 #    (Module ID: C000, Function ID: F001)
 # ------------------------------------------------------------------------------
 # C000F001B0001: if not value -> returns "_" (after strip yields empty)
-# C000F001B0002: else (value truthy after strip) -> returns _INVALID_SEGMENT_CHARS.sub("_", value) truncated to 160 chars
+# C000F001B0002: else (value truthy after strip) and not already safe -> returns _INVALID_SEGMENT_CHARS.sub("_", value) truncated to 160 chars
+# C000F001B0003: len(value) <= 160 and no invalid chars -> returns value unchanged
 #
 # ------------------------------------------------------------------------------
 # ## _short_hash(value: str) -> str
 #    (Module ID: C000, Function ID: F002)
 # ------------------------------------------------------------------------------
-# C000F002B0001: unconditionally -> returns hashlib.sha256(value.encode("utf-8")).hexdigest()[:16]
+# C000F002B0001: unconditionally -> returns hashlib.blake2b(value.encode("utf-8"), digest_size=8).hexdigest()
 #
 # ------------------------------------------------------------------------------
 # ## _url_basename(url: str) -> str | None
@@ -37,11 +40,19 @@ import project_resolution_engine.internal.builtin_strategies as mod
 # C000F003B0004: except Exception -> returns None
 #
 # ------------------------------------------------------------------------------
+# ## _file_uri_to_path(uri: str) -> Path | None
+#    (Module ID: C000, Function ID: F012)
+# ------------------------------------------------------------------------------
+# C000F012B0001: except ValueError (urlparse fails) -> returns None
+# C000F012B0002: if parsed.scheme != "file" or not parsed.path -> returns None
+# C000F012B0003: else -> returns Path(unquote(parsed.path))
+#
+# ------------------------------------------------------------------------------
 # ## _require_file_destination(destination_uri: str) -> Path
 #    (Module ID: C000, Function ID: F004)
 # ------------------------------------------------------------------------------
-# C000F004B0001: if parsed.scheme != "file" -> raises ValueError("Built-in strategies require file:// destination URIs, got: ...")
-# C000F004B0002: else (parsed.scheme == "file") -> returns Path(parsed.path)
+# C000F004B0001: if _file_uri_to_path(destination_uri) is None -> raises ValueError("Built-in strategies require file:// destination URIs, got: ...")
+# C000F004B0002: else -> returns the parsed Path
 #
 # ------------------------------------------------------------------------------
 # ## _ensure_parent_dir(path: Path) -> None
@@ -50,13 +61,6 @@ import project_resolution_engine.internal.builtin_strategies as mod
 # C000F005B0001: unconditionally -> calls path.parent.mkdir(parents=True, exist_ok=True)
 #
 # ------------------------------------------------------------------------------
-# ## _sha256_file(path: Path) -> str
-#    (Module ID: C000, Function ID: F006)
-# ------------------------------------------------------------------------------
-# C000F006B0001: for chunk in iter(lambda: f.read(1024 * 1024), b""): loop executes 0 times -> returns sha256 of empty content (hexdigest)
-# C000F006B0002: for chunk in iter(lambda: f.read(1024 * 1024), b""): loop executes >= 1 time -> returns sha256 of file bytes (hexdigest)
-#
-# ------------------------------------------------------------------------------
 # ## _simple_project_json_url(index_base: str, project: str) -> str
 #    (Module ID: C000, Function ID: F007)
 # ------------------------------------------------------------------------------
@@ -66,7 +70,13 @@ import project_resolution_engine.internal.builtin_strategies as mod
 # ## _write_canonical_json(path: Path, payload: Any) -> None
 #    (Module ID: C000, Function ID: F008)
 # ------------------------------------------------------------------------------
-# C000F008B0001: unconditionally -> writes json.dumps(payload, indent=2, sort_keys=True) + "\n" to path (utf-8)
+# C000F008B0001: unconditionally -> writes json.dumps(payload, indent=2, sort_keys=True) + "\n" to path (utf-8) and returns the written bytes
+#
+# ------------------------------------------------------------------------------
+# ## _HashingWriter.write(self, data: bytes) -> int
+#    (Class ID: C007, Method ID: M001)
+# ------------------------------------------------------------------------------
+# C007M001B0001: unconditionally -> updates the sha256 hasher and size, then writes data to the wrapped stream
 #
 # ------------------------------------------------------------------------------
 # ## _pep658_metadata_url(file_url: str) -> str
@@ -75,11 +85,17 @@ import project_resolution_engine.internal.builtin_strategies as mod
 # C000F009B0001: unconditionally -> returns f"{file_url}.metadata"
 #
 # ------------------------------------------------------------------------------
+# ## _extract_member(zf: zipfile.ZipFile, member: str, dest_path: Path) -> _HashingWriter
+#    (Module ID: C000, Function ID: F011)
+# ------------------------------------------------------------------------------
+# C000F011B0001: unconditionally -> streams zf.open(member) into dest_path through a _HashingWriter and returns it
+#
+# ------------------------------------------------------------------------------
 # ## _find_dist_info_metadata_path(zf: zipfile.ZipFile) -> str
 #    (Module ID: C000, Function ID: F010)
 # ------------------------------------------------------------------------------
-# C000F010B0001: if not candidates -> raises FileNotFoundError("Wheel does not contain any *.dist-info/METADATA entry")
-# C000F010B0002: else (candidates truthy) -> returns sorted(candidates)[0]
+# C000F010B0001: for info in zf.infolist(): no filename ends with ".dist-info/METADATA" -> raises FileNotFoundError("Wheel does not contain any *.dist-info/METADATA entry")
+# C000F010B0002: for info in zf.infolist(): >= 1 match -> returns the lexicographically smallest match
 #
 # ------------------------------------------------------------------------------
 # ## Pep691IndexMetadataHttpStrategy.resolve(self, *, key: IndexMetadataKey, destination_uri: str) -> ArtifactRecord | None
@@ -94,9 +110,11 @@ import project_resolution_engine.internal.builtin_strategies as mod
 # ------------------------------------------------------------------------------
 # C002M001B0001: if not isinstance(key, WheelKey) -> raises StrategyNotApplicable()
 # C002M001B0002: else (isinstance(key, WheelKey)) and if key.origin_uri is None -> raises ValueError("WheelKey must have origin_uri set")
-# C002M001B0003: else (isinstance(key, WheelKey)) and else (key.origin_uri is not None) and for chunk in resp.iter_content(...): loop executes 0 times -> writes no bytes; returns ArtifactRecord for (possibly empty) dest_path
+# C002M001B0003: else (isinstance(key, WheelKey)) and else (key.origin_uri is not None) and for chunk in resp.raw.stream(...): loop executes 0 times -> writes no bytes; returns ArtifactRecord for (possibly empty) dest_path
 # C002M001B0004: else (isinstance(key, WheelKey)) and else (key.origin_uri is not None) and for chunk ...: loop executes >= 1 time and if chunk -> writes chunk bytes; returns ArtifactRecord
 # C002M001B0005: else (isinstance(key, WheelKey)) and else (key.origin_uri is not None) and for chunk ...: loop executes >= 1 time and else (not chunk) -> skips write for that iteration; returns ArtifactRecord
+# C002M001B0006: resp.headers has Content-Encoding -> streams with decode_content=True
+# C002M001B0007: resp.headers has no Content-Encoding -> streams with decode_content=False
 #
 # ------------------------------------------------------------------------------
 # ## Pep658CoreMetadataHttpStrategy.resolve(self, *, key: CoreMetadataKey, destination_uri: str) -> ArtifactRecord | None
@@ -121,8 +139,8 @@ import project_resolution_engine.internal.builtin_strategies as mod
 # C005M001B0002: else (isinstance(key, WheelKey)) and if key.origin_uri is None -> raises ValueError("WheelKey must have origin_uri set")
 # C005M001B0003: else (isinstance(key, WheelKey)) and else (key.origin_uri is not None) and if src_parsed.scheme not in ("file", "") -> raises StrategyNotApplicable()
 # C005M001B0004: else (...) and else (src_parsed.scheme in ("file", "")) and if not src_path.exists() -> raises FileNotFoundError(str(src_path))
-# C005M001B0005: else (...) and else (src_path.exists()) and for chunk in iter(lambda: r.read(self.chunk_bytes), b""): loop executes 0 times -> writes no bytes; returns ArtifactRecord for (possibly empty) dest_path
-# C005M001B0006: else (...) and else (src_path.exists()) and for chunk ...: loop executes >= 1 time -> copies bytes; returns ArtifactRecord
+# C005M001B0005: else (...) and else (src_path.exists()) and shutil.copyfileobj(r, w, length=self.chunk_bytes) copies 0 bytes -> returns ArtifactRecord for (possibly empty) dest_path
+# C005M001B0006: else (...) and else (src_path.exists()) and shutil.copyfileobj(...) copies >= 1 byte -> returns ArtifactRecord
 #
 # ------------------------------------------------------------------------------
 # ## DirectUriCoreMetadataStrategy.resolve(self, *, key: CoreMetadataKey, destination_uri: str) -> ArtifactRecord | None
@@ -156,6 +174,8 @@ SAFE_SEGMENT_CASES = [
     (" a b*c ", "a_b_c", ["C000F001B0002"]),
     # covers: C000F001B0002 (truncate)
     ("x" * 999, "x" * 160, ["C000F001B0002"]),
+    # covers: C000F001B0003
+    ("  requests-2.31.0 ", "requests-2.31.0", ["C000F001B0003"]),
 ]
 
 URL_BASENAME_CASES = [
@@ -174,13 +194,6 @@ REQUIRE_FILE_DESTINATION_CASES = [
     ("file:///tmp/somewhere.txt", Path("/tmp/somewhere.txt"), None, ["C000F004B0002"]),
 ]
 
-SHA256_FILE_CASES = [
-    # covers: C000F006B0001
-    (b"", hashlib.sha256(b"").hexdigest(), ["C000F006B0001"]),
-    # covers: C000F006B0002
-    (b"abc", hashlib.sha256(b"abc").hexdigest(), ["C000F006B0002"]),
-]
-
 SIMPLE_PROJECT_JSON_URL_CASES = [
     # covers: C000F007B0001
     (
@@ -234,6 +247,17 @@ class _FakeCoreMetadataKey:
     file_url: str
 
 
+class _FakeRawStream:
+    def __init__(self, chunks: list[bytes]) -> None:
+        self._chunks = chunks
+        self.decode_content_calls: list[bool] = []
+
+    def stream(self, amt: int, decode_content: bool) -> Iterable[bytes]:
+        # amt is ignored; provided for signature compatibility
+        self.decode_content_calls.append(decode_content)
+        return iter(self._chunks)
+
+
 class _FakeRequestsResponse:
     def __init__(
         self,
@@ -242,12 +266,15 @@ class _FakeRequestsResponse:
         json_payload: Any | None = None,
         content: bytes = b"",
         iter_chunks: Iterable[bytes] = (),
+        headers: dict[str, str] | None = None,
     ) -> None:
         self.status_code = status_code
         self._json_payload = json_payload
         self.content = content
         self._iter_chunks = list(iter_chunks)
         self._raise_for_status_exc: Exception | None = None
+        self.headers: dict[str, str] = dict(headers or {})
+        self.raw = _FakeRawStream(self._iter_chunks)
 
     def set_raise_for_status_exc(self, exc: Exception) -> None:
         self._raise_for_status_exc = exc
@@ -259,10 +286,6 @@ class _FakeRequestsResponse:
     def json(self) -> Any:
         return self._json_payload
 
-    def iter_content(self, *, chunk_size: int) -> Iterable[bytes]:
-        # chunk_size is ignored; provided for signature compatibility
-        return iter(self._iter_chunks)
-
     def __enter__(self) -> "_FakeRequestsResponse":
         return self
 
@@ -286,9 +309,15 @@ class _FakeZipFile:
     def namelist(self) -> list[str]:
         return list(self._names)
 
+    def infolist(self) -> list[zipfile.ZipInfo]:
+        return [zipfile.ZipInfo(n) for n in self._names]
+
     def read(self, member: str) -> bytes:
         return self._blobs[member]
 
+    def open(self, member: str) -> io.BytesIO:
+        return io.BytesIO(self._blobs[member])
+
     def __enter__(self) -> "_FakeZipFile":
         return self
 
@@ -303,15 +332,16 @@ class _FakeZipFile:
 
 @pytest.mark.parametrize("value, expected, covers", SAFE_SEGMENT_CASES)
 def test_safe_segment(value: str, expected: str, covers: list[str]) -> None:
-    # covers: C000F001B0001 / C000F001B0002 (via matrix)
+    # covers: C000F001B0001 / C000F001B0002 / C000F001B0003 (via matrix)
     assert mod._safe_segment(value) == expected
 
 
-def test_short_hash_is_first_16_of_sha256_hex() -> None:
+def test_short_hash_is_16_hex_blake2b() -> None:
     # covers: C000F002B0001
     value = "hello"
-    expected = hashlib.sha256(value.encode("utf-8")).hexdigest()[:16]
+    expected = hashlib.blake2b(value.encode("utf-8"), digest_size=8).hexdigest()
     assert mod._short_hash(value) == expected
+    assert len(expected) == 16
 
 
 @pytest.mark.parametrize("url, expected, covers", URL_BASENAME_CASES)
@@ -358,16 +388,6 @@ def test_ensure_parent_dir_creates_parent(tmp_path: Path) -> None:
     assert target.parent.is_dir()
 
 
-@pytest.mark.parametrize("payload_bytes, expected_hex, covers", SHA256_FILE_CASES)
-def test_sha256_file(
-    tmp_path: Path, payload_bytes: bytes, expected_hex: str, covers: list[str]
-) -> None:
-    # covers: C000F006B0001 / C000F006B0002 (via matrix)
-    p = tmp_path / "x.bin"
-    p.write_bytes(payload_bytes)
-    assert mod._sha256_file(p) == expected_hex
-
-
 @pytest.mark.parametrize(
     "index_base, project, expected, covers", SIMPLE_PROJECT_JSON_URL_CASES
 )
@@ -382,11 +402,51 @@ def test_write_canonical_json_is_deterministic(tmp_path: Path) -> None:
     # covers: C000F008B0001
     p = tmp_path / "out.json"
     payload = {"b": 2, "a": 1}
-    mod._write_canonical_json(p, payload)
+    data = mod._write_canonical_json(p, payload)
     assert (
         p.read_text(encoding="utf-8")
         == json.dumps(payload, indent=2, sort_keys=True) + "\n"
     )
+    assert data == p.read_bytes()
+
+
+def test_hashing_writer_tracks_digest_and_size(tmp_path: Path) -> None:
+    # covers: C007M001B0001
+    p = tmp_path / "out.bin"
+    with p.open("wb") as f:
+        w = mod._HashingWriter(f)
+        w.write(b"ab")
+        w.write(b"c")
+    assert p.read_bytes() == b"abc"
+    assert w.size == 3
+    assert w.hexdigest() == hashlib.sha256(b"abc").hexdigest()
+
+
+def test_extract_member_streams_and_hashes(tmp_path: Path) -> None:
+    # covers: C000F011B0001
+    zf = _FakeZipFile()
+    zf.seed(
+        names=["a.dist-info/METADATA"], blobs={"a.dist-info/METADATA": b"Name: a\n"}
+    )
+    dest = tmp_path / "METADATA"
+    w = mod._extract_member(zf, "a.dist-info/METADATA", dest)  # type: ignore[arg-type]
+    assert dest.read_bytes() == b"Name: a\n"
+    assert w.size == len(b"Name: a\n")
+    assert w.hexdigest() == hashlib.sha256(b"Name: a\n").hexdigest()
+
+
+@pytest.mark.parametrize(
+    "uri, expected, covers",
+    [
+        ("file://[bad", None, ["C000F012B0001"]),
+        ("https://example.com/x.whl", None, ["C000F012B0002"]),
+        ("file://host-only", None, ["C000F012B0002"]),
+        ("file:///tmp/a%20b.whl", Path("/tmp/a b.whl"), ["C000F012B0003"]),
+    ],
+)
+def test_file_uri_to_path(uri: str, expected: Path | None, covers: list[str]) -> None:
+    # covers: C000F012B0001 / C000F012B0002 / C000F012B0003 (via matrix)
+    assert mod._file_uri_to_path(uri) == expected
 
 
 @pytest.mark.parametrize("file_url, expected, covers", PEP658_URL_CASES)
@@ -398,8 +458,8 @@ def test_pep658_metadata_url(file_url: str, expected: str, covers: list[str]) ->
 def test_find_dist_info_metadata_path_raises_when_missing() -> None:
     # covers: C000F010B0001
     class Z:
-        def namelist(self) -> list[str]:
-            return ["a.txt", "pkg.dist-info/RECORD"]
+        def infolist(self) -> list[zipfile.ZipInfo]:
+            return [zipfile.ZipInfo(n) for n in ["a.txt", "pkg.dist-info/RECORD"]]
 
     with pytest.raises(FileNotFoundError) as ei:
         mod._find_dist_info_metadata_path(Z())  # type: ignore[arg-type]
@@ -409,10 +469,10 @@ def test_find_dist_info_metadata_path_raises_when_missing() -> None:
 def test_find_dist_info_metadata_path_returns_sorted_first() -> None:
     # covers: C000F010B0002
     class Z:
-        def namelist(self) -> list[str]:
+        def infolist(self) -> list[zipfile.ZipInfo]:
             return [
-                "b.dist-info/METADATA",
-                "a.dist-info/METADATA",
+                zipfile.ZipInfo("b.dist-info/METADATA"),
+                zipfile.ZipInfo("a.dist-info/METADATA"),
             ]
 
     assert mod._find_dist_info_metadata_path(Z()) == "a.dist-info/METADATA"  # type: ignore[arg-type]
@@ -448,7 +508,7 @@ def test_pep691_resolve_success(
         captured["timeout"] = timeout
         return _FakeRequestsResponse(json_payload={"hello": "world"}, content=b"")
 
-    monkeypatch.setattr(mod.requests, "get", fake_get)
+    monkeypatch.setattr(mod._SESSION, "get", fake_get)
 
     dest_path = tmp_path / "out" / "index.json"
     key = _FakeIndexMetadataKey(
@@ -472,7 +532,7 @@ def test_pep691_resolve_success(
     assert rec.destination_uri == dest_path.as_uri()
     assert rec.origin_uri == "https://pypi.org/simple/requests/"
     assert rec.size == dest_path.stat().st_size
-    assert rec.content_sha256 == mod._sha256_file(dest_path)
+    assert rec.content_sha256 == hashlib.sha256(dest_path.read_bytes()).hexdigest()
     assert rec.content_hashes == {"sha256": rec.content_sha256}
 
 
@@ -496,6 +556,38 @@ def test_http_wheel_resolve_origin_uri_required(
     assert "origin_uri" in str(ei.value)
 
 
+@pytest.mark.parametrize(
+    "headers, expect_decode, covers",
+    [
+        ({"Content-Encoding": "gzip"}, True, ["C002M001B0006"]),
+        ({}, False, ["C002M001B0007"]),
+    ],
+)
+def test_http_wheel_resolve_decodes_only_when_encoded(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    headers: dict[str, str],
+    expect_decode: bool,
+    covers: list[str],
+) -> None:
+    # covers: C002M001B0006 / C002M001B0007 (via matrix rows)
+    monkeypatch.setattr(mod, "WheelKey", _FakeWheelKey)
+    resp = _FakeRequestsResponse(iter_chunks=[b"abc"], headers=headers)
+    monkeypatch.setattr(mod._SESSION, "get", lambda *a, **k: resp)
+
+    key = _FakeWheelKey(
+        name="pkg",
+        version="1.0",
+        tag="py3-none-any",
+        origin_uri="https://example.com/pkg.whl",
+    )
+    dest_path = tmp_path / "pkg.whl"
+    mod.HttpWheelFileStrategy().resolve(key=key, destination_uri=dest_path.as_uri())
+
+    assert resp.raw.decode_content_calls == [expect_decode]
+    assert dest_path.read_bytes() == b"abc"
+
+
 @pytest.mark.parametrize(
     "iter_chunks, covers",
     [
@@ -525,7 +617,7 @@ def test_http_wheel_resolve_streaming(
         captured["stream"] = stream
         return _FakeRequestsResponse(iter_chunks=iter_chunks)
 
-    monkeypatch.setattr(mod.requests, "get", fake_get)
+    monkeypatch.setattr(mod._SESSION, "get", fake_get)
 
     strat = mod.HttpWheelFileStrategy(
         user_agent="ua-wheel", timeout_s=9.0, chunk_bytes=3
@@ -551,7 +643,7 @@ def test_http_wheel_resolve_streaming(
     assert rec.origin_uri == "https://example.com/pkg.whl"
     assert rec.destination_uri == dest_path.as_uri()
     assert rec.size == dest_path.stat().st_size
-    assert rec.content_sha256 == mod._sha256_file(dest_path)
+    assert rec.content_sha256 == hashlib.sha256(dest_path.read_bytes()).hexdigest()
 
 
 def test_pep658_resolve_not_applicable_wrong_type(tmp_path: Path) -> None:
@@ -570,7 +662,7 @@ def test_pep658_resolve_404_not_applicable(
     def fake_get(url: str, headers: dict[str, str], timeout: float):
         return _FakeRequestsResponse(status_code=404)
 
-    monkeypatch.setattr(mod.requests, "get", fake_get)
+    monkeypatch.setattr(mod._SESSION, "get", fake_get)
 
     strat = mod.Pep658CoreMetadataHttpStrategy()
     key = _FakeCoreMetadataKey(
@@ -592,7 +684,7 @@ def test_pep658_resolve_success(
     def fake_get(url: str, headers: dict[str, str], timeout: float):
         return _FakeRequestsResponse(status_code=200, content=content)
 
-    monkeypatch.setattr(mod.requests, "get", fake_get)
+    monkeypatch.setattr(mod._SESSION, "get", fake_get)
 
     strat = mod.Pep658CoreMetadataHttpStrategy()
     key = _FakeCoreMetadataKey(
@@ -608,7 +700,7 @@ def test_pep658_resolve_success(
     assert rec.origin_uri == "https://files/x.whl.metadata"
     assert rec.destination_uri == dest_path.as_uri()
     assert rec.size == dest_path.stat().st_size
-    assert rec.content_sha256 == mod._sha256_file(dest_path)
+    assert rec.content_sha256 == hashlib.sha256(dest_path.read_bytes()).hexdigest()
 
 
 def test_wheel_extracted_metadata_not_applicable_wrong_type(tmp_path: Path) -> None:
@@ -678,7 +770,7 @@ def test_wheel_extracted_metadata_success(
     assert rec.origin_uri == "https://files/pkg.whl"
     assert rec.destination_uri == dest_path.as_uri()
     assert rec.size == dest_path.stat().st_size
-    assert rec.content_sha256 == mod._sha256_file(dest_path)
+    assert rec.content_sha256 == hashlib.sha256(dest_path.read_bytes()).hexdigest()
 
 
 def test_direct_uri_wheel_not_applicable_wrong_type(tmp_path: Path) -> None:
@@ -763,7 +855,7 @@ def test_direct_uri_wheel_copy(
     assert rec.origin_uri == str(src)
     assert rec.destination_uri == dest.as_uri()
     assert rec.size == dest.stat().st_size
-    assert rec.content_sha256 == mod._sha256_file(dest)
+    assert rec.content_sha256 == hashlib.sha256(dest.read_bytes()).hexdigest()
 
 
 def test_direct_uri_core_metadata_wrong_type_not_applicable(tmp_path: Path) -> None:
@@ -856,4 +948,4 @@ def test_direct_uri_core_metadata_success(
     assert rec.origin_uri == str(wheel_path)
     assert rec.destination_uri == dest_path.as_uri()
     assert rec.size == dest_path.stat().st_size
-    assert rec.content_sha256 == mod._sha256_file(dest_path)
+    assert rec.content_sha256 == hashlib.sha256(dest_path.read_bytes()).hexdigest()
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import sys
+
 import pytest
 
+from project_resolution_engine.internal import builtin_strategies
 from project_resolution_engine.internal import builtin_strategy_configs as uut
 
 # ==============================================================================
@@ -12,167 +15,253 @@ from project_resolution_engine.internal import builtin_strategy_configs as uut
 # ## _unknown_keys(cfg, allowed, *, ctx)
 #    (Module ID: C000, Function ID: F001)
 # ------------------------------------------------------------------------------
-# C000F001B0001: if extra -> raise StrategyConfigError (message contains f"{ctx}: unknown config keys:" and the unknown keys)
-# C000F001B0002: else (not extra) -> return None
+# C000F001B0001: cfg.keys() not a subset of allowed -> raise StrategyConfigError (message contains f"{ctx}: unknown config keys:" and the sorted cfg.keys() - allowed)
+# C000F001B0002: cfg.keys() <= allowed -> return None
 #
 # ------------------------------------------------------------------------------
-# ## _opt_str(cfg, key)
+# ## _opt(cfg, key, kind)
 #    (Module ID: C000, Function ID: F002)
 # ------------------------------------------------------------------------------
-# C000F002B0001: if key not in cfg -> return None
-# C000F002B0002: if key in cfg and isinstance(v, str) -> return v
-# C000F002B0003: if key in cfg and not isinstance(v, str) -> raise StrategyConfigError (message contains f"{key}: expected str, got {type(v).__name__}")
-#
-# ------------------------------------------------------------------------------
-# ## _opt_int(cfg, key)
-#    (Module ID: C000, Function ID: F003)
-# ------------------------------------------------------------------------------
-# C000F003B0001: if key not in cfg -> return None
-# C000F003B0002: if key in cfg and isinstance(v, int) -> return v
-# C000F003B0003: if key in cfg and not isinstance(v, int) -> raise StrategyConfigError (message contains f"{key}: expected int, got {type(v).__name__}")
-#
-# ------------------------------------------------------------------------------
-# ## _opt_float(cfg, key)
-#    (Module ID: C000, Function ID: F004)
-# ------------------------------------------------------------------------------
-# C000F004B0001: if key not in cfg -> return None
-# C000F004B0002: if key in cfg and isinstance(v, int) -> return float(v)
-# C000F004B0003: if key in cfg and isinstance(v, float) -> return v
-# C000F004B0004: if key in cfg and not isinstance(v, float) and not isinstance(v, int) -> raise StrategyConfigError (message contains f"{key}: expected float, got {type(v).__name__}")
+# C000F002B0001: if key not in cfg (v is _MISSING) -> return None
+# C000F002B0002: if type(v) not in _TYPES[kind] and not isinstance(v, _TYPES[kind]) -> raise StrategyConfigError (message contains f"{key}: expected {kind}, got {type(v).__name__}")
+# C000F002B0003: if kind == _FLOAT and type(v) is not float -> return float(v)
+# C000F002B0004: else -> return v
 #
 # ------------------------------------------------------------------------------
 # ## _plan_single(*, strategy_name, strategy_cls, config, ctor_kwargs, depends_on=())
 #    (Module ID: C000, Function ID: F005)
 # ------------------------------------------------------------------------------
-# C000F005B0001: str(config.get("instance_id") or "") is truthy -> instance_id == that string
-# C000F005B0002: str(config.get("instance_id") or "") is falsy -> instance_id == strategy_name
-# C000F005B0003: "precedence" in config -> precedence == int(config.get("precedence", ...)) (i.e., int(config["precedence"]))
-# C000F005B0004: "precedence" not in config -> precedence == int(getattr(strategy_cls, "precedence", 100))
-# C000F005B0005: int(config.get("precedence", getattr(strategy_cls, "precedence", 100))) raises (TypeError/ValueError) -> exception propagates
+# C000F005B0001: config.get("instance_id") is a non-empty str -> instance_id == sys.intern(that value)
+# C000F005B0002: config.get("instance_id") is "" or None -> instance_id == strategy_name
+# C000F005B0003: "precedence" in config -> p = config["precedence"]
+# C000F005B0004: "precedence" not in config -> p = _default_precedence(strategy_cls)
+# C000F005B0005: int(p) raises (TypeError/ValueError) -> exception propagates
 # C000F005B0006: "instance_id" not in ctor_kwargs -> full_kwargs["instance_id"] set to computed instance_id
 # C000F005B0007: "instance_id" in ctor_kwargs -> full_kwargs["instance_id"] remains ctor_kwargs["instance_id"]
 # C000F005B0008: "precedence" not in ctor_kwargs -> full_kwargs["precedence"] set to computed precedence
 # C000F005B0009: "precedence" in ctor_kwargs -> full_kwargs["precedence"] remains ctor_kwargs["precedence"]
-# C000F005B0010: return [StrategyPlan(...)] -> returns list length 1; plan.instance_id==instance_id; plan.precedence==precedence; plan.depends_on==depends_on; plan.ctor_kwargs==full_kwargs
+# C000F005B0010: return (StrategyPlan(...),) -> returns tuple length 1; plan.instance_id==instance_id; plan.precedence==precedence; plan.depends_on==depends_on; plan.ctor_kwargs==full_kwargs
+# C000F005B0011: "instance_id" and "precedence" both in ctor_kwargs -> full_kwargs is ctor_kwargs (no copy)
+# C000F005B0012: type(p) is int -> precedence = p (no int() call)
+# C000F005B0013: type(p) is not int -> precedence = int(p)
+# C000F005B0014: config.get("instance_id") is neither str nor None -> raise StrategyConfigError (message contains "instance_id: expected str")
+#
+# ------------------------------------------------------------------------------
+# ## _ctor_from_schema(config, schema)
+#    (Module ID: C000, Function ID: F006)
+# ------------------------------------------------------------------------------
+# C000F006B0001: loop over schema 0 iterations -> return {}
+# C000F006B0002: _opt(config, key, kind) is None (key absent) -> entry skipped
+# C000F006B0003: _opt(config, key, kind) is not None -> ctor[ctor_name] = v
+# C000F006B0004: _opt(...) raises StrategyConfigError -> exception propagates
+#
+# ------------------------------------------------------------------------------
+# ## _wheel_ref(wheel_sid)  [lru_cache]
+#    (Module ID: C000, Function ID: F007)
+# ------------------------------------------------------------------------------
+# C000F007B0001: cache miss -> build StrategyRef(wheel_sid, wheel_sid); return (ref, ref.normalized_instance_id())
+# C000F007B0002: cache hit -> return the same (ref, id) tuple object
+#
+# ------------------------------------------------------------------------------
+# ## _default_precedence(strategy_cls)  [lru_cache]
+#    (Module ID: C000, Function ID: F008)
+# ------------------------------------------------------------------------------
+# C000F008B0001: strategy_cls has precedence -> return strategy_cls.precedence
+# C000F008B0002: strategy_cls lacks precedence -> return 100
+#
+# ------------------------------------------------------------------------------
+# ## _reserved_only_plan(strategy_cls, strategy_name, instance_id, precedence)  [lru_cache]
+#    (Module ID: C000, Function ID: F009)
+# ------------------------------------------------------------------------------
+# C000F009B0001: instance_id is _MISSING -> omitted from the config passed to _plan_single
+# C000F009B0002: instance_id is not _MISSING -> passed through
+# C000F009B0003: precedence is _MISSING -> omitted (class default applies)
+# C000F009B0004: precedence is not _MISSING -> passed through
+# C000F009B0005: return 1-tuple whose plan.ctor_kwargs is a read-only MappingProxyType
+#
+# ------------------------------------------------------------------------------
+# ## _plan_reserved_only(*, strategy_name, strategy_cls, config)
+#    (Module ID: C000, Function ID: F010)
+# ------------------------------------------------------------------------------
+# C000F010B0001: instance_id absent/str and precedence absent/int -> return cached _reserved_only_plan(...)
+# C000F010B0002: otherwise -> return _plan_single(..., ctor_kwargs={}) (errors propagate)
+#
+# ------------------------------------------------------------------------------
+# ## _schema_from(shape, *, skip=frozenset())
+#    (Module ID: C000, Function ID: F011)
+# ------------------------------------------------------------------------------
+# C000F011B0001: key in _RESERVED_KEYS -> excluded
+# C000F011B0002: key in skip -> excluded
+# C000F011B0003: otherwise -> (key, _KIND_BY_TYPE[annotation], key) included
+#
+# ------------------------------------------------------------------------------
+# ## _allowed_keys(shape)
+#    (Module ID: C000, Function ID: F012)
+# ------------------------------------------------------------------------------
+# C000F012B0001: return frozenset(shape.__required_keys__ | shape.__optional_keys__)
+#
+# ------------------------------------------------------------------------------
+# ## _config_spec(name, shape, defaults, *, skip=frozenset(), post=None)
+#    (Module ID: C000, Function ID: F013)
+# ------------------------------------------------------------------------------
+# C000F013B0001: return _ConfigSpec with read-only defaults copy, _allowed_keys(shape), _schema_from(shape, skip=skip), post
+#
+# ------------------------------------------------------------------------------
+# ## _inject_wheel_ref(config, ctor)
+#    (Module ID: C000, Function ID: F014)
+# ------------------------------------------------------------------------------
+# C000F014B0001: _opt(config, "wheel_strategy_id", _STR) truthy -> wheel_sid == that value
+# C000F014B0002: _opt(...) returns None or "" -> wheel_sid == "wheel_http"
+# C000F014B0003: ctor["wheel_strategy"] = cached ref; return (normalized id,)
+#
+# ------------------------------------------------------------------------------
+# ## _plan_from_spec(spec, strategy_cls, config)
+#    (Module ID: C000, Function ID: F015)
+# ------------------------------------------------------------------------------
+# C000F015B0001: unknown keys -> raise StrategyConfigError (from _unknown_keys)
+# C000F015B0002: spec.post is not None -> depends_on = spec.post(config, ctor); return _plan_single(...)
+# C000F015B0003: spec.post is None and ctor is empty -> return _plan_reserved_only(...)
+# C000F015B0004: spec.post is None and ctor is non-empty -> return _plan_single(..., depends_on=())
+#
+# ------------------------------------------------------------------------------
+# ## _BuiltinStrategyConfig.__init_subclass__(cls, **kwargs)
+#    (Class ID: C001, Method ID: M001)
+# ------------------------------------------------------------------------------
+# C001M001B0001: cls._SPEC = _config_spec(cls.strategy_name, cls.SHAPE, cls.DEFAULTS, skip=cls.SKIP, post=cls.POST)
+#
+# ------------------------------------------------------------------------------
+# ## _BuiltinStrategyConfig.defaults(cls) / plan(cls, *, strategy_cls, config)
+#    (Class ID: C001, Method IDs: M002, M003)
+# ------------------------------------------------------------------------------
+# C001M002B0001: return cls._SPEC.defaults
+# C001M003B0001: return _plan_from_spec(cls._SPEC, strategy_cls, config)
+# C001M004B0001: plan_all over 0 configs -> return []
+# C001M004B0002: plan_all over >= 1 configs -> plans from _plan_from_spec(cls._SPEC, ...) in config order
 #
 # ------------------------------------------------------------------------------
 # ## Pep691IndexMetadataHttpStrategyConfig.defaults(cls)
 #    (Class ID: C002, Method ID: M001)
 # ------------------------------------------------------------------------------
-# C002M001B0001: return mapping literal -> returns {"timeout_s": 30.0, "user_agent": "project-resolution-engine/0", "precedence": 50}
+# C002M001B0001: return cls._SPEC.defaults (read-only MappingProxyType, same object every call) -> equals {"timeout_s": 30.0, "user_agent": "project-resolution-engine/0", "precedence": 50}
 #
 # ------------------------------------------------------------------------------
 # ## Pep691IndexMetadataHttpStrategyConfig.plan(cls, *, strategy_cls, config)
 #    (Class ID: C002, Method ID: M002)
 # ------------------------------------------------------------------------------
-# C002M002B0001: extra config keys beyond (_RESERVED_KEYS | {"timeout_s", "user_agent"}) -> raise StrategyConfigError (from _unknown_keys)
+# (delegates to _plan_from_spec(cls._SPEC, strategy_cls, config); IDs below name the spec-driven paths)
+# C002M002B0001: extra config keys beyond cls._ALLOWED -> raise StrategyConfigError (from _unknown_keys)
 # C002M002B0002: no extra config keys -> continue (ctor starts as {})
-# C002M002B0003: (v_timeout := _opt_float(config, "timeout_s")) is not None -> ctor["timeout_s"] set; returned plan.ctor_kwargs includes "timeout_s"
-# C002M002B0004: (v_timeout := _opt_float(config, "timeout_s")) is None -> ctor has no "timeout_s"
-# C002M002B0005: _opt_float(config, "timeout_s") raises StrategyConfigError -> exception propagates
-# C002M002B0006: (v_agent := _opt_str(config, "user_agent")) is not None -> ctor["user_agent"] set; returned plan.ctor_kwargs includes "user_agent"
-# C002M002B0007: (v_agent := _opt_str(config, "user_agent")) is None -> ctor has no "user_agent"
-# C002M002B0008: _opt_str(config, "user_agent") raises StrategyConfigError -> exception propagates
-# C002M002B0009: _plan_single(...) succeeds -> returns list length 1 with StrategyPlan.strategy_name == cls.strategy_name
+# C002M002B0003: "timeout_s" in config (cls._SCHEMA, "float") -> ctor["timeout_s"] set; returned plan.ctor_kwargs includes "timeout_s"
+# C002M002B0004: "timeout_s" not in config -> ctor has no "timeout_s"
+# C002M002B0005: _opt(config, "timeout_s", _FLOAT) raises StrategyConfigError -> exception propagates
+# C002M002B0006: "user_agent" in config (cls._SCHEMA, "str") -> ctor["user_agent"] set; returned plan.ctor_kwargs includes "user_agent"
+# C002M002B0007: "user_agent" not in config -> ctor has no "user_agent"
+# C002M002B0008: _opt(config, "user_agent", _STR) raises StrategyConfigError -> exception propagates
+# C002M002B0009: _plan_single(...) succeeds -> returns a 1-tuple with StrategyPlan.strategy_name == cls.strategy_name
 # C002M002B0010: _plan_single(...) raises (TypeError/ValueError from precedence int conversion) -> exception propagates
 #
 # ------------------------------------------------------------------------------
 # ## HttpWheelFileStrategyConfig.defaults(cls)
 #    (Class ID: C003, Method ID: M001)
 # ------------------------------------------------------------------------------
-# C003M001B0001: return mapping literal -> returns {"timeout_s": 120.0, "user_agent": "project-resolution-engine/0", "chunk_bytes": 1024 * 1024, "precedence": 50}
+# C003M001B0001: return cls._SPEC.defaults (read-only MappingProxyType, same object every call) -> equals {"timeout_s": 120.0, "user_agent": "project-resolution-engine/0", "chunk_bytes": 4 * 1024 * 1024, "precedence": 50}
 #
 # ------------------------------------------------------------------------------
 # ## HttpWheelFileStrategyConfig.plan(cls, *, strategy_cls, config)
 #    (Class ID: C003, Method ID: M002)
 # ------------------------------------------------------------------------------
-# C003M002B0001: extra config keys beyond (_RESERVED_KEYS | {"timeout_s", "user_agent", "chunk_bytes"}) -> raise StrategyConfigError (from _unknown_keys)
+# (delegates to _plan_from_spec(cls._SPEC, strategy_cls, config); IDs below name the spec-driven paths)
+# C003M002B0001: extra config keys beyond cls._ALLOWED -> raise StrategyConfigError (from _unknown_keys)
 # C003M002B0002: no extra config keys -> continue (ctor starts as {})
-# C003M002B0003: (v_timeout := _opt_float(config, "timeout_s")) is not None -> ctor["timeout_s"] set
-# C003M002B0004: (v_timeout := _opt_float(config, "timeout_s")) is None -> ctor has no "timeout_s"
-# C003M002B0005: _opt_float(config, "timeout_s") raises StrategyConfigError -> exception propagates
-# C003M002B0006: (v_agent := _opt_str(config, "user_agent")) is not None -> ctor["user_agent"] set
-# C003M002B0007: (v_agent := _opt_str(config, "user_agent")) is None -> ctor has no "user_agent"
-# C003M002B0008: _opt_str(config, "user_agent") raises StrategyConfigError -> exception propagates
-# C003M002B0009: (v_chunk_bytes := _opt_int(config, "chunk_bytes")) is not None -> ctor["chunk_bytes"] set
-# C003M002B0010: (v_chunk_bytes := _opt_int(config, "chunk_bytes")) is None -> ctor has no "chunk_bytes"
-# C003M002B0011: _opt_int(config, "chunk_bytes") raises StrategyConfigError -> exception propagates
-# C003M002B0012: _plan_single(...) succeeds -> returns list length 1 with StrategyPlan.strategy_name == cls.strategy_name
+# C003M002B0003: "timeout_s" in config (cls._SCHEMA, "float") -> ctor["timeout_s"] set
+# C003M002B0004: "timeout_s" not in config -> ctor has no "timeout_s"
+# C003M002B0005: _opt(config, "timeout_s", _FLOAT) raises StrategyConfigError -> exception propagates
+# C003M002B0006: "user_agent" in config (cls._SCHEMA, "str") -> ctor["user_agent"] set
+# C003M002B0007: "user_agent" not in config -> ctor has no "user_agent"
+# C003M002B0008: _opt(config, "user_agent", _STR) raises StrategyConfigError -> exception propagates
+# C003M002B0009: "chunk_bytes" in config (cls._SCHEMA, "int") -> ctor["chunk_bytes"] set
+# C003M002B0010: "chunk_bytes" not in config -> ctor has no "chunk_bytes"
+# C003M002B0011: _opt(config, "chunk_bytes", _INT) raises StrategyConfigError -> exception propagates
+# C003M002B0012: _plan_single(...) succeeds -> returns a 1-tuple with StrategyPlan.strategy_name == cls.strategy_name
 # C003M002B0013: _plan_single(...) raises (TypeError/ValueError from precedence int conversion) -> exception propagates
 #
 # ------------------------------------------------------------------------------
 # ## Pep658CoreMetadataHttpStrategyConfig.defaults(cls)
 #    (Class ID: C004, Method ID: M001)
 # ------------------------------------------------------------------------------
-# C004M001B0001: return mapping literal -> returns {"timeout_s": 30.0, "user_agent": "project-resolution-engine/0", "precedence": 50}
+# C004M001B0001: return cls._SPEC.defaults (read-only MappingProxyType, same object every call) -> equals {"timeout_s": 30.0, "user_agent": "project-resolution-engine/0", "precedence": 50}
 #
 # ------------------------------------------------------------------------------
 # ## Pep658CoreMetadataHttpStrategyConfig.plan(cls, *, strategy_cls, config)
 #    (Class ID: C004, Method ID: M002)
 # ------------------------------------------------------------------------------
-# C004M002B0001: extra config keys beyond (_RESERVED_KEYS | {"timeout_s", "user_agent"}) -> raise StrategyConfigError (from _unknown_keys)
+# (delegates to _plan_from_spec(cls._SPEC, strategy_cls, config); IDs below name the spec-driven paths)
+# C004M002B0001: extra config keys beyond cls._ALLOWED -> raise StrategyConfigError (from _unknown_keys)
 # C004M002B0002: no extra config keys -> continue (ctor starts as {})
-# C004M002B0003: (v_timeout := _opt_float(config, "timeout_s")) is not None -> ctor["timeout_s"] set
-# C004M002B0004: (v_timeout := _opt_float(config, "timeout_s")) is None -> ctor has no "timeout_s"
-# C004M002B0005: _opt_float(config, "timeout_s") raises StrategyConfigError -> exception propagates
-# C004M002B0006: (v_agent := _opt_str(config, "user_agent")) is not None -> ctor["user_agent"] set
-# C004M002B0007: (v_agent := _opt_str(config, "user_agent")) is None -> ctor has no "user_agent"
-# C004M002B0008: _opt_str(config, "user_agent") raises StrategyConfigError -> exception propagates
-# C004M002B0009: _plan_single(...) succeeds -> returns list length 1 with StrategyPlan.strategy_name == cls.strategy_name
+# C004M002B0003: "timeout_s" in config (cls._SCHEMA, "float") -> ctor["timeout_s"] set
+# C004M002B0004: "timeout_s" not in config -> ctor has no "timeout_s"
+# C004M002B0005: _opt(config, "timeout_s", _FLOAT) raises StrategyConfigError -> exception propagates
+# C004M002B0006: "user_agent" in config (cls._SCHEMA, "str") -> ctor["user_agent"] set
+# C004M002B0007: "user_agent" not in config -> ctor has no "user_agent"
+# C004M002B0008: _opt(config, "user_agent", _STR) raises StrategyConfigError -> exception propagates
+# C004M002B0009: _plan_single(...) succeeds -> returns a 1-tuple with StrategyPlan.strategy_name == cls.strategy_name
 # C004M002B0010: _plan_single(...) raises (TypeError/ValueError from precedence int conversion) -> exception propagates
 #
 # ------------------------------------------------------------------------------
 # ## WheelExtractedCoreMetadataStrategyConfig.defaults(cls)
 #    (Class ID: C005, Method ID: M001)
 # ------------------------------------------------------------------------------
-# C005M001B0001: return mapping literal -> returns {"wheel_strategy_id": "wheel_http", "wheel_timeout_s": 120.0, "precedence": 90}
+# C005M001B0001: return cls._SPEC.defaults (read-only MappingProxyType, same object every call) -> equals {"wheel_strategy_id": "wheel_http", "wheel_timeout_s": 120.0, "precedence": 90}
 #
 # ------------------------------------------------------------------------------
 # ## WheelExtractedCoreMetadataStrategyConfig.plan(cls, *, strategy_cls, config)
 #    (Class ID: C005, Method ID: M002)
 # ------------------------------------------------------------------------------
-# C005M002B0001: extra config keys beyond (_RESERVED_KEYS | {"wheel_strategy_id", "wheel_timeout_s"}) -> raise StrategyConfigError (from _unknown_keys)
+# (delegates to _plan_from_spec(cls._SPEC, strategy_cls, config); IDs below name the spec-driven paths)
+# C005M002B0001: extra config keys beyond cls._ALLOWED -> raise StrategyConfigError (from _unknown_keys)
 # C005M002B0002: no extra config keys -> continue
-# C005M002B0003: _opt_str(config, "wheel_strategy_id") returns a truthy str -> wheel_sid == that value; wheel_ref uses that id
-# C005M002B0004: _opt_str(config, "wheel_strategy_id") returns None or "" -> wheel_sid == "wheel_http"; wheel_ref uses "wheel_http"
-# C005M002B0005: _opt_str(config, "wheel_strategy_id") raises StrategyConfigError -> exception propagates
-# C005M002B0006: (v := _opt_float(config, "wheel_timeout_s")) is not None -> ctor["wheel_timeout_s"] set
-# C005M002B0007: (v := _opt_float(config, "wheel_timeout_s")) is None -> ctor has no "wheel_timeout_s"
-# C005M002B0008: _opt_float(config, "wheel_timeout_s") raises StrategyConfigError -> exception propagates
-# C005M002B0009: _plan_single(..., depends_on=(wheel_ref.normalized_instance_id(),)) succeeds -> returns list length 1; plan.depends_on contains that single normalized id
+# C005M002B0003: _opt(config, "wheel_strategy_id", _STR) returns a truthy str -> wheel_sid == that value; wheel_ref uses that id
+# C005M002B0004: _opt(config, "wheel_strategy_id", _STR) returns None or "" -> wheel_sid == "wheel_http"; wheel_ref uses "wheel_http"
+# C005M002B0005: _opt(config, "wheel_strategy_id", _STR) raises StrategyConfigError -> exception propagates
+# C005M002B0006: "wheel_timeout_s" in config (cls._SCHEMA, "float") -> ctor["wheel_timeout_s"] set
+# C005M002B0007: "wheel_timeout_s" not in config -> ctor has no "wheel_timeout_s"
+# C005M002B0008: _opt(config, "wheel_timeout_s", _FLOAT) raises StrategyConfigError -> exception propagates
+# C005M002B0009: _plan_single(..., depends_on=(wheel_dep_id,)) with (wheel_ref, wheel_dep_id) = _wheel_ref(wheel_sid) succeeds -> returns a 1-tuple; plan.depends_on contains that single normalized id
 # C005M002B0010: _plan_single(...) raises (TypeError/ValueError from precedence int conversion) -> exception propagates
 #
 # ------------------------------------------------------------------------------
 # ## DirectUriWheelFileStrategyConfig.defaults(cls)
 #    (Class ID: C006, Method ID: M001)
 # ------------------------------------------------------------------------------
-# C006M001B0001: return mapping literal -> returns {"chunk_bytes": 1024 * 1024, "precedence": 40}
+# C006M001B0001: return cls._SPEC.defaults (read-only MappingProxyType, same object every call) -> equals {"chunk_bytes": 1024 * 1024, "precedence": 40}
 #
 # ------------------------------------------------------------------------------
 # ## DirectUriWheelFileStrategyConfig.plan(cls, *, strategy_cls, config)
 #    (Class ID: C006, Method ID: M002)
 # ------------------------------------------------------------------------------
-# C006M002B0001: extra config keys beyond (_RESERVED_KEYS | {"chunk_bytes"}) -> raise StrategyConfigError (from _unknown_keys)
+# (delegates to _plan_from_spec(cls._SPEC, strategy_cls, config); IDs below name the spec-driven paths)
+# C006M002B0001: extra config keys beyond cls._ALLOWED -> raise StrategyConfigError (from _unknown_keys)
 # C006M002B0002: no extra config keys -> continue (ctor starts as {})
-# C006M002B0003: (v := _opt_int(config, "chunk_bytes")) is not None -> ctor["chunk_bytes"] set
-# C006M002B0004: (v := _opt_int(config, "chunk_bytes")) is None -> ctor has no "chunk_bytes"
-# C006M002B0005: _opt_int(config, "chunk_bytes") raises StrategyConfigError -> exception propagates
-# C006M002B0006: _plan_single(...) succeeds -> returns list length 1 with StrategyPlan.strategy_name == cls.strategy_name
+# C006M002B0003: "chunk_bytes" in config (cls._SCHEMA, "int") -> ctor["chunk_bytes"] set
+# C006M002B0004: "chunk_bytes" not in config -> ctor empty -> return _plan_reserved_only(...)
+# C006M002B0005: _opt(config, "chunk_bytes", _INT) raises StrategyConfigError -> exception propagates
+# C006M002B0006: _plan_single(...) succeeds -> returns a 1-tuple with StrategyPlan.strategy_name == cls.strategy_name
 # C006M002B0007: _plan_single(...) raises (TypeError/ValueError from precedence int conversion) -> exception propagates
 #
 # ------------------------------------------------------------------------------
 # ## DirectUriCoreMetadataStrategyConfig.defaults(cls)
 #    (Class ID: C007, Method ID: M001)
 # ------------------------------------------------------------------------------
-# C007M001B0001: return mapping literal -> returns {"precedence": 40}
+# C007M001B0001: return cls._SPEC.defaults (read-only MappingProxyType, same object every call) -> equals {"precedence": 40}
 #
 # ------------------------------------------------------------------------------
 # ## DirectUriCoreMetadataStrategyConfig.plan(cls, *, strategy_cls, config)
 #    (Class ID: C007, Method ID: M002)
 # ------------------------------------------------------------------------------
-# C007M002B0001: extra config keys beyond _RESERVED_KEYS -> raise StrategyConfigError (from _unknown_keys)
+# (delegates to _plan_from_spec(cls._SPEC, strategy_cls, config); IDs below name the spec-driven paths)
+# C007M002B0001: extra config keys beyond cls._ALLOWED (== _RESERVED_KEYS) -> raise StrategyConfigError (from _unknown_keys)
 # C007M002B0002: no extra config keys -> continue
-# C007M002B0003: _plan_single(..., ctor_kwargs={}) succeeds -> returns list length 1 with empty ctor kwargs (except injected instance_id/precedence via _plan_single)
+# C007M002B0003: _plan_reserved_only(...) succeeds -> returns a 1-tuple with empty ctor kwargs (except injected instance_id/precedence via _plan_single)
 # C007M002B0004: _plan_single(...) raises (TypeError/ValueError from precedence int conversion) -> exception propagates
 #
 # ------------------------------------------------------------------------------
@@ -181,8 +270,8 @@ from project_resolution_engine.internal import builtin_strategy_configs as uut
 #   [x] all `match` / `case` arms captured (none in this module)
 #   [x] all `except` handlers captured (none in this module)
 #   [x] all early `return`s / `raise`s / `yield`s captured
-#   [x] all loop 0 vs >= 1 iterations captured (no loops in this module)
-#   [x] all `break` / `continue` paths captured (no loops in this module)
+#   [x] all loop 0 vs >= 1 iterations captured
+#   [x] all `break` / `continue` paths captured (none in this module)
 # ==============================================================================
 
 
@@ -210,107 +299,129 @@ UNKNOWN_KEYS_CASES = [
         "allowed": {"a"},
         "ctx": "pep691_http",
         "expect_exc": uut.StrategyConfigError,
-        "expect_sub": "pep691_http: unknown config keys",
+        "expect_sub": "pep691_http: unknown config keys: ['b']",
+        "covers": ["C000F001B0001"],
+    },
+    {
+        "name": "empty_cfg",
+        "cfg": {},
+        "allowed": frozenset({"a"}),
+        "ctx": "ctx",
+        "expect_exc": None,
+        "expect_sub": None,
+        "covers": ["C000F001B0002"],
+    },
+    {
+        "name": "multiple_extras_sorted",
+        "cfg": {"z": 1, "a": 1, "b": 2},
+        "allowed": frozenset({"a"}),
+        "ctx": "ctx",
+        "expect_exc": uut.StrategyConfigError,
+        "expect_sub": "ctx: unknown config keys: ['b', 'z']",
         "covers": ["C000F001B0001"],
     },
 ]
 
-OPT_STR_CASES = [
+OPT_CASES = [
     {
-        "name": "missing",
+        "name": "str_missing",
         "cfg": {},
         "key": "user_agent",
+        "kind": uut._STR,
         "expect": None,
         "expect_exc": None,
         "expect_sub": None,
         "covers": ["C000F002B0001"],
     },
     {
-        "name": "present_str",
+        "name": "str_present",
         "cfg": {"user_agent": "ua"},
         "key": "user_agent",
+        "kind": uut._STR,
         "expect": "ua",
         "expect_exc": None,
         "expect_sub": None,
-        "covers": ["C000F002B0002"],
+        "covers": ["C000F002B0004"],
     },
     {
-        "name": "present_wrong_type",
+        "name": "str_wrong_type",
         "cfg": {"user_agent": 123},
         "key": "user_agent",
+        "kind": uut._STR,
         "expect": None,
         "expect_exc": uut.StrategyConfigError,
         "expect_sub": "user_agent: expected str, got int",
-        "covers": ["C000F002B0003"],
+        "covers": ["C000F002B0002"],
     },
-]
-
-OPT_INT_CASES = [
     {
-        "name": "missing",
+        "name": "int_missing",
         "cfg": {},
         "key": "chunk_bytes",
+        "kind": uut._INT,
         "expect": None,
         "expect_exc": None,
         "expect_sub": None,
-        "covers": ["C000F003B0001"],
+        "covers": ["C000F002B0001"],
     },
     {
-        "name": "present_int",
+        "name": "int_present",
         "cfg": {"chunk_bytes": 64},
         "key": "chunk_bytes",
+        "kind": uut._INT,
         "expect": 64,
         "expect_exc": None,
         "expect_sub": None,
-        "covers": ["C000F003B0002"],
+        "covers": ["C000F002B0004"],
     },
     {
-        "name": "present_wrong_type",
+        "name": "int_wrong_type",
         "cfg": {"chunk_bytes": "64"},
         "key": "chunk_bytes",
+        "kind": uut._INT,
         "expect": None,
         "expect_exc": uut.StrategyConfigError,
         "expect_sub": "chunk_bytes: expected int, got str",
-        "covers": ["C000F003B0003"],
+        "covers": ["C000F002B0002"],
     },
-]
-
-OPT_FLOAT_CASES = [
     {
-        "name": "missing",
+        "name": "float_missing",
         "cfg": {},
         "key": "timeout_s",
+        "kind": uut._FLOAT,
         "expect": None,
         "expect_exc": None,
         "expect_sub": None,
-        "covers": ["C000F004B0001"],
+        "covers": ["C000F002B0001"],
     },
     {
-        "name": "present_int_cast",
+        "name": "float_present_int_cast",
         "cfg": {"timeout_s": 5},
         "key": "timeout_s",
+        "kind": uut._FLOAT,
         "expect": 5.0,
         "expect_exc": None,
         "expect_sub": None,
-        "covers": ["C000F004B0002"],
+        "covers": ["C000F002B0003"],
     },
     {
-        "name": "present_float",
+        "name": "float_present_float",
         "cfg": {"timeout_s": 2.5},
         "key": "timeout_s",
+        "kind": uut._FLOAT,
         "expect": 2.5,
         "expect_exc": None,
         "expect_sub": None,
-        "covers": ["C000F004B0003"],
+        "covers": ["C000F002B0004"],
     },
     {
-        "name": "present_wrong_type",
+        "name": "float_wrong_type",
         "cfg": {"timeout_s": "x"},
         "key": "timeout_s",
+        "kind": uut._FLOAT,
         "expect": None,
         "expect_exc": uut.StrategyConfigError,
         "expect_sub": "timeout_s: expected float, got str",
-        "covers": ["C000F004B0004"],
+        "covers": ["C000F002B0002"],
     },
 ]
 
@@ -331,6 +442,7 @@ PLAN_SINGLE_CASES = [
             "C000F005B0006",
             "C000F005B0008",
             "C000F005B0010",
+            "C000F005B0013",
         ],
     },
     {
@@ -349,6 +461,7 @@ PLAN_SINGLE_CASES = [
             "C000F005B0006",
             "C000F005B0008",
             "C000F005B0010",
+            "C000F005B0012",
         ],
     },
     {
@@ -367,6 +480,7 @@ PLAN_SINGLE_CASES = [
             "C000F005B0007",
             "C000F005B0009",
             "C000F005B0010",
+            "C000F005B0012",
         ],
     },
 ]
@@ -388,7 +502,7 @@ DEFAULTS_CASES = [
         "expect": {
             "timeout_s": 120.0,
             "user_agent": "project-resolution-engine/0",
-            "chunk_bytes": 1024 * 1024,
+            "chunk_bytes": 4 * 1024 * 1024,
             "precedence": 50,
         },
         "covers": ["C003M001B0001"],
@@ -445,39 +559,17 @@ def test__unknown_keys(case: dict[str, object]) -> None:
     assert case["expect_sub"] in str(ei.value)
 
 
-@pytest.mark.parametrize("case", OPT_STR_CASES, ids=lambda c: c["name"])
-def test__opt_str(case: dict[str, object]) -> None:
-    # covers: C000F002B0001, C000F002B0002, C000F002B0003
-    if case["expect_exc"] is None:
-        assert uut._opt_str(case["cfg"], case["key"]) == case["expect"]  # type: ignore[arg-type]
-        return
-
-    with pytest.raises(case["expect_exc"]) as ei:  # type: ignore[arg-type]
-        uut._opt_str(case["cfg"], case["key"])  # type: ignore[arg-type]
-    assert case["expect_sub"] in str(ei.value)
-
-
-@pytest.mark.parametrize("case", OPT_INT_CASES, ids=lambda c: c["name"])
-def test__opt_int(case: dict[str, object]) -> None:
-    # covers: C000F003B0001, C000F003B0002, C000F003B0003
-    if case["expect_exc"] is None:
-        assert uut._opt_int(case["cfg"], case["key"]) == case["expect"]  # type: ignore[arg-type]
-        return
-
-    with pytest.raises(case["expect_exc"]) as ei:  # type: ignore[arg-type]
-        uut._opt_int(case["cfg"], case["key"])  # type: ignore[arg-type]
-    assert case["expect_sub"] in str(ei.value)
-
-
-@pytest.mark.parametrize("case", OPT_FLOAT_CASES, ids=lambda c: c["name"])
-def test__opt_float(case: dict[str, object]) -> None:
-    # covers: C000F004B0001, C000F004B0002, C000F004B0003, C000F004B0004
+@pytest.mark.parametrize("case", OPT_CASES, ids=lambda c: c["name"])
+def test__opt(case: dict[str, object]) -> None:
+    # covers: C000F002B0001..B0004 (see per-row covers)
     if case["expect_exc"] is None:
-        assert uut._opt_float(case["cfg"], case["key"]) == case["expect"]  # type: ignore[arg-type]
+        got = uut._opt(case["cfg"], case["key"], case["kind"])  # type: ignore[arg-type]
+        assert got == case["expect"]
+        assert type(got) is type(case["expect"])
         return
 
     with pytest.raises(case["expect_exc"]) as ei:  # type: ignore[arg-type]
-        uut._opt_float(case["cfg"], case["key"])  # type: ignore[arg-type]
+        uut._opt(case["cfg"], case["key"], case["kind"])  # type: ignore[arg-type]
     assert case["expect_sub"] in str(ei.value)
 
 
@@ -492,7 +584,7 @@ def test__plan_single(case: dict[str, object]) -> None:
         depends_on=case["depends_on"],  # type: ignore[arg-type]
     )
 
-    assert isinstance(plans, list)
+    assert isinstance(plans, tuple)
     assert len(plans) == 1
     p = plans[0]
 
@@ -503,6 +595,47 @@ def test__plan_single(case: dict[str, object]) -> None:
     assert dict(p.ctor_kwargs) == dict(case["expect_ctor"])  # type: ignore[arg-type]
 
 
+def test__plan_single_reuses_complete_ctor_kwargs_and_interns_instance_id() -> None:
+    # covers: C000F005B0001, C000F005B0011
+    ctor = {"instance_id": "ctor_iid", "precedence": 3}
+    iid = "".join(["cfg", "_iid"])
+    (p,) = uut._plan_single(
+        strategy_name="s",
+        strategy_cls=_DummyStrategy,
+        config={"instance_id": iid},
+        ctor_kwargs=ctor,
+    )
+    assert p.ctor_kwargs is ctor
+    assert p.instance_id is sys.intern("cfg_iid")
+
+
+@pytest.mark.parametrize(
+    "iid, expect, covers",
+    [
+        ("", "s", ["C000F005B0002"]),
+        (None, "s", ["C000F005B0002"]),
+        (123, uut.StrategyConfigError, ["C000F005B0014"]),
+        (False, uut.StrategyConfigError, ["C000F005B0014"]),
+    ],
+)
+def test__plan_single_instance_id_types(
+    iid: object, expect: object, covers: list[str]
+) -> None:
+    kwargs = dict(
+        strategy_name="s",
+        strategy_cls=_DummyStrategy,
+        config={"instance_id": iid},
+        ctor_kwargs={},
+    )
+    if expect is uut.StrategyConfigError:
+        with pytest.raises(uut.StrategyConfigError) as ei:
+            uut._plan_single(**kwargs)  # type: ignore[arg-type]
+        assert "instance_id: expected str, got" in str(ei.value)
+        return
+    (p,) = uut._plan_single(**kwargs)  # type: ignore[arg-type]
+    assert p.instance_id == expect
+
+
 def test__plan_single_precedence_cast_errors_propagate() -> None:
     # covers: C000F005B0005
     with pytest.raises(ValueError):
@@ -514,6 +647,51 @@ def test__plan_single_precedence_cast_errors_propagate() -> None:
         )
 
 
+CTOR_FROM_SCHEMA_CASES = [
+    {
+        "name": "empty_schema",
+        "config": {"timeout_s": 1.0},
+        "schema": (),
+        "expect": {},
+        "covers": ["C000F006B0001"],
+    },
+    {
+        "name": "absent_keys_skipped",
+        "config": {},
+        "schema": (("timeout_s", uut._FLOAT, "timeout_s"),),
+        "expect": {},
+        "covers": ["C000F006B0002"],
+    },
+    {
+        "name": "present_keys_parsed_by_tag",
+        "config": {"timeout_s": 3, "user_agent": "ua", "chunk_bytes": 8},
+        "schema": (
+            ("timeout_s", uut._FLOAT, "timeout_s"),
+            ("user_agent", uut._STR, "agent"),
+            ("chunk_bytes", uut._INT, "chunk_bytes"),
+        ),
+        "expect": {"timeout_s": 3.0, "agent": "ua", "chunk_bytes": 8},
+        "covers": ["C000F006B0003"],
+    },
+]
+
+
+@pytest.mark.parametrize("case", CTOR_FROM_SCHEMA_CASES, ids=lambda c: c["name"])
+def test__ctor_from_schema(case: dict[str, object]) -> None:
+    # covers: C000F006B0001..B0003 (see per-row covers)
+    got = uut._ctor_from_schema(case["config"], case["schema"])  # type: ignore[arg-type]
+    assert got == case["expect"]
+
+
+def test__ctor_from_schema_parser_error_propagates() -> None:
+    # covers: C000F006B0004
+    with pytest.raises(uut.StrategyConfigError) as ei:
+        uut._ctor_from_schema(
+            {"chunk_bytes": "big"}, (("chunk_bytes", uut._INT, "chunk_bytes"),)
+        )
+    assert "chunk_bytes: expected int" in str(ei.value)
+
+
 # ---------------------------------------------------------------------------
 # defaults()
 # ---------------------------------------------------------------------------
@@ -523,7 +701,11 @@ def test__plan_single_precedence_cast_errors_propagate() -> None:
 def test_config_spec_defaults(case: dict[str, object]) -> None:
     # covers: C002M001B0001, C003M001B0001, C004M001B0001, C005M001B0001, C006M001B0001, C007M001B0001
     cls = case["cls"]
-    assert cls.defaults() == case["expect"]  # type: ignore[attr-defined]
+    got = cls.defaults()  # type: ignore[attr-defined]
+    assert got == case["expect"]
+    assert cls.defaults() is got  # type: ignore[attr-defined]
+    with pytest.raises(TypeError):
+        got["precedence"] = 0  # type: ignore[index]
 
 
 # ---------------------------------------------------------------------------
@@ -828,7 +1010,7 @@ def test_wheel_extracted_plan(case: dict[str, object]) -> None:
     assert ref.strategy_name == case["expect_wheel_sid"]  # type: ignore[index]
     assert ref.instance_id == case["expect_wheel_sid"]  # type: ignore[index]
 
-    # depends_on is computed via wheel_ref.normalized_instance_id()
+    # depends_on is the normalized id cached alongside the ref by _wheel_ref
     assert p.depends_on == (case["expect_wheel_sid"],)  # type: ignore[index]
 
     if case["expect_timeout"] is None:
@@ -837,6 +1019,279 @@ def test_wheel_extracted_plan(case: dict[str, object]) -> None:
         assert ctor["wheel_timeout_s"] == case["expect_timeout"]
 
 
+@pytest.mark.parametrize(
+    "strategy_cls, expect, covers",
+    [
+        (_DummyStrategy, 777, ["C000F008B0001"]),
+        (object, 100, ["C000F008B0002"]),
+    ],
+)
+def test__default_precedence(
+    strategy_cls: type, expect: int, covers: list[str]
+) -> None:
+    assert uut._default_precedence(strategy_cls) == expect
+    assert uut._default_precedence.cache_info().currsize >= 1
+
+
+RESERVED_ONLY_PLAN_CASES = [
+    {
+        "name": "empty_config_cached",
+        "config": {},
+        "expect_instance_id": "s",
+        "expect_precedence": 777,
+        "expect_cached": True,
+        "covers": ["C000F009B0001", "C000F009B0003", "C000F009B0005", "C000F010B0001"],
+    },
+    {
+        "name": "reserved_values_cached",
+        "config": {"instance_id": "iid", "precedence": 3},
+        "expect_instance_id": "iid",
+        "expect_precedence": 3,
+        "expect_cached": True,
+        "covers": ["C000F009B0002", "C000F009B0004", "C000F009B0005", "C000F010B0001"],
+    },
+    {
+        "name": "non_int_precedence_uncached",
+        "config": {"precedence": "4"},
+        "expect_instance_id": "s",
+        "expect_precedence": 4,
+        "expect_cached": False,
+        "covers": ["C000F010B0002"],
+    },
+]
+
+
+@pytest.mark.parametrize("case", RESERVED_ONLY_PLAN_CASES, ids=lambda c: c["name"])
+def test__plan_reserved_only(case: dict[str, object]) -> None:
+    # covers: C000F009B0001..B0005, C000F010B0001..B0002 (see per-row covers)
+    def call() -> tuple[object, ...]:
+        return uut._plan_reserved_only(
+            strategy_name="s",
+            strategy_cls=_DummyStrategy,
+            config=case["config"],  # type: ignore[arg-type]
+        )
+
+    first = call()
+    (p,) = first
+    assert p.instance_id == case["expect_instance_id"]
+    assert p.precedence == case["expect_precedence"]
+    assert dict(p.ctor_kwargs) == {
+        "instance_id": case["expect_instance_id"],
+        "precedence": case["expect_precedence"],
+    }
+    assert (call() is first) is case["expect_cached"]
+    if case["expect_cached"]:
+        with pytest.raises(TypeError):
+            p.ctor_kwargs["x"] = 1  # type: ignore[index]
+
+
+SCHEMA_FROM_CASES = [
+    {
+        "name": "reserved_keys_excluded",
+        "shape": uut._ReservedCfg,
+        "skip": frozenset(),
+        "expect_schema": (),
+        "expect_allowed": {"instance_id", "precedence"},
+        "covers": ["C000F011B0001", "C000F012B0001"],
+    },
+    {
+        "name": "typed_fields_mapped_to_kinds",
+        "shape": uut._HttpWheelCfg,
+        "skip": frozenset(),
+        "expect_schema": (
+            ("timeout_s", uut._FLOAT, "timeout_s"),
+            ("user_agent", uut._STR, "user_agent"),
+            ("chunk_bytes", uut._INT, "chunk_bytes"),
+        ),
+        "expect_allowed": {
+            "instance_id",
+            "precedence",
+            "timeout_s",
+            "user_agent",
+            "chunk_bytes",
+        },
+        "covers": ["C000F011B0001", "C000F011B0003", "C000F012B0001"],
+    },
+    {
+        "name": "skip_excludes_but_still_allowed",
+        "shape": uut._WheelExtractedCfg,
+        "skip": frozenset({"wheel_strategy_id"}),
+        "expect_schema": (("wheel_timeout_s", uut._FLOAT, "wheel_timeout_s"),),
+        "expect_allowed": {
+            "instance_id",
+            "precedence",
+            "wheel_strategy_id",
+            "wheel_timeout_s",
+        },
+        "covers": ["C000F011B0002", "C000F011B0003", "C000F012B0001"],
+    },
+]
+
+
+@pytest.mark.parametrize("case", SCHEMA_FROM_CASES, ids=lambda c: c["name"])
+def test__schema_from_and_allowed_keys(case: dict[str, object]) -> None:
+    # covers: C000F011B0001..B0003, C000F012B0001 (see per-row covers)
+    shape = case["shape"]
+    assert uut._schema_from(shape, skip=case["skip"]) == case["expect_schema"]  # type: ignore[arg-type]
+    assert uut._allowed_keys(shape) == case["expect_allowed"]  # type: ignore[arg-type]
+
+
+def test__config_spec_freezes_defaults_and_derives_shape() -> None:
+    # covers: C000F013B0001
+    defaults = {"precedence": 1}
+    spec = uut._config_spec("n", uut._DirectUriWheelCfg, defaults)
+    defaults["precedence"] = 2
+    assert spec.name == "n"
+    assert spec.defaults == {"precedence": 1}
+    assert spec.allowed == {"instance_id", "precedence", "chunk_bytes"}
+    assert spec.schema == (("chunk_bytes", uut._INT, "chunk_bytes"),)
+    assert spec.post is None
+
+
+@pytest.mark.parametrize(
+    "config, expect_sid, covers",
+    [
+        ({"wheel_strategy_id": "w"}, "w", ["C000F014B0001", "C000F014B0003"]),
+        ({"wheel_strategy_id": ""}, "wheel_http", ["C000F014B0002", "C000F014B0003"]),
+        ({}, "wheel_http", ["C000F014B0002", "C000F014B0003"]),
+    ],
+)
+def test__inject_wheel_ref(
+    config: dict[str, object], expect_sid: str, covers: list[str]
+) -> None:
+    ctor: dict[str, object] = {}
+    assert uut._inject_wheel_ref(config, ctor) == (expect_sid,)
+    assert ctor == {"wheel_strategy": uut.StrategyRef(expect_sid, expect_sid)}
+
+
+PLAN_FROM_SPEC_CASES = [
+    {
+        "name": "unknown_key_raises",
+        "spec": uut.Pep691IndexMetadataHttpStrategyConfig._SPEC,
+        "config": {"nope": 1},
+        "expect_exc": uut.StrategyConfigError,
+        "covers": ["C000F015B0001"],
+    },
+    {
+        "name": "post_hook_sets_depends_on",
+        "spec": uut.WheelExtractedCoreMetadataStrategyConfig._SPEC,
+        "config": {"wheel_strategy_id": "w"},
+        "expect_exc": None,
+        "expect_depends_on": ("w",),
+        "expect_cached": False,
+        "covers": ["C000F015B0002"],
+    },
+    {
+        "name": "reserved_only_served_from_cache",
+        "spec": uut.Pep691IndexMetadataHttpStrategyConfig._SPEC,
+        "config": {"precedence": 5},
+        "expect_exc": None,
+        "expect_depends_on": (),
+        "expect_cached": True,
+        "covers": ["C000F015B0003"],
+    },
+    {
+        "name": "schema_kwargs_planned",
+        "spec": uut.Pep691IndexMetadataHttpStrategyConfig._SPEC,
+        "config": {"timeout_s": 1},
+        "expect_exc": None,
+        "expect_depends_on": (),
+        "expect_cached": False,
+        "covers": ["C000F015B0004"],
+    },
+]
+
+
+@pytest.mark.parametrize("case", PLAN_FROM_SPEC_CASES, ids=lambda c: c["name"])
+def test__plan_from_spec(case: dict[str, object]) -> None:
+    # covers: C000F015B0001..B0004 (see per-row covers)
+    spec = case["spec"]
+    if case["expect_exc"] is not None:
+        with pytest.raises(case["expect_exc"]):  # type: ignore[arg-type]
+            uut._plan_from_spec(spec, _DummyStrategy, case["config"])  # type: ignore[arg-type]
+        return
+
+    first = uut._plan_from_spec(spec, _DummyStrategy, case["config"])  # type: ignore[arg-type]
+    (p,) = first
+    assert p.strategy_name == spec.name  # type: ignore[attr-defined]
+    assert p.depends_on == case["expect_depends_on"]
+    again = uut._plan_from_spec(spec, _DummyStrategy, case["config"])  # type: ignore[arg-type]
+    assert (again is first) is case["expect_cached"]
+
+
+def test_builtin_config_subclass_freezes_spec_once() -> None:
+    # covers: C001M001B0001, C001M002B0001, C001M003B0001
+    class _Cfg(uut._BuiltinStrategyConfig):
+        strategy_name = "custom"
+        SHAPE = uut._DirectUriWheelCfg
+        DEFAULTS = {"chunk_bytes": 1, "precedence": 2}
+
+    spec = _Cfg._SPEC
+    assert spec.name == "custom"
+    assert spec.allowed == {"instance_id", "precedence", "chunk_bytes"}
+    assert spec.schema == (("chunk_bytes", uut._INT, "chunk_bytes"),)
+    assert spec.post is None
+    assert _Cfg.defaults() is spec.defaults
+    assert _Cfg.defaults() == {"chunk_bytes": 1, "precedence": 2}
+
+    (p,) = _Cfg.plan(strategy_cls=_DummyStrategy, config={"chunk_bytes": 8})
+    assert p.strategy_name == "custom"
+    assert p.ctor_kwargs["chunk_bytes"] == 8
+
+
+@pytest.mark.parametrize(
+    "spec, strategy_cls",
+    [
+        (
+            uut.Pep691IndexMetadataHttpStrategyConfig,
+            builtin_strategies.Pep691IndexMetadataHttpStrategy,
+        ),
+        (uut.HttpWheelFileStrategyConfig, builtin_strategies.HttpWheelFileStrategy),
+        (
+            uut.Pep658CoreMetadataHttpStrategyConfig,
+            builtin_strategies.Pep658CoreMetadataHttpStrategy,
+        ),
+        (
+            uut.WheelExtractedCoreMetadataStrategyConfig,
+            builtin_strategies.WheelExtractedCoreMetadataStrategy,
+        ),
+        (
+            uut.DirectUriWheelFileStrategyConfig,
+            builtin_strategies.DirectUriWheelFileStrategy,
+        ),
+        (
+            uut.DirectUriCoreMetadataStrategyConfig,
+            builtin_strategies.DirectUriCoreMetadataStrategy,
+        ),
+    ],
+)
+def test_config_spec_names_match_strategy_names(spec: type, strategy_cls: type) -> None:
+    # Specs bind by name only (shared constants), so pin the pairing here.
+    assert spec.strategy_name == strategy_cls.name  # type: ignore[attr-defined]
+
+
+def test_builtin_config_plan_all_plans_each_config_in_order() -> None:
+    # covers: C001M004B0001, C001M004B0002
+    spec = uut.HttpWheelFileStrategyConfig
+    assert spec.plan_all(strategy_cls=_DummyStrategy, configs=[]) == []
+    plans = spec.plan_all(
+        strategy_cls=_DummyStrategy,
+        configs=[{"instance_id": "a", "timeout_s": 1}, {"instance_id": "b"}],
+    )
+    assert [p.instance_id for p in plans] == ["a", "b"]
+    assert plans[0].ctor_kwargs["timeout_s"] == 1.0
+
+
+def test__wheel_ref_is_cached_per_sid() -> None:
+    # covers: C000F007B0001, C000F007B0002
+    uut._wheel_ref.cache_clear()
+    ref, dep_id = uut._wheel_ref("w")
+    assert ref == uut.StrategyRef(strategy_name="w", instance_id="w")
+    assert dep_id == "w"
+    assert uut._wheel_ref("w") is uut._wheel_ref("w")
+    assert uut._wheel_ref.cache_info().misses == 1
+
+
 # ---------------------------------------------------------------------------
 # plan(): DirectUri* configs
 # ---------------------------------------------------------------------------
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from dataclasses import dataclass
 from typing import Any, TypedDict
 
 import pytest
@@ -37,7 +38,18 @@ except Exception:  # pragma: no cover
         class MultiformatModelMixin:  # noqa: D401
             """Minimal stub for isolated test execution."""
 
+            def __init_subclass__(cls, **_: Any) -> None:
+                super().__init_subclass__()
+
+        from enum import Enum
+
+        MappingFieldKind = Enum(  # type: ignore[misc]
+            "MappingFieldKind",
+            "PLAIN ENUM MODEL MODEL_DICT OPT OPT_MODEL OPT_MODEL_DICT",
+        )
+
         multiformat_mod.MultiformatModelMixin = MultiformatModelMixin
+        multiformat_mod.MappingFieldKind = MappingFieldKind
         sys.modules["project_resolution_engine.internal.util.multiformat"] = (
             multiformat_mod
         )
@@ -73,6 +85,16 @@ except Exception:  # pragma: no cover
 # C000F001B0004: if bad_vals and isinstance(value_type, type) -> error message includes expected=value_type.__name__
 # C000F001B0005: if bad_vals and else (value_type is tuple[type, ...]) -> error message includes expected=" | ".join(t.__name__ for t in value_type)
 # C000F001B0006: else (no bad_vals) -> returns None
+# C000F001B0007: if validation_type not in _ALLOWED_KEYS_CACHE -> computes and caches frozenset of annotation keys
+# C000F001B0008: else (cached) -> reuses the cached key set
+# C000F001B0009: if bad_keys and bad_vals in the same pass -> key error wins (raised first)
+#
+# ------------------------------------------------------------------------------
+# ## _optional(mapping, key, factory)
+#    (Module ID: C000, Function ID: F003)
+# ------------------------------------------------------------------------------
+# C000F003B0001: if mapping.get(key) is truthy -> returns factory(value)
+# C000F003B0002: else (absent or falsy) -> returns None without calling factory
 #
 # ------------------------------------------------------------------------------
 # ## MarkerEnvConfig.to_mapping(self)
@@ -84,10 +106,11 @@ except Exception:  # pragma: no cover
 # ## MarkerEnvConfig.from_mapping(cls, mapping, **_)
 #    (Class ID: C003, Method ID: M002)
 # ------------------------------------------------------------------------------
-# C003M002B0001: if not isinstance(overrides, dict) -> raises ValueError("Invalid overrides value: expected dict; got ...")
-# C003M002B0002: else (overrides is dict) -> calls validate_typed_dict("marker_env overrides", overrides_map, EnvironmentOverrides, str)
-# C003M002B0003: MarkerModeType(mapping.get("mode", MarkerModeType.MERGE.value)) is valid -> returns MarkerEnvConfig(overrides=..., mode=...)
-# C003M002B0004: MarkerModeType(mapping.get("mode", ...)) is invalid -> raises ValueError (enum conversion)
+# C003M002B0001: if not isinstance(overrides, Mapping) -> raises ValueError("Invalid overrides value: expected mapping; got ...")
+# C003M002B0002: else (overrides is a Mapping) -> calls validate_typed_dict("marker_env overrides", overrides_map, EnvironmentOverrides, str)
+# C003M002B0003: mode value is a known string -> resolved via _MODE_BY_VALUE; returns MarkerEnvConfig(overrides=..., mode=...)
+# C003M002B0004: mode value is unknown -> falls back to MarkerModeType(...) which raises ValueError (enum conversion)
+# C003M002B0005: mode value is not a str (e.g. a MarkerModeType member) -> falls back to MarkerModeType(...) and returns it
 #
 # ------------------------------------------------------------------------------
 # ## Filter.to_mapping(self)
@@ -172,11 +195,11 @@ except Exception:  # pragma: no cover
 # ## PlatformConfig.to_mapping(self)
 #    (Class ID: C009, Method ID: M001)
 # ------------------------------------------------------------------------------
-# C009M001B0001: comprehension over self.variants.items() executes 0 times -> "variants" is {}
-# C009M001B0002: comprehension over self.variants.items() executes >= 1 times -> "variants" includes mapped entries
+# C009M001B0001: if not self.variants -> result does not include "variants"
+# C009M001B0002: if self.variants -> "variants" includes mapped entries
 # C009M001B0003: if self.filters is not None -> result includes "filters": self.filters.to_mapping()
 # C009M001B0004: else (self.filters is None) -> result does not include "filters"
-# C009M001B0005: always -> returns dict with enabled/arches/variants (and maybe filters)
+# C009M001B0005: always -> returns dict with enabled/arches (and maybe variants/filters)
 #
 # ------------------------------------------------------------------------------
 # ## PlatformConfig.from_mapping(cls, mapping, **_)
@@ -241,9 +264,9 @@ except Exception:  # pragma: no cover
 # C012M002B0005: if value is None -> continue (entry skipped; parsed not updated for that platform)
 # C012M002B0006: else (value is not None) -> continues type check
 # C012M002B0007: if not isinstance(value, Mapping) -> raises ValueError(f"platform_overrides.{platform_name} must be a mapping")
-# C012M002B0008: else (value is a Mapping) -> parsed[platform_name] = PlatformContext.from_mapping(value)
-# C012M002B0009: validate_typed_dict("platform overrides", parsed, PlatformOverrides, PlatformContext) raises -> propagates ValueError from validate_typed_dict
-# C012M002B0010: validate_typed_dict(...) succeeds -> returns ResolutionContext(name=mapping["name"], universal=PlatformContext.from_mapping(mapping["universal"]), platform_overrides=...)
+# C012M002B0008: else (value is a Mapping) -> continues platform name check
+# C012M002B0009: if platform_name not in _ALLOWED_PLATFORMS -> raises ValueError("Invalid platform overrides keys: {...}") before building a PlatformContext
+# C012M002B0010: else (known platform) -> parsed[platform_name] = PlatformContext.from_mapping(value); after the loop returns ResolutionContext(name=mapping["name"], universal=PlatformContext.from_mapping(mapping["universal"]), platform_overrides=...)
 # C012M002B0011: if "name" missing -> raises KeyError
 # C012M002B0012: if "universal" missing -> raises KeyError
 #
@@ -267,6 +290,11 @@ class _TD(TypedDict, total=False):
     ok: str
 
 
+@dataclass
+class _Leaf:
+    x: int = 1
+
+
 _VALIDATE_CASES: list[dict[str, Any]] = [
     {
         "id": "bad_keys",
@@ -308,6 +336,16 @@ _VALIDATE_CASES: list[dict[str, Any]] = [
         "exc_sub": None,
         "covers": ["C000F001B0002", "C000F001B0006"],
     },
+    {
+        "id": "bad_keys_and_vals",
+        "desc": "td",
+        "mapping": {"ok": 123, "nope": "x"},
+        "validation_type": _TD,
+        "value_type": str,
+        "exc_type": ValueError,
+        "exc_sub": "Invalid td keys: {'nope'}",
+        "covers": ["C000F001B0001", "C000F001B0009"],
+    },
 ]
 
 
@@ -316,7 +354,7 @@ _MARKER_ENV_FROM_MAPPING_CASES: list[dict[str, Any]] = [
         "id": "overrides_not_dict",
         "mapping": {"overrides": ["nope"]},
         "exc_type": ValueError,
-        "exc_sub": "Invalid overrides value: expected dict",
+        "exc_sub": "Invalid overrides value: expected mapping",
         "covers": ["C003M002B0001"],
     },
     {
@@ -383,6 +421,43 @@ def test_validate_typed_dict(case: dict[str, Any]) -> None:
     assert case["exc_sub"] in str(excinfo.value)
 
 
+def test_validate_typed_dict_caches_allowed_keys() -> None:
+    # Covers: C000F001B0007, C000F001B0008
+    class _Fresh(TypedDict, total=False):
+        a: str
+
+    compat._ALLOWED_KEYS_CACHE.pop(_Fresh, None)
+    compat.validate_typed_dict("fresh", {"a": "x"}, _Fresh, str)
+    cached = compat._ALLOWED_KEYS_CACHE[_Fresh]
+    assert cached == frozenset({"a"})
+
+    compat.validate_typed_dict("fresh", {}, _Fresh, str)
+    assert compat._ALLOWED_KEYS_CACHE[_Fresh] is cached
+
+
+@pytest.mark.parametrize(
+    "mapping, expected, covers",
+    [
+        ({"k": {"x": 5}}, _Leaf(5), ["C000F003B0001"]),
+        ({}, None, ["C000F003B0002"]),
+        ({"k": {}}, None, ["C000F003B0002"]),
+    ],
+    ids=["present", "absent", "empty"],
+)
+def test_optional(
+    mapping: Mapping[str, Any], expected: _Leaf | None, covers: list[str]
+) -> None:
+    # Covers: see `covers`
+    calls: list[Mapping[str, Any]] = []
+
+    def _factory(value: Mapping[str, Any]) -> _Leaf:
+        calls.append(value)
+        return _Leaf(**value)
+
+    assert compat._optional(mapping, "k", _factory) == expected
+    assert len(calls) == (0 if expected is None else 1)
+
+
 @pytest.mark.parametrize(
     "case",
     _MARKER_ENV_FROM_MAPPING_CASES,
@@ -403,6 +478,52 @@ def test_marker_env_config_from_mapping(case: dict[str, Any]) -> None:
     assert case["exc_sub"] in str(excinfo.value)
 
 
+@pytest.mark.parametrize(
+    "mode_value, expected, covers",
+    [
+        ("exact", compat.MarkerModeType.EXACT, ["C003M002B0003"]),
+        (compat.MarkerModeType.EXACT, compat.MarkerModeType.EXACT, ["C003M002B0005"]),
+    ],
+    ids=["string_fast_path", "member_fallback"],
+)
+def test_marker_env_config_from_mapping_mode(
+    mode_value: Any, expected: compat.MarkerModeType, covers: list[str]
+) -> None:
+    # Covers: see `covers`
+    cfg = compat.MarkerEnvConfig.from_mapping({"mode": mode_value})
+    assert cfg.mode is expected
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        compat.MarkerEnvConfig(),
+        compat.Filter(),
+        compat.VersionSpec(),
+        compat.InterpreterConfig(python_version=compat.VersionSpec(), types=[]),
+        compat.AbiConfig(),
+        compat.PlatformVariant(),
+        compat.PlatformConfig(),
+        compat.PlatformContext(),
+        compat.ResolutionContext(name="n", universal=compat.PlatformContext()),
+    ],
+    ids=lambda inst: type(inst).__name__,
+)
+def test_models_are_slotted(instance: Any) -> None:
+    assert not hasattr(instance, "__dict__")
+    with pytest.raises(AttributeError):
+        instance.not_a_field = 1
+
+
+def test_marker_env_config_from_mapping_accepts_any_mapping() -> None:
+    # Covers: C003M002B0002
+    from types import MappingProxyType
+
+    overrides = MappingProxyType({"python_version": "3.12"})
+    cfg = compat.MarkerEnvConfig.from_mapping({"overrides": overrides})
+    assert cfg.overrides is overrides
+
+
 def test_marker_env_config_to_mapping() -> None:
     # Covers: C003M001B0001
     cfg = compat.MarkerEnvConfig(
@@ -628,8 +749,8 @@ def test_platform_config_to_mapping_variants_0_and_1_and_filters() -> None:
         enabled=True, arches=["x86_64"], variants={}, filters=None
     )
     out_empty = empty.to_mapping()
-    assert out_empty["variants"] == {}
-    assert "filters" not in out_empty
+    assert out_empty == {"enabled": True, "arches": ["x86_64"]}
+    assert compat.PlatformConfig.from_mapping(out_empty) == empty
 
     one = compat.PlatformConfig(
         enabled=False,
@@ -869,3 +990,26 @@ def test_resolution_context_from_mapping(
         getattr(rc.platform_overrides, "keys")()
     )  # TypedDict in runtime is just a dict
     assert sorted(keys) == sorted(expected_overrides_keys)
+
+
+def test_resolution_context_from_mapping_rejects_unknown_platform_before_parsing(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Covers: C012M002B0009
+    parsed_values: list[Mapping[str, Any]] = []
+    original = compat.PlatformContext.from_mapping
+
+    def _spy(mapping: Mapping[str, Any], **kwargs: Any) -> Any:
+        parsed_values.append(mapping)
+        return original(mapping, **kwargs)
+
+    monkeypatch.setattr(compat.PlatformContext, "from_mapping", _spy)
+    override = {"abi": {"include_debug": True}}
+
+    with pytest.raises(ValueError) as excinfo:
+        compat.ResolutionContext.from_mapping(
+            {"name": "n", "universal": {}, "platform_overrides": {"weird": override}}
+        )
+
+    assert str(excinfo.value) == "Invalid platform overrides keys: {'weird'}"
+    assert override not in parsed_values
@@ -31,14 +31,9 @@ from unit.helpers.models_helper import FakeArtifactRecord, FakeWheelKey
 #    (Class ID: C001, Method ID: M001)
 # ------------------------------------------------------------------------------
 # C001M001B0001: method entry -> begin resolve orchestration (initialize causes list)
-# C001M001B0002: has_imperative is False -> skip imperative-mix validation; proceed to strategy loop
-# C001M001B0003: has_imperative is True AND has_non_imperative is True -> raise RuntimeError (msg contains "All strategies must be imperative or all must be non-imperative")
-# C001M001B0004: has_imperative is True AND has_non_imperative is False -> proceed to strategy loop
 #
-# C001M001B0005: for strategy in self.strategies executes 0 times -> proceed to final ArtifactResolutionError raise (no strategy attempted)
-# C001M001B0006: for strategy in self.strategies executes >= 1 time -> enter loop body
-#
-# C001M001B0007: strategy.criticality is StrategyCriticality.DISABLED -> continue (skip strategy.resolve call)
+# C001M001B0005: for strategy in self._active executes 0 times -> proceed to final ArtifactResolutionError raise (no strategy attempted)
+# C001M001B0006: for strategy in self._active executes >= 1 time -> enter loop body
 #
 # C001M001B0008: strategy.resolve(...) returns record where record is not None -> return FakeArtifactRecord
 # C001M001B0009: strategy.resolve(...) returns None -> continue (try next strategy)
@@ -50,11 +45,22 @@ from unit.helpers.models_helper import FakeArtifactRecord, FakeWheelKey
 # C001M001B0013: loop exhausted AND causes is non-empty -> raise ArtifactResolutionError (causes contains collected exceptions)
 #
 # ------------------------------------------------------------------------------
+# ## StrategyChainArtifactResolver.__post_init__(self)
+#    (Class ID: C001, Method ID: M002)
+# ------------------------------------------------------------------------------
+# C001M002B0001: no IMPERATIVE strategy seen -> construction succeeds
+# C001M002B0002: IMPERATIVE and non-imperative (non-DISABLED) strategies seen -> raise RuntimeError (msg contains "All strategies must be imperative or all must be non-imperative")
+# C001M002B0003: IMPERATIVE seen and every other strategy is IMPERATIVE or DISABLED -> construction succeeds
+# C001M002B0004: strategy.criticality is StrategyCriticality.DISABLED -> logged once and left out of _active (never resolved)
+#
+# ------------------------------------------------------------------------------
 # ## ArtifactCoordinator.resolve(self, key)
 #    (Class ID: C002, Method ID: M001)
 # ------------------------------------------------------------------------------
-# C002M001B0001: hit = self.repo.get(key) and hit is not None -> return hit (no allocation / resolver / put)
-# C002M001B0002: hit = self.repo.get(key) and hit is None -> call allocate_destination_uri; call resolver.resolve; call repo.put; return record
+# C002M001B0001: hit_or_dest = self.repo.get_or_reserve(key) is not a str -> return it (no resolver / put)
+# C002M001B0002: hit_or_dest = self.repo.get_or_reserve(key) is a str -> call resolver.resolve with it as destination; call repo.put; call repo.release_reservation(key); return record
+# C002M001B0003: resolver.resolve raises -> call repo.release_reservation(key); re-raise (no repo.put)
+# C002M001B0004: repo.put raises -> call repo.release_reservation(key); re-raise
 #
 # ------------------------------------------------------------------------------
 # LEDGER COMPLETENESS CHECKLIST
@@ -151,20 +157,6 @@ def _act_fail_if_called() -> Callable[[object, str], FakeArtifactRecord | None]:
 
 # StrategyChainArtifactResolver.resolve() cases
 RESOLVER_CASES: list[dict[str, object]] = [
-    {
-        "id": "mix_imperative_non_imperative_raises",
-        "strategies": lambda: [
-            _FakeStrategy("s1", StrategyCriticality.IMPERATIVE, _act_return_none()),
-            _FakeStrategy("s2", StrategyCriticality.REQUIRED, _act_return_none()),
-        ],
-        "key": _mk_key(),
-        "dest_uri": "file:///dest.whl",
-        "expect_exc": RuntimeError,
-        "expect_msg": "All strategies must be imperative or all must be non-imperative",
-        "expect_record": None,
-        "post_assert": None,
-        "covers": ["C001M001B0001", "C001M001B0003"],
-    },
     {
         "id": "imperative_only_allows_run_and_returns_record",
         "strategies": lambda: [
@@ -178,7 +170,7 @@ RESOLVER_CASES: list[dict[str, object]] = [
         "expect_msg": None,
         "expect_record": "non_none",
         "post_assert": None,
-        "covers": ["C001M001B0001", "C001M001B0004", "C001M001B0006", "C001M001B0008"],
+        "covers": ["C001M001B0001", "C001M002B0003", "C001M001B0006", "C001M001B0008"],
     },
     {
         "id": "no_strategies_loop_zero_raises_causes_empty",
@@ -191,7 +183,7 @@ RESOLVER_CASES: list[dict[str, object]] = [
         "post_assert": lambda err: (
             (err.key, err.causes)  # exercised via asserts below
         ),
-        "covers": ["C001M001B0001", "C001M001B0002", "C001M001B0005", "C001M001B0012"],
+        "covers": ["C001M001B0001", "C001M002B0001", "C001M001B0005", "C001M001B0012"],
     },
     {
         "id": "disabled_strategy_is_skipped_then_next_returns_record",
@@ -214,9 +206,9 @@ RESOLVER_CASES: list[dict[str, object]] = [
         ),
         "covers": [
             "C001M001B0001",
-            "C001M001B0002",
+            "C001M002B0001",
             "C001M001B0006",
-            "C001M001B0007",
+            "C001M002B0004",
             "C001M001B0008",
         ],
     },
@@ -236,7 +228,7 @@ RESOLVER_CASES: list[dict[str, object]] = [
         "post_assert": None,
         "covers": [
             "C001M001B0001",
-            "C001M001B0002",
+            "C001M002B0001",
             "C001M001B0006",
             "C001M001B0009",
             "C001M001B0008",
@@ -260,7 +252,7 @@ RESOLVER_CASES: list[dict[str, object]] = [
         "post_assert": None,
         "covers": [
             "C001M001B0001",
-            "C001M001B0002",
+            "C001M002B0001",
             "C001M001B0006",
             "C001M001B0010",
             "C001M001B0008",
@@ -284,7 +276,7 @@ RESOLVER_CASES: list[dict[str, object]] = [
         "post_assert": None,
         "covers": [
             "C001M001B0001",
-            "C001M001B0002",
+            "C001M002B0001",
             "C001M001B0006",
             "C001M001B0011",
             "C001M001B0008",
@@ -306,7 +298,7 @@ RESOLVER_CASES: list[dict[str, object]] = [
         "post_assert": None,
         "covers": [
             "C001M001B0001",
-            "C001M001B0002",
+            "C001M002B0001",
             "C001M001B0006",
             "C001M001B0009",
             "C001M001B0010",
@@ -331,7 +323,7 @@ RESOLVER_CASES: list[dict[str, object]] = [
         "post_assert": None,
         "covers": [
             "C001M001B0001",
-            "C001M001B0002",
+            "C001M002B0001",
             "C001M001B0006",
             "C001M001B0011",
             "C001M001B0013",
@@ -339,15 +331,43 @@ RESOLVER_CASES: list[dict[str, object]] = [
     },
 ]
 
+# StrategyChainArtifactResolver.__post_init__() cases
+POST_INIT_CASES: list[dict[str, object]] = [
+    {
+        "id": "no_imperative_constructs",
+        "criticalities": [StrategyCriticality.REQUIRED, StrategyCriticality.OPTIONAL],
+        "expect_exc": None,
+        "covers": ["C001M002B0001"],
+    },
+    {
+        "id": "mix_imperative_non_imperative_raises",
+        "criticalities": [
+            StrategyCriticality.IMPERATIVE,
+            StrategyCriticality.REQUIRED,
+        ],
+        "expect_exc": RuntimeError,
+        "covers": ["C001M002B0002"],
+    },
+    {
+        "id": "imperative_with_disabled_constructs",
+        "criticalities": [
+            StrategyCriticality.IMPERATIVE,
+            StrategyCriticality.DISABLED,
+        ],
+        "expect_exc": None,
+        "covers": ["C001M002B0003"],
+    },
+]
+
 # ArtifactCoordinator.resolve() cases
 COORDINATOR_CASES: list[dict[str, object]] = [
     {
-        "id": "repo_hit_returns_without_alloc_or_resolve_or_put",
+        "id": "repo_hit_returns_without_resolve_or_put",
         "hit": "non_none",
         "covers": ["C002M001B0001"],
     },
     {
-        "id": "repo_miss_allocates_resolves_puts_and_returns",
+        "id": "repo_miss_reserves_resolves_puts_and_returns",
         "hit": None,
         "covers": ["C002M001B0002"],
     },
@@ -423,6 +443,60 @@ def test_strategy_chain_artifact_resolver_resolve(case: dict[str, object]) -> No
                 assert "boom2" in str(err.causes[1])
 
 
+def test_strategy_chain_artifact_resolver_logs_lazily_to_module_logger(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    # Covers: C001M002B0004, C001M001B0009, C001M001B0010, C001M001B0011
+    strategies = [
+        _FakeStrategy("off", StrategyCriticality.DISABLED, _act_fail_if_called()),
+        _FakeStrategy("none", StrategyCriticality.OPTIONAL, _act_return_none()),
+        _FakeStrategy("na", StrategyCriticality.OPTIONAL, _act_raise_not_applicable()),
+        _FakeStrategy(
+            "boom", StrategyCriticality.OPTIONAL, _act_raise(ValueError("x"))
+        ),
+    ]
+    logger_name = "project_resolution_engine.internal.orchestration"
+
+    with caplog.at_level("DEBUG", logger=logger_name):
+        resolver = StrategyChainArtifactResolver(strategies=strategies)
+        with pytest.raises(ArtifactResolutionError):
+            resolver.resolve(key=_mk_key(), destination_uri="file:///dest.whl")
+
+    records = [r for r in caplog.records if r.name == logger_name]
+    assert [r.msg.split(":")[0] for r in records] == [
+        "strategy disabled",
+        "strategy returned None",
+        "strategy not applicable",
+        "strategy failed",
+    ]
+    assert records[0].args == ("off",)
+    assert records[-1].args[0] == "boom"
+    assert "err=ValueError: x" in records[-1].getMessage()
+
+
+@pytest.mark.parametrize("case", POST_INIT_CASES, ids=lambda c: str(c["id"]))
+def test_strategy_chain_artifact_resolver_post_init(case: dict[str, object]) -> None:
+    # Covers: see case["covers"]
+    strategies = [
+        _FakeStrategy(f"s{i}", crit, _act_fail_if_called())
+        for i, crit in enumerate(case["criticalities"])
+    ]
+
+    if case["expect_exc"] is None:
+        resolver = StrategyChainArtifactResolver(strategies=strategies)
+        assert list(resolver.strategies) == strategies
+        assert resolver._active == tuple(
+            s for s in strategies if s.criticality is not StrategyCriticality.DISABLED
+        )
+        return
+
+    with pytest.raises(RuntimeError) as ei:
+        StrategyChainArtifactResolver(strategies=strategies)
+    assert "All strategies must be imperative or all must be non-imperative" in str(
+        ei.value
+    )
+
+
 @pytest.mark.parametrize("case", COORDINATOR_CASES, ids=lambda c: str(c["id"]))
 def test_artifact_coordinator_resolve(case: dict[str, object]) -> None:
     # Covers: see case["covers"]
@@ -434,20 +508,20 @@ def test_artifact_coordinator_resolve(case: dict[str, object]) -> None:
     hit = case["hit"]
     if hit == "non_none":
         record = _mk_record(key)
-        repo.get.return_value = record
+        repo.get_or_reserve.return_value = record
 
         coordinator = ArtifactCoordinator(repo=repo, resolver=resolver)
         out = coordinator.resolve(key)
 
         assert out is record
-        repo.get.assert_called_once_with(key)
+        repo.get_or_reserve.assert_called_once_with(key)
+        repo.get.assert_not_called()
         repo.allocate_destination_uri.assert_not_called()
         resolver.resolve.assert_not_called()
         repo.put.assert_not_called()
 
     else:
-        repo.get.return_value = None
-        repo.allocate_destination_uri.return_value = "file:///dest.whl"
+        repo.get_or_reserve.return_value = "file:///dest.whl"
 
         record = _mk_record(key, dest="file:///dest.whl")
         resolver.resolve.return_value = record
@@ -456,9 +530,47 @@ def test_artifact_coordinator_resolve(case: dict[str, object]) -> None:
         out = coordinator.resolve(key)
 
         assert out is record
-        repo.get.assert_called_once_with(key)
-        repo.allocate_destination_uri.assert_called_once_with(key)
+        repo.get_or_reserve.assert_called_once_with(key)
+        repo.get.assert_not_called()
+        repo.allocate_destination_uri.assert_not_called()
         resolver.resolve.assert_called_once_with(
             key=key, destination_uri="file:///dest.whl"
         )
         repo.put.assert_called_once_with(record)
+        # The reserved key is released, not record.key, so a record returned under
+        # another key cannot strand waiters on this one.
+        repo.release_reservation.assert_called_once_with(key)
+
+
+def test_artifact_coordinator_resolve_releases_reservation_on_failure() -> None:
+    # Covers: C002M001B0003
+    key = _mk_key()
+
+    repo = Mock()
+    resolver = Mock()
+    repo.get_or_reserve.return_value = "file:///dest.whl"
+    resolver.resolve.side_effect = RuntimeError("boom")
+
+    coordinator = ArtifactCoordinator(repo=repo, resolver=resolver)
+    with pytest.raises(RuntimeError, match="boom"):
+        coordinator.resolve(key)
+
+    repo.release_reservation.assert_called_once_with(key)
+    repo.put.assert_not_called()
+
+
+def test_artifact_coordinator_resolve_releases_reservation_when_put_fails() -> None:
+    # Covers: C002M001B0004
+    key = _mk_key()
+
+    repo = Mock()
+    resolver = Mock()
+    repo.get_or_reserve.return_value = "file:///dest.whl"
+    resolver.resolve.return_value = _mk_record(key, dest="file:///dest.whl")
+    repo.put.side_effect = OSError("disk full")
+
+    coordinator = ArtifactCoordinator(repo=repo, resolver=resolver)
+    with pytest.raises(OSError, match="disk full"):
+        coordinator.resolve(key)
+
+    repo.release_reservation.assert_called_once_with(key)
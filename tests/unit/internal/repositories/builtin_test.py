@@ -59,7 +59,8 @@ def test__create_ephemeral_import_succeeds_returns_instance(
     fake_mod = types.ModuleType("project_resolution_engine.internal.builtin_repository")
     fake_mod.EphemeralArtifactRepository = FakeEphemeralArtifactRepository  # type: ignore[attr-defined]
 
-    # Ensure import resolution uses our fake module.
+    # Ensure import resolution uses our fake module (and is not short-circuited by the cache).
+    monkeypatch.setattr(uut, "_ephemeral_repository_cls", None)
     monkeypatch.setitem(
         sys.modules, "project_resolution_engine.internal.builtin_repository", fake_mod
     )
@@ -96,6 +97,7 @@ def test__create_ephemeral_import_fails_raises_import_error(
             raise ImportError("forced import failure for test coverage")
         return original_import(name, globals, locals, fromlist, level)
 
+    monkeypatch.setattr(uut, "_ephemeral_repository_cls", None)
     monkeypatch.setattr(builtins, "__import__", _import_hook)
 
     with pytest.raises(ImportError) as excinfo:
@@ -104,9 +106,65 @@ def test__create_ephemeral_import_fails_raises_import_error(
     assert "forced import failure" in str(excinfo.value)
 
 
+def test__create_ephemeral_caches_class_after_first_import(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Covers: C000F001B0003
+    class FakeEphemeralArtifactRepository:
+        pass
+
+    fake_mod = types.ModuleType("project_resolution_engine.internal.builtin_repository")
+    fake_mod.EphemeralArtifactRepository = FakeEphemeralArtifactRepository  # type: ignore[attr-defined]
+    monkeypatch.setattr(uut, "_ephemeral_repository_cls", None)
+    monkeypatch.setitem(
+        sys.modules, "project_resolution_engine.internal.builtin_repository", fake_mod
+    )
+
+    first = uut._create_ephemeral()
+    assert uut._ephemeral_repository_cls is FakeEphemeralArtifactRepository
+
+    # Once cached, the import is not repeated (a re-import would load the real class).
+    monkeypatch.delitem(
+        sys.modules, "project_resolution_engine.internal.builtin_repository"
+    )
+    second = uut._create_ephemeral()
+
+    assert type(first) is type(second) is FakeEphemeralArtifactRepository
+    assert first is not second
+
+
 def test_defaults_and_factory_registry_are_wired_correctly() -> None:
     # No new branches (constants / mapping), but asserts the module contract.
     assert uut.DEFAULT_REPOSITORY_ID == "ephemeral"
     assert "ephemeral" in uut.BUILTIN_REPOSITORY_FACTORIES
     assert uut.BUILTIN_REPOSITORY_FACTORIES["ephemeral"] is uut._create_ephemeral
     assert callable(uut.BUILTIN_REPOSITORY_FACTORIES["ephemeral"])
+
+
+def test_default_factory_is_the_registered_default() -> None:
+    assert (
+        uut.DEFAULT_FACTORY
+        is uut.BUILTIN_REPOSITORY_FACTORIES[uut.DEFAULT_REPOSITORY_ID]
+    )
+
+
+@pytest.mark.parametrize(
+    "repo_id, expected, covers",
+    [
+        (None, "default", ["C000F002B0001"]),
+        ("ephemeral", "default", ["C000F002B0001"]),
+        ("missing", KeyError, ["C000F002B0002"]),
+    ],
+    ids=["implicit_default", "explicit_default", "unknown_id"],
+)
+def test_get_builtin_factory(
+    repo_id: str | None, expected: Any, covers: list[str]
+) -> None:
+    # Covers: see `covers`
+    args = () if repo_id is None else (repo_id,)
+    if expected is KeyError:
+        with pytest.raises(KeyError):
+            uut.get_builtin_factory(*args)
+        return
+
+    assert uut.get_builtin_factory(*args) is uut.DEFAULT_FACTORY
@@ -26,6 +26,13 @@ class _RegistryStub:
     def merged(self) -> dict[str, Any]:
         return self.merged_impl()
 
+    def lookup(self, repo_id: str) -> tuple[str, Any] | None:
+        merged = self.merged()
+        if repo_id not in merged:
+            return None
+        origin = "builtin" if repo_id in self.builtins else "entrypoint"
+        return origin, merged[repo_id]
+
 
 @dataclass(frozen=True, slots=True)
 class _RepoStub:
@@ -253,7 +260,8 @@ def test_select_repository_unknown_repo_raises(
             repo_id=case["repo_id"], registry=registry
         )  # noqa: SLF001
 
-    merged_called.assert_called_once_with()  # C000F001B0003
+    # C000F001B0003: once for the stub's lookup, once for the "available" listing.
+    assert merged_called.call_count == 2
     msg = str(excinfo.value)
     for s in case["expect_substrings"]:
         assert s in msg
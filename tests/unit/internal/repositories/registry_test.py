@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from typing import Callable
 
@@ -87,6 +88,53 @@ _VALIDATE_CASES = [
 ]
 
 
+def _kw_only(*, config=None):  # noqa: ANN001, ANN202 - test helper
+    return config
+
+
+def _pos_or_kw(config=None):  # noqa: ANN001, ANN202 - test helper
+    return config
+
+
+def _pos_only(config, /):  # noqa: ANN001, ANN202 - test helper
+    return config
+
+
+def _var_kw(**kwargs):  # noqa: ANN003, ANN202 - test helper
+    return kwargs
+
+
+@functools.wraps(_kw_only)
+def _wrapped(*args, **kwargs):  # noqa: ANN002, ANN003, ANN202 - test helper
+    return _kw_only(*args, **kwargs)
+
+
+class _CallableFactory:
+    def __call__(self, *, config=None):  # noqa: ANN001, ANN204 - test helper
+        return config
+
+
+_FAST_CONFIG_CASES = [
+    dict(name="kw-only", obj=_kw_only, expected=True, covers=["C000F004B0003"]),
+    dict(name="pos-or-kw", obj=_pos_or_kw, expected=True, covers=["C000F004B0003"]),
+    dict(name="pos-only", obj=_pos_only, expected=False, covers=["C000F004B0003"]),
+    dict(name="var-kw", obj=_var_kw, expected=False, covers=["C000F004B0003"]),
+    dict(name="wrapped", obj=_wrapped, expected=False, covers=["C000F004B0002"]),
+    dict(
+        name="partial",
+        obj=functools.partial(_kw_only),
+        expected=False,
+        covers=["C000F004B0001"],
+    ),
+    dict(
+        name="callable-instance",
+        obj=_CallableFactory(),
+        expected=False,
+        covers=["C000F004B0001"],
+    ),
+]
+
+
 _MERGED_CASES = [
     # Covers: C004M001B0001
     dict(
@@ -157,6 +205,17 @@ _BUILD_REGISTRY_CASES = [
 # ==============================================================================
 
 
+@pytest.fixture(autouse=True)
+def _clear_registry_cache():
+    # build_repository_registry and _all_entry_points are memoized per process;
+    # isolate each test.
+    uut.build_repository_registry.cache_clear()
+    uut._all_entry_points.cache_clear()
+    yield
+    uut.build_repository_registry.cache_clear()
+    uut._all_entry_points.cache_clear()
+
+
 def test_repofactory_call_body_is_ellipsis_and_returns_none() -> None:
     # Covers: C001M001B0001
     assert uut.RepoFactory.__call__(object(), config=None) is None
@@ -166,19 +225,21 @@ def test_repofactory_call_body_is_ellipsis_and_returns_none() -> None:
     "case", _MERGED_CASES, ids=[c["covers"][0] for c in _MERGED_CASES]
 )
 def test_repository_registry_merged(case: dict) -> None:
-    reg = uut.RepositoryRegistry(builtins=case["builtins"], externals=case["externals"])
-
     # Covers: C004M001B0001 / C004M001B0002
     if case["exp_exc_substr"] is not None:
         with pytest.raises(uut.RepositoryRegistryError) as ei:
-            reg.merged()
+            uut.RepositoryRegistry(
+                builtins=case["builtins"], externals=case["externals"]
+            )
         assert case["exp_exc_substr"] in str(ei.value)
         return
 
+    reg = uut.RepositoryRegistry(builtins=case["builtins"], externals=case["externals"])
     merged = reg.merged()
     assert set(merged) == set(case["builtins"]) | set(case["externals"])
     assert merged["a"]() == "builtin"
     assert merged["b"]() == "external"
+    assert reg.merged() is merged
 
 
 @pytest.mark.parametrize(
@@ -266,3 +327,102 @@ def test_build_repository_registry(monkeypatch: pytest.MonkeyPatch, case: dict)
     assert isinstance(reg, uut.RepositoryRegistry)
     assert set(reg.builtins) == {"builtin"}
     assert set(reg.externals) == {"external"}
+
+
+def test_build_repository_registry_is_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Covers: C000F003B0001
+    calls: list[str] = []
+
+    def _load(*, group: str):
+        calls.append(group)
+        return {}
+
+    monkeypatch.setattr(uut, "_load_entrypoint_repo_factories", _load)
+
+    first = uut.build_repository_registry()
+    assert uut.build_repository_registry() is first
+    assert len(calls) == 1
+
+    uut.build_repository_registry.cache_clear()
+    assert uut.build_repository_registry() is not first
+    assert len(calls) == 2
+
+
+def test_all_entry_points_scans_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[int] = []
+    eps = _FakeEntryPoints([])
+
+    def _fake_entry_points() -> _FakeEntryPoints:
+        calls.append(1)
+        return eps
+
+    monkeypatch.setattr(uut, "entry_points", _fake_entry_points)
+
+    assert uut._all_entry_points() is eps
+    assert uut._all_entry_points() is eps
+    assert len(calls) == 1
+
+
+def test_repository_registry_lookup_reports_origin() -> None:
+    builtin = _make_factory("builtin")
+    external = _make_factory("external")
+    reg = uut.RepositoryRegistry(builtins={"a": builtin}, externals={"b": external})
+
+    assert reg.lookup("a") == ("builtin", builtin)
+    assert reg.lookup("b") == ("entrypoint", external)
+    assert reg.lookup("missing") is None
+
+
+@pytest.mark.parametrize("case", _FAST_CONFIG_CASES, ids=lambda c: c["name"])
+def test_has_keywordable_config(case: dict) -> None:
+    # Covers: see case["covers"]
+    assert uut._has_keywordable_config(case["obj"]) is case["expected"]
+
+
+@pytest.mark.parametrize(
+    "obj", [_wrapped, functools.partial(_kw_only), _CallableFactory()]
+)
+def test_validate_repo_factory_callable_falls_back_to_signature(obj: object) -> None:
+    # Callables the fast path declines are still accepted via inspect.signature.
+    assert uut._enforce_repo_factory_callable("r", obj) is obj
+
+
+def test_entrypoint_factories_are_loaded_on_first_selection(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    loads: list[str] = []
+
+    def _loader() -> object:
+        loads.append("repoA")
+        return _make_factory("A")
+
+    eps = _FakeEntryPoints([_FakeEntryPoint(name="repoA", _loader=_loader)])
+    monkeypatch.setattr(uut, "entry_points", lambda: eps)
+
+    externals = uut._load_entrypoint_repo_factories(group="test.group")
+    assert loads == []  # discovery does not import the plugin
+
+    reg = uut.RepositoryRegistry(builtins={}, externals=externals)
+    origin, factory = reg.lookup("repoA")
+    assert origin == "entrypoint"
+    assert factory() == "A"
+    assert loads == ["repoA"]
+
+    reg.lookup("repoA")
+    assert externals["repoA"](config=None) == "A"
+    assert loads == ["repoA"]  # loaded and validated once
+
+
+def test_invalid_entrypoint_factory_raises_on_lookup(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    eps = _FakeEntryPoints([_FakeEntryPoint(name="bad", _loader=lambda: object())])
+    monkeypatch.setattr(uut, "entry_points", lambda: eps)
+
+    reg = uut.RepositoryRegistry(
+        builtins={}, externals=uut._load_entrypoint_repo_factories(group="g")
+    )
+
+    with pytest.raises(uut.RepositoryEntrypointError) as ei:
+        reg.lookup("bad")
+    assert "must load a callable factory; got object" in str(ei.value)
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import json
+import pickle
+import threading
+from concurrent.futures import Future
 from dataclasses import dataclass
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any, Mapping, Sequence
 
 import pytest
+from packaging.markers import Marker
+from packaging.requirements import Requirement
 from packaging.specifiers import SpecifierSet
 from packaging.tags import Tag
 from packaging.version import Version
@@ -15,9 +20,16 @@ import project_resolution_engine.internal.resolvelib as resolvelib_mod
 from project_resolution_engine.internal.resolvelib import (
     ProjectResolutionProvider,
     _env_python_version,
-    _expand_tags_for_context,
+    _marker_uses_extra,
+    _load_json_bytes,
+    _merged_specifier_set,
+    _requires_python_allows,
+    _specifier_contains,
+    _read_pickled_pep691,
     _safe_url_basename,
+    _tag_str,
     _version_sort_key,
+    _write_pickled_pep691,
     path_from_file_uri,
     resolve as resolve_via_resolvelib,
 )
@@ -32,6 +44,14 @@ from unit.helpers.models_helper import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _isolate_provider_caches():
+    # Parsed index/core metadata caches are process-wide; isolate each test.
+    ProjectResolutionProvider.clear_caches()
+    yield
+    ProjectResolutionProvider.clear_caches()
+
+
 @pytest.fixture
 def patch_pep691_metadata(monkeypatch):
     monkeypatch.setattr(
@@ -47,26 +67,27 @@ def patch_pep691_metadata(monkeypatch):
 #
 # Classes (top to bottom):
 #   C001 = ProjectResolutionProvider
+#   C002 = _BoundedCache
 #
 # Module functions (top to bottom):
-#   C000F001 = _expand_tags_for_context
 #   C000F002 = _safe_url_basename
 #   C000F003 = path_from_file_uri
 #   C000F004 = _env_python_version
 #   C000F005 = _version_sort_key
 #   C000F006 = resolve
+#   C000F007 = _tag_str
+#   C000F008 = _merged_specifier_set
+#   C000F009 = _marker_uses_extra
+#   C000F010 = _read_pickled_pep691
+#   C000F011 = _write_pickled_pep691
+#   C000F012 = _load_json_bytes
+#   C000F013 = _parse_wheel_filename_cached
+#   C000F014 = _specifier_contains
+#   C000F015 = _requires_python_allows
 # ------------------------------------------------------------------------------
 #
 #
 # ------------------------------------------------------------------------------
-# ## _expand_tags_for_context(*, python_version: Version, context_tag: Tag) -> frozenset[Tag]
-#    (Module ID: C000, Function ID: F001)
-# ------------------------------------------------------------------------------
-# C000F001B0001: context_tag.interpreter.startswith("cp") and context_tag.interpreter[2:].isdigit() -> returns frozenset including base tags plus {Tag(cp,"abi3",plat), Tag(cp,"none",plat)}
-# C000F001B0002: else (not (context_tag.interpreter.startswith("cp") and context_tag.interpreter[2:].isdigit())) -> returns frozenset containing only the initial 5 tags set (no cp abi fallbacks)
-#
-#
-# ------------------------------------------------------------------------------
 # ## _safe_url_basename(url: str) -> str
 #    (Module ID: C000, Function ID: F002)
 # ------------------------------------------------------------------------------
@@ -105,7 +126,9 @@ def patch_pep691_metadata(monkeypatch):
 # ## ProjectResolutionProvider.__init__(self, *, services: ResolutionServices, env: ResolutionEnv, index_base: str = "https://pypi.org/simple") -> None
 #    (Class ID: C001, Method ID: M001)
 # ------------------------------------------------------------------------------
-# C001M001B0001: init executes -> sets _services/_env/_index_base/_policy, initializes caches and requested extras dicts
+# C001M001B0001: init executes -> sets _services/_env/_index_base/_policy, parses _py_version/_py_version_str from env once, initializes caches and requested extras dicts
+# C001M001B0002: getattr(env, "supported_tags_ordered", None) is truthy -> _ordered_tags/_tag_rank built from it (first occurrence wins)
+# C001M001B0003: supported_tags_ordered missing, None or empty -> _ordered_tags/_tag_rank built from env.supported_tags
 #
 #
 # ------------------------------------------------------------------------------
@@ -130,9 +153,9 @@ def patch_pep691_metadata(monkeypatch):
 # ## ProjectResolutionProvider.find_matches(self, identifier: str, requirements: Mapping[str, Iterator[ResolverRequirement]], incompatibilities: Mapping[str, Iterator[ResolverCandidate]]) -> Iterable[ResolverCandidate]
 #    (Class ID: C001, Method ID: M004)
 # ------------------------------------------------------------------------------
-# C001M004B0001: executes -> name = canonicalize_name(identifier); req_list materialized; _update_requested_extras called; bad computed
+# C001M004B0001: executes -> name = _canonicalize_name(identifier); req_list materialized; _update_requested_extras called; bad computed
 # C001M004B0002: uri_candidates = self._build_uri_candidates(...) returns not None -> returns self._sort_candidates(uri_candidates)
-# C001M004B0003: uri_candidates is None -> combined_spec computed; pep691 loaded; py_version computed; named_candidates built; returns self._sort_candidates(named_candidates)
+# C001M004B0003: uri_candidates is None -> combined_spec computed; pep691 loaded; named_candidates built with self._py_version_str; returns self._sort_candidates(named_candidates)
 #
 #
 # ------------------------------------------------------------------------------
@@ -155,15 +178,15 @@ def patch_pep691_metadata(monkeypatch):
 #
 #
 # ------------------------------------------------------------------------------
-# ## ProjectResolutionProvider._compute_bad_set(name: str, incompatibilities: Mapping[str, Iterator[ResolverCandidate]]) -> set[tuple[str, str, str]]
+# ## ProjectResolutionProvider._compute_bad_set(name: str, incompatibilities: Mapping[str, Iterator[ResolverCandidate]]) -> frozenset[tuple[str, str, str]]
 #    (Class ID: C001, Method ID: M007)
 # ------------------------------------------------------------------------------
-# C001M007B0001: incompatibilities.get(name, iter(())) yields 0 -> returns empty set()
-# C001M007B0002: incompatibilities.get(name, iter(())) yields >= 1 -> returns set of (c.name, c.wheel_key.version, c.wheel_key.tag) for all yielded candidates
+# C001M007B0001: incompatibilities.get(name) is None -> returns the shared empty _NO_BAD frozenset
+# C001M007B0002: incompatibilities.get(name) is an iterator -> returns frozenset of (c.name, c.wheel_key.version, c.wheel_key.tag) for all yielded candidates
 #
 #
 # ------------------------------------------------------------------------------
-# ## ProjectResolutionProvider._build_uri_candidates(self, name: str, req_list: Sequence[ResolverRequirement], bad: set[tuple[str, str, str]]) -> list[ResolverCandidate] | None
+# ## ProjectResolutionProvider._build_uri_candidates(self, name: str, req_list: Sequence[ResolverRequirement], bad: frozenset[tuple[str, str, str]]) -> list[ResolverCandidate] | None
 #    (Class ID: C001, Method ID: M008)
 # ------------------------------------------------------------------------------
 # C001M008B0001: uri_reqs = [r for r in req_list if r.uri] results empty -> returns None
@@ -174,14 +197,14 @@ def patch_pep691_metadata(monkeypatch):
 #
 #
 # ------------------------------------------------------------------------------
-# ## ProjectResolutionProvider._candidate_from_uri_req(self, *, name: str, req: ResolverRequirement, bad: set[tuple[str, str, str]]) -> ResolverCandidate | None
+# ## ProjectResolutionProvider._candidate_from_uri_req(self, *, name: str, req: ResolverRequirement, bad: frozenset[tuple[str, str, str]]) -> ResolverCandidate | None
 #    (Class ID: C001, Method ID: M009)
 # ------------------------------------------------------------------------------
-# C001M009B0001: try: filename = _safe_url_basename(req.uri); parse_wheel_filename(filename) raises -> raises ValueError("Direct URI requirement does not look like a wheel file")
-# C001M009B0002: parse succeeds and if canonicalize_name(dist) != name -> returns None
+# C001M009B0001: try: filename = _safe_url_basename(req.uri); self._parse_wheel_filename(filename) raises -> raises ValueError("Direct URI requirement does not look like a wheel file")
+# C001M009B0002: parse succeeds and if _canonicalize_name(dist) != name -> returns None
 # C001M009B0003: dist matches; best_tag = self._best_tag(file_tag_set) is None -> returns None
 # C001M009B0004: best_tag found; tup in bad -> returns None
-# C001M009B0005: req.version is not None and not req.version.contains(wk.version) -> returns None
+# C001M009B0005: req.version is not None and not _specifier_contains(req.version, ver) -> returns None
 # C001M009B0006: else -> returns ResolverCandidate(wheel_key=wk) with origin_uri=req.uri and satisfied_tags from filename tags
 #
 #
@@ -189,40 +212,48 @@ def patch_pep691_metadata(monkeypatch):
 # ## ProjectResolutionProvider._combined_spec(req_list: Sequence[ResolverRequirement]) -> SpecifierSet | None
 #    (Class ID: C001, Method ID: M010)
 # ------------------------------------------------------------------------------
-# C001M010B0001: req_list loop executes 0 times -> returns None
-# C001M010B0002: loop executes >= 1; all r.version is None -> returns None
-# C001M010B0003: loop sees first r.version not None and combined_spec is None -> combined_spec becomes r.version; returns that if no later versions
-# C001M010B0004: loop sees later r.version not None and combined_spec not None -> combined_spec becomes SpecifierSet(f"{combined_spec},{r.version}"); returns final combined_spec
+# C001M010B0001: req_list is empty -> specs empty -> returns None
+# C001M010B0002: req_list non-empty; all r.version is None -> specs empty -> returns None
+# C001M010B0003: exactly one r.version not None -> returns that r.version
+# C001M010B0004: two or more r.version not None -> returns _merged_specifier_set(frozenset of their SpecifierSets), merged once
 #
 #
 # ------------------------------------------------------------------------------
 # ## ProjectResolutionProvider._load_pep691(self, name: str) -> Pep691Metadata
 #    (Class ID: C001, Method ID: M011)
 # ------------------------------------------------------------------------------
-# C001M011B0001: pep691 = self._index_cache.get(name) is not None -> returns cached pep691 (no service calls)
-# C001M011B0002: pep691 cache miss -> calls services.index_metadata.resolve(IndexMetadataKey(project=name, index_base=self._index_base)); reads JSON; Pep691Metadata.from_mapping; stores in cache; returns pep691
+# C001M011B0001: pep691 = self._index_cache.get((self._index_base, name)) is not None -> returns cached pep691 (no service calls)
+# C001M011B0002: pep691 cache miss -> calls services.index_metadata.resolve(IndexMetadataKey(project=name, index_base=self._index_base)); reads JSON; Pep691Metadata.from_mapping; stores in the class-level cache under (index_base, name); returns pep691
+# C001M011B0003: in-memory miss and disk_path not None and _read_pickled_pep691 returns metadata -> JSON not read; stored in memory; returned
+# C001M011B0004: in-memory miss and disk_path not None and disk miss -> JSON parsed; _write_pickled_pep691 called; stored in memory; returned
+# C001M011B0005: miss, but the page is cached by the time _index_lock is held -> returns it (no service calls)
+# C001M011B0006: another caller is already loading the page -> waits on its future in _index_loads and returns its result (no service calls)
+# C001M011B0007: loading the page raises -> drops the future from _index_loads, sets the exception on it, and re-raises
 #
 #
 # ------------------------------------------------------------------------------
-# ## ProjectResolutionProvider._build_index_candidates(self, *, name: str, pep691: Pep691Metadata, combined_spec: SpecifierSet | None, py_version: str, bad: set[tuple[str, str, str]]) -> list[ResolverCandidate]
+# ## ProjectResolutionProvider._build_index_candidates(self, *, name: str, pep691: Pep691Metadata, combined_spec: SpecifierSet | None, py_version: str, bad: frozenset[tuple[str, str, str]]) -> list[ResolverCandidate]
 #    (Class ID: C001, Method ID: M012)
 # ------------------------------------------------------------------------------
-# C001M012B0001: for f in pep691.files executes 0 times -> returns []
-# C001M012B0002: for f executes >= 1 and _candidate_from_index_file returns None -> does not append; returns candidates (possibly empty)
-# C001M012B0003: for f executes >= 1 and _candidate_from_index_file returns candidate -> appends; returns candidates list
+# C001M012B0001: self._index_wheel_candidates(...) is empty -> returns []
+# C001M012B0002: prefiltered entry with combined_spec not None and not _specifier_contains(combined_spec, ver) -> skipped
+# C001M012B0003: prefiltered entry with (name, version, tag) in bad -> skipped
+# C001M012B0004: prefiltered entry passes both filters -> appended; returns candidates list
+# C001M012B0005: bad is empty and combined_spec is None -> returns every prefiltered candidate
+# C001M012B0006: bad is empty and combined_spec is not None -> returns prefiltered candidates admitted by _specifier_contains
 #
 #
 # ------------------------------------------------------------------------------
-# ## ProjectResolutionProvider._candidate_from_index_file(self, *, name: str, f: Pep691FileMetadata, combined_spec: SpecifierSet | None, py_version: str, bad: set[tuple[str, str, str]]) -> ResolverCandidate | None
+# ## ProjectResolutionProvider._candidate_from_index_file(self, *, name: str, f: Pep691FileMetadata, combined_spec: SpecifierSet | None, py_version: str, bad: frozenset[tuple[str, str, str]]) -> ResolverCandidate | None
 #    (Class ID: C001, Method ID: M013)
 # ------------------------------------------------------------------------------
 # C001M013B0001: if not f.filename.lower().endswith(".whl") -> returns None
 # C001M013B0002: if f.yanked and self._policy.yanked_wheel_policy == YankedWheelPolicy.SKIP -> returns None
-# C001M013B0003: try: parse_wheel_filename(f.filename) raises -> returns None
-# C001M013B0004: parse succeeds and if canonicalize_name(dist) != name -> returns None
-# C001M013B0005: combined_spec is not None and not combined_spec.contains(ver_str) -> returns None
-# C001M013B0006: f.requires_python truthy and try: not SpecifierSet(f.requires_python).contains(py_version) -> returns None
-# C001M013B0007: f.requires_python truthy and except Exception in requires_python parsing -> ignores and continues (no return)
+# C001M013B0003: try: self._parse_wheel_filename(f.filename) raises -> returns None
+# C001M013B0004: _canonicalize_name(f.filename.partition("-")[0]) != name -> returns None before parsing
+# C001M013B0005: combined_spec is not None and not _specifier_contains(combined_spec, ver) -> returns None
+# C001M013B0006: f.requires_python truthy and not _requires_python_allows(f.requires_python, py_version) -> returns None
+# C001M013B0007: f.requires_python truthy and unparseable (_requires_python_allows returns True) -> continues (no return)
 # C001M013B0008: best_tag = self._best_tag(file_tag_set) is None -> returns None
 # C001M013B0009: hash_spec = self._best_hash(f) is None -> returns None
 # C001M013B0010: tup in bad -> returns None
@@ -230,11 +261,11 @@ def patch_pep691_metadata(monkeypatch):
 #
 #
 # ------------------------------------------------------------------------------
-# ## ProjectResolutionProvider._best_tag(self, file_tag_set: set[str]) -> str | None
+# ## ProjectResolutionProvider._best_tag(self, file_tag_set: Iterable[str]) -> str | None
 #    (Class ID: C001, Method ID: M014)
 # ------------------------------------------------------------------------------
-# C001M014B0001: ordered = getattr(self._env, "supported_tags_ordered", None) is not None -> returns first t in ordered where t in file_tag_set, else None
-# C001M014B0002: ordered is None -> ordered = self._env.supported_tags; returns first t in ordered where t in file_tag_set, else None
+# C001M014B0001: some t in file_tag_set is in self._tag_rank -> returns the supported tag with the lowest rank
+# C001M014B0002: no t in file_tag_set is in self._tag_rank -> returns None
 #
 #
 # ------------------------------------------------------------------------------
@@ -262,8 +293,8 @@ def patch_pep691_metadata(monkeypatch):
 #    (Class ID: C001, Method ID: M017)
 # ------------------------------------------------------------------------------
 # C001M017B0001: wk.origin_uri is None -> returns () (empty tuple)
-# C001M017B0002: wk.origin_uri not None and meta is found in _core_metadata_cache -> uses cached meta (no services.core_metadata.resolve call)
-# C001M017B0003: wk.origin_uri not None and meta cache miss -> calls services.core_metadata.resolve(CoreMetadataKey(...)); reads text; Pep658Metadata.from_core_metadata_text; caches; continues
+# C001M017B0002: wk.origin_uri not None and meta is found in _core_metadata_cache[wk.origin_uri] -> uses cached meta (no services.core_metadata.resolve call)
+# C001M017B0003: wk.origin_uri not None and meta cache miss -> calls services.core_metadata.resolve(CoreMetadataKey(...)); reads text; Pep658Metadata.from_core_metadata_text; caches under wk.origin_uri; continues
 # C001M017B0004: requested_extras = self._requested_extras_by_name.get(wk.name, frozenset()) is empty -> marker_env_base["extra"] defaulted to ""; uses base env for marker evaluation
 # C001M017B0005: requested_extras is non empty -> marker_env_base["extra"] defaulted to ""; per-extra evaluation is used when marker exists
 # C001M017B0006: for raw in meta.requires_dist executes 0 times -> returns [] (empty deps list)
@@ -276,6 +307,8 @@ def patch_pep691_metadata(monkeypatch):
 # C001M017B0013: req.marker is None -> dependency included
 # C001M017B0014: dependency included -> appends ResolverRequirement(wheel_spec=WheelSpec(name=req.name, version=req.specifier if str(req.specifier) else None, extras=frozenset(req.extras), marker=req.marker, uri=req.url if req.url else None))
 # C001M017B0015: end -> returns deps list
+# C001M017B0016: req.marker is not None and requested_extras truthy but not _marker_uses_extra(req.marker) -> evaluated once with marker_env_base; included iff True
+# C001M017B0017: before returning -> self.prefetch_indexes(names of deps without a uri)
 #
 #
 # ------------------------------------------------------------------------------
@@ -293,10 +326,179 @@ def patch_pep691_metadata(monkeypatch):
 #
 #
 # ------------------------------------------------------------------------------
+# ## ProjectResolutionProvider._index_wheel_candidates(self, *, name: str, pep691: Pep691Metadata, py_version: str) -> list[tuple[Version, ResolverCandidate]]
+#    (Class ID: C001, Method ID: M021)
+# ------------------------------------------------------------------------------
+# C001M021B0001: cached entry for (name, py_version) built from the same pep691 object -> returns cached list
+# C001M021B0002: no cached entry, or built from another pep691 object -> runs _accept_parsed_wheel(combined_spec=None) per entry of _parsed_index_files; keeps accepted (parsed.version, _index_candidate(...)) pairs; caches and returns them
+# C001M021B0003: parsed entry rejected by _is_non_yanked_wheel_file -> skipped (continue)
+#
+#
+# ------------------------------------------------------------------------------
+# ## ProjectResolutionProvider._pep691_disk_path(self, name: str, idx_record: Any, idx_path: Path) -> Path | None
+#    (Class ID: C001, Method ID: M022)
+# ------------------------------------------------------------------------------
+# C001M022B0001: self._pep691_cache_dir is None -> returns None
+# C001M022B0002: idx_record.content_sha256 truthy -> validator is the sha; returns cache_dir / "<sha256 hex>.pickle"
+# C001M022B0003: no content_sha256 and idx_path.stat() succeeds -> validator is "size:mtime_ns"; returns cache_dir / "<sha256 hex>.pickle"
+# C001M022B0004: no content_sha256 and idx_path.stat() raises OSError -> returns None
+#
+#
+# ------------------------------------------------------------------------------
+# ## ProjectResolutionProvider._parse_index_file(f: Pep691FileMetadata, name: str) -> _ParsedFile | None
+#    (Class ID: C001, Method ID: M023)
+# ------------------------------------------------------------------------------
+# C001M023B0001: not f.filename.lower().endswith(".whl") -> returns None
+# C001M023B0002: _canonicalize_name(filename.partition("-")[0]) != name -> returns None
+# C001M023B0003: _parse_wheel_filename(filename) raises -> returns None
+# C001M023B0004: else -> returns _ParsedFile(file, dist, version, version_str, tag_strs, hash_spec=_best_hash(f))
+#
+#
+# ------------------------------------------------------------------------------
+# ## ProjectResolutionProvider._parsed_index_files(self, name: str, pep691: Pep691Metadata) -> tuple[_ParsedFile, ...]
+#    (Class ID: C001, Method ID: M024)
+# ------------------------------------------------------------------------------
+# C001M024B0001: class-level entry for (index_base, name) built from the same pep691 object -> returns cached table
+# C001M024B0002: no entry, or built from another pep691 object -> parses every file, drops None results, caches and returns the table
+#
+#
+# ------------------------------------------------------------------------------
+# ## ProjectResolutionProvider._accept_parsed_wheel(self, parsed: _ParsedFile, *, name: str, combined_spec: SpecifierSet | None, py_version: str) -> tuple[str, str, frozenset[str], tuple[str, str]] | None
+#    (Class ID: C001, Method ID: M025)
+# ------------------------------------------------------------------------------
+# C001M025B0001: not self._matches_tag(...) -> returns None
+# C001M025B0002: best_tag is None or parsed.hash_spec is None -> returns None
+# C001M025B0003: else -> returns (parsed.version_str, best_tag, parsed.tag_strs, parsed.hash_spec)
+#
+#
+# ------------------------------------------------------------------------------
+# ## ProjectResolutionProvider._index_candidate(name: str, f: Pep691FileMetadata, result: tuple[str, str, frozenset[str], tuple[str, str]]) -> ResolverCandidate
+#    (Class ID: C001, Method ID: M026)
+# ------------------------------------------------------------------------------
+# C001M026B0001: executes -> returns ResolverCandidate(wheel_key=WheelKey(...)) with requires_python, origin_uri=f.url, and hash_algorithm/content_hash set
+#
+#
+# ------------------------------------------------------------------------------
+# ## ProjectResolutionProvider.prefetch_indexes(self, names: Iterable[str]) -> None
+#    (Class ID: C001, Method ID: M027)
+# ------------------------------------------------------------------------------
+# C001M027B0001: self._prefetch_workers < 1 -> returns without loading anything
+# C001M027B0002: fewer than two canonical names missing from _index_cache -> returns without loading anything
+# C001M027B0003: two or more pending names -> _load_pep691 runs for each on a ThreadPoolExecutor of min(len(pending), workers) threads
+# C001M027B0004: a prefetch load raises -> logged at debug level and swallowed
+#
+#
+# ------------------------------------------------------------------------------
+# ## ProjectResolutionProvider.clear_caches(cls) -> None
+#    (Class ID: C001, Method ID: M020)
+# ------------------------------------------------------------------------------
+# C001M020B0001: executes -> clears the class-level _index_cache, _core_metadata_cache and _parsed_files_cache
+#
+#
+# ------------------------------------------------------------------------------
+# ## ProjectResolutionProvider._parse_wheel_filename(filename: str) -> _ParsedWheelFilename
+#    (Class ID: C001, Method ID: M019)
+# ------------------------------------------------------------------------------
+# C001M019B0001: _parse_wheel_filename_cached(filename) returns a tuple -> returns it
+# C001M019B0002: _parse_wheel_filename_cached(filename) returns an error message -> raises a new ValueError with it
+#
+#
+# ------------------------------------------------------------------------------
 # ## resolve(*, services, env: ResolutionEnv, roots: Sequence[ResolverRequirement]) -> Result[ResolverRequirement, ResolverCandidate, str]
 #    (Module ID: C000, Function ID: F006)
 # ------------------------------------------------------------------------------
-# C000F006B0001: executes -> constructs ProjectResolutionProvider(services=services, env=env), ProjectResolutionReporter(), Resolver(provider, reporter); returns resolver.resolve(roots)
+# C000F006B0001: executes -> constructs ProjectResolutionProvider(services=services, env=env, pep691_cache_dir=..., prefetch_workers=...); provider.prefetch_indexes(names of roots without a uri); ProjectResolutionReporter(), Resolver(provider, reporter); returns resolver.resolve(roots)
+#
+#
+# ------------------------------------------------------------------------------
+# ## _tag_str(tag: Tag) -> str
+#    (Module ID: C000, Function ID: F007)
+# ------------------------------------------------------------------------------
+# C000F007B0001: executes -> returns str(tag) (memoized per tag)
+#
+#
+# ------------------------------------------------------------------------------
+# ## _merged_specifier_set(specs: frozenset[SpecifierSet]) -> SpecifierSet
+#    (Module ID: C000, Function ID: F008)
+# ------------------------------------------------------------------------------
+# C000F008B0001: executes -> returns the & of all specs (memoized per set of SpecifierSets)
+#
+#
+# ------------------------------------------------------------------------------
+# ## _marker_uses_extra(marker: Marker) -> bool
+#    (Module ID: C000, Function ID: F009)
+# ------------------------------------------------------------------------------
+# C000F009B0001: "extra" in str(marker) -> returns True
+# C000F009B0002: "extra" not in str(marker) -> returns False
+#
+#
+# ------------------------------------------------------------------------------
+# ## _read_pickled_pep691(path: Path) -> Pep691Metadata | None
+#    (Module ID: C000, Function ID: F010)
+# ------------------------------------------------------------------------------
+# C000F010B0001: open/unpickle raises -> returns None
+# C000F010B0002: unpickled object is a Pep691Metadata -> returns it
+# C000F010B0003: unpickled object is anything else -> returns None
+#
+#
+# ------------------------------------------------------------------------------
+# ## _write_pickled_pep691(path: Path, pep691: Pep691Metadata) -> None
+#    (Module ID: C000, Function ID: F011)
+# ------------------------------------------------------------------------------
+# C000F011B0001: write succeeds -> pickle written to a temp file and os.replace'd onto path
+# C000F011B0002: OSError/PicklingError -> temp file (if created) removed; nothing raised
+#
+#
+# ------------------------------------------------------------------------------
+# ## _load_json_bytes(path: Path) -> Any
+#    (Module ID: C000, Function ID: F012)
+# ------------------------------------------------------------------------------
+# C000F012B0001: orjson importable -> returns _orjson.loads(path.read_bytes())
+# C000F012B0002: orjson not installed -> returns json.loads(path.read_bytes())
+#
+#
+# ------------------------------------------------------------------------------
+# ## _parse_wheel_filename_cached(filename: str) -> _ParsedWheelFilename | ValueError
+#    (Module ID: C000, Function ID: F013)
+# ------------------------------------------------------------------------------
+# C000F013B0001: parse_wheel_filename succeeds -> returns (and memoizes) the parsed tuple
+# C000F013B0002: parse_wheel_filename raises ValueError -> returns (and memoizes) str(exc)
+#
+#
+# ------------------------------------------------------------------------------
+# ## _specifier_contains(spec: SpecifierSet, version: Version) -> bool
+#    (Module ID: C000, Function ID: F014)
+# ------------------------------------------------------------------------------
+# C000F014B0001: executes -> returns spec.contains(version) (memoized per pair)
+#
+#
+# ------------------------------------------------------------------------------
+# ## _requires_python_allows(requires_python: str, py_version: str) -> bool
+#    (Module ID: C000, Function ID: F015)
+# ------------------------------------------------------------------------------
+# C000F015B0001: requires_python parses -> returns SpecifierSet(requires_python).contains(py_version) (memoized per pair)
+# C000F015B0002: requires_python does not parse -> returns True
+#
+#
+# ------------------------------------------------------------------------------
+# ## _BoundedCache.get(self, key) -> _V | None
+#    (Class ID: C002, Method ID: M001)
+# ------------------------------------------------------------------------------
+# C002M001B0001: key is cached -> marks it most recently used and returns its value
+# C002M001B0002: key is not cached -> returns None
+#
+# ------------------------------------------------------------------------------
+# ## _BoundedCache.__setitem__(self, key, value) -> None
+#    (Class ID: C002, Method ID: M002)
+# ------------------------------------------------------------------------------
+# C002M002B0001: len <= maxsize after storing -> nothing evicted
+# C002M002B0002: len > maxsize after storing -> evicts the least recently used entry
+#
+# ------------------------------------------------------------------------------
+# ## _BoundedCache.__contains__ / __len__ / clear
+#    (Class ID: C002, Method ID: M003)
+# ------------------------------------------------------------------------------
+# C002M003B0001: executes -> membership, size and clearing follow the stored entries
 #
 #
 # ------------------------------------------------------------------------------
@@ -517,21 +719,98 @@ _BEST_HASH_CASES = [
 # ==============================================================================
 
 
-def test_expand_tags_for_context_cp_and_non_cp():
-    # Covers: C000F001B0001, C000F001B0002
-    pyver = Version("3.11")
+def test_tag_str_formats_and_memoizes():
+    # Covers: C000F007B0001
+    _tag_str.cache_clear()
 
-    seed_cp = Tag("cp311", "cp311", "manylinux_2_17_x86_64")
-    tags_cp = _expand_tags_for_context(python_version=pyver, context_tag=seed_cp)
-    assert Tag("cp311", "abi3", "manylinux_2_17_x86_64") in tags_cp
-    assert Tag("cp311", "none", "manylinux_2_17_x86_64") in tags_cp
+    assert _tag_str(Tag("cp311", "abi3", "manylinux_2_17_x86_64")) == (
+        "cp311-abi3-manylinux_2_17_x86_64"
+    )
+    assert _tag_str(Tag("cp311", "abi3", "manylinux_2_17_x86_64")) == (
+        "cp311-abi3-manylinux_2_17_x86_64"
+    )
+    assert _tag_str.cache_info().hits == 1
 
-    seed_non = Tag("py3", "none", "any")
-    tags_non = _expand_tags_for_context(python_version=pyver, context_tag=seed_non)
-    assert Tag("py3", "abi3", "any") not in tags_non
-    assert (
-        Tag("py3", "none", "any") in tags_non
-    )  # base tag set still includes context_tag
+
+def test_merged_specifier_set_is_order_insensitive_and_memoized():
+    # Covers: C000F008B0001
+    _merged_specifier_set.cache_clear()
+
+    first = _merged_specifier_set(
+        frozenset({SpecifierSet(">=1.0"), SpecifierSet("<2.0")})
+    )
+    second = _merged_specifier_set(
+        frozenset({SpecifierSet("<2.0"), SpecifierSet(">=1.0")})
+    )
+
+    assert str(first) == "<2.0,>=1.0"
+    assert second is first
+
+
+def test_specifier_contains_is_memoized():
+    # Covers: C000F014B0001
+    spec = _merged_specifier_set(
+        frozenset({SpecifierSet(">=1.0"), SpecifierSet("<2.0")})
+    )
+
+    assert _specifier_contains(spec, Version("1.5")) is True
+    assert _specifier_contains(spec, Version("2.0")) is False
+    assert _specifier_contains(spec, Version("1.5")) is True
+    assert _specifier_contains.cache_info().hits == 1
+
+
+@pytest.mark.parametrize(
+    "requires_python, expected",
+    [
+        pytest.param(">=3.8", True, id="C000F015B0001-allows"),
+        pytest.param("<3.0", False, id="C000F015B0001-excludes"),
+        pytest.param("not-a-spec", True, id="C000F015B0002"),
+    ],
+)
+def test_requires_python_allows(requires_python: str, expected: bool):
+    assert _requires_python_allows(requires_python, "3.11") is expected
+    assert _requires_python_allows(requires_python, "3.11") is expected
+    assert _requires_python_allows.cache_info().hits == 1
+
+
+@pytest.mark.parametrize(
+    "marker, expected",
+    [
+        pytest.param('extra == "test"', True, id="C000F009B0001"),
+        pytest.param('python_version >= "3.8"', False, id="C000F009B0002"),
+    ],
+)
+def test_marker_uses_extra(marker: str, expected: bool):
+    # Covers: C000F009B0001, C000F009B0002
+    assert _marker_uses_extra(Marker(marker)) is expected
+
+
+def test_extra_free_marker_is_evaluated_once_for_many_extras():
+    # Covers: C001M017B0016
+    req = Requirement('dep; python_version >= "3.8"')
+    calls: list[dict[str, str]] = []
+    real_marker = req.marker
+
+    class _CountingMarker:
+        def __str__(self) -> str:
+            return str(real_marker)
+
+        def __hash__(self) -> int:
+            return hash(real_marker)
+
+        def evaluate(self, environment: dict[str, str]) -> bool:
+            calls.append(environment)
+            return real_marker.evaluate(environment=environment)
+
+    req.marker = _CountingMarker()
+    env = {"python_version": "3.11", "extra": ""}
+
+    applies = ProjectResolutionProvider._requirement_applies_to_extras(
+        req, frozenset({"a", "b", "c"}), env
+    )
+
+    assert applies is True
+    assert calls == [env]
 
 
 @pytest.mark.parametrize("row", _SAFE_URL_BASENAME_CASES)
@@ -575,6 +854,15 @@ def test_version_sort_key_cases(row: dict[str, Any]):
     assert k[0] == row["expect_first"]
 
 
+def test_version_sort_key_is_memoized():
+    # Covers: C000F005B0001
+    _version_sort_key.cache_clear()
+
+    first = _version_sort_key("1.2.3")
+    assert _version_sort_key("1.2.3") is first
+    assert _version_sort_key.cache_info().hits == 1
+
+
 # ==============================================================================
 # Tests: provider basics
 # ==============================================================================
@@ -582,11 +870,16 @@ def test_version_sort_key_cases(row: dict[str, Any]):
 
 def test_provider_init_and_identify():
     # Covers: C001M001B0001, C001M002B0001
-    env = _FakeEnv(supported_tags=("py3-none-any",))
+    env = _FakeEnv(
+        supported_tags=("py3-none-any",),
+        marker_environment={"python_full_version": "3.11.7"},
+    )
     services = _FakeServices(
         index_metadata=_FakeCoordinator({}), core_metadata=_FakeCoordinator({})
     )
     p = ProjectResolutionProvider(services=services, env=env)
+    assert p._py_version == Version("3.11.7")
+    assert p._py_version_str == "3.11.7"
 
     r = _req(name="My-Pkg", version="==1.0")
     c = FakeResolverCandidate(
@@ -656,6 +949,7 @@ def test_compute_bad_set_empty_and_non_empty():
         wheel_key=_wk(name="demo", version="2.0.0", tag="py3-none-any")
     )
     bad = ProjectResolutionProvider._compute_bad_set("demo", {"demo": iter((c1, c2))})
+    assert isinstance(bad, frozenset)
     assert ("demo", "1.0.0", "py3-none-any") in bad
     assert ("demo", "2.0.0", "py3-none-any") in bad
 
@@ -674,7 +968,7 @@ def test_build_uri_candidates_none_and_invalid_scheme_and_append():
         index_metadata=_FakeCoordinator({}), core_metadata=_FakeCoordinator({})
     )
     p = ProjectResolutionProvider(services=services, env=env)
-    bad: set[tuple[str, str, str]] = set()
+    bad: frozenset[tuple[str, str, str]] = frozenset()
 
     # B0001: no uri requirements -> None
     assert (
@@ -901,8 +1195,309 @@ def test_load_pep691_cache_miss_then_hit(tmp_path: Path, patch_pep691_metadata):
     assert len(index_coord.calls) == 1  # cache hit, no new calls
 
 
+def _blocking_index_provider(
+    tmp_path: Path, release: threading.Event
+) -> tuple[ProjectResolutionProvider, _FakeCoordinator]:
+    payload = {"name": "demo", "files": [], "last_serial": 1}
+    rec = _FakeRecord(destination_uri=_write_json(tmp_path, payload).as_uri())
+    index_coord = _FakeCoordinator({"default": rec})
+    unblocked = index_coord.resolve
+
+    def _resolve(key: Any) -> _FakeRecord:
+        release.wait(timeout=5)
+        return unblocked(key)
+
+    index_coord.resolve = _resolve  # type: ignore[method-assign]
+    services = _FakeServices(
+        index_metadata=index_coord, core_metadata=_FakeCoordinator({})
+    )
+    env = _FakeEnv(supported_tags=("py3-none-any",))
+    return ProjectResolutionProvider(services=services, env=env), index_coord
+
+
+def test_load_pep691_rechecks_cache_under_lock(
+    tmp_path: Path, patch_pep691_metadata, monkeypatch: pytest.MonkeyPatch
+):
+    # Covers: C001M011B0005
+    cached = FakePep691Metadata(name="demo", files=[])
+
+    class _FilledAfterFirstGet(dict):
+        def get(self, key: Any, default: Any = None) -> Any:
+            if key in self:
+                return self[key]
+            self[key] = cached
+            return default
+
+    monkeypatch.setattr(
+        ProjectResolutionProvider, "_index_cache", _FilledAfterFirstGet()
+    )
+    p, index_coord = _blocking_index_provider(tmp_path, threading.Event())
+
+    assert p._load_pep691("demo") is cached
+    assert index_coord.calls == []
+
+
+def test_load_pep691_concurrent_callers_share_one_load(
+    tmp_path: Path, patch_pep691_metadata
+):
+    # Covers: C001M011B0002, C001M011B0006
+    release = threading.Event()
+    p, index_coord = _blocking_index_provider(tmp_path, release)
+    cache_key = (p._index_base, "demo")
+
+    results: list[Any] = []
+    loaders = [
+        threading.Thread(target=lambda: results.append(p._load_pep691("demo")))
+        for _ in range(2)
+    ]
+    loaders[0].start()
+    while cache_key not in p._index_loads:
+        threading.Event().wait(0.001)
+    loaders[1].start()
+    release.set()
+    for t in loaders:
+        t.join(timeout=5)
+
+    assert len(results) == 2
+    assert results[0] is results[1]
+    assert len(index_coord.calls) == 1
+    assert p._index_loads == {}
+
+
+def test_load_pep691_waits_on_in_flight_future(tmp_path: Path, patch_pep691_metadata):
+    # Covers: C001M011B0006
+    p, index_coord = _blocking_index_provider(tmp_path, threading.Event())
+    loaded = FakePep691Metadata(name="demo", files=[])
+    future: Future[Any] = Future()
+    future.set_result(loaded)
+    p._index_loads[(p._index_base, "demo")] = future
+    try:
+        assert p._load_pep691("demo") is loaded
+    finally:
+        p._index_loads.clear()
+    assert index_coord.calls == []
+
+
+def test_load_pep691_failure_releases_in_flight_future(
+    tmp_path: Path, patch_pep691_metadata, monkeypatch: pytest.MonkeyPatch
+):
+    # Covers: C001M011B0007
+    p, _ = _blocking_index_provider(tmp_path, threading.Event())
+    seen: list[Future[Any]] = []
+
+    def _boom(name: str) -> Any:
+        seen.append(p._index_loads[(p._index_base, name)])
+        raise RuntimeError("index down")
+
+    monkeypatch.setattr(p, "_read_pep691", _boom)
+
+    with pytest.raises(RuntimeError, match="index down"):
+        p._load_pep691("demo")
+
+    assert p._index_loads == {}
+    assert isinstance(seen[0].exception(), RuntimeError)
+
+
+def test_load_pep691_cache_is_shared_per_index_base(
+    tmp_path: Path, patch_pep691_metadata
+):
+    # Covers: C001M011B0001, C001M011B0002, C001M020B0001
+    payload = {"name": "demo", "files": [], "last_serial": 1}
+    idx_path = _write_json(tmp_path, payload)
+    rec = _FakeRecord(destination_uri=idx_path.as_uri())
+    index_coord = _FakeCoordinator({"default": rec})
+    services = _FakeServices(
+        index_metadata=index_coord, core_metadata=_FakeCoordinator({})
+    )
+    env = _FakeEnv(supported_tags=("py3-none-any",))
+
+    m1 = ProjectResolutionProvider(services=services, env=env)._load_pep691("demo")
+    m2 = ProjectResolutionProvider(services=services, env=env)._load_pep691("demo")
+    assert m2 is m1
+    assert len(index_coord.calls) == 1  # second provider reuses the parsed index
+
+    other = ProjectResolutionProvider(
+        services=services, env=env, index_base="https://example.invalid/simple"
+    )._load_pep691("demo")
+    assert other is not m1
+    assert len(index_coord.calls) == 2  # different index base, separate entry
+
+    ProjectResolutionProvider.clear_caches()
+    ProjectResolutionProvider(services=services, env=env)._load_pep691("demo")
+    assert len(index_coord.calls) == 3
+
+
+def test_load_pep691_disk_cache_round_trip(
+    tmp_path: Path, patch_pep691_metadata, monkeypatch: pytest.MonkeyPatch
+):
+    # Covers: C001M011B0003, C001M011B0004, C001M022B0003, C000F010B0002, C000F011B0001
+    payload = {"name": "demo", "files": [], "last_serial": 7}
+    idx_path = _write_json(tmp_path, payload)
+    rec = _FakeRecord(destination_uri=idx_path.as_uri())
+    services = _FakeServices(
+        index_metadata=_FakeCoordinator({"default": rec}),
+        core_metadata=_FakeCoordinator({}),
+    )
+    env = _FakeEnv(supported_tags=("py3-none-any",))
+    cache_dir = tmp_path / "pep691-cache"
+
+    first = ProjectResolutionProvider(
+        services=services, env=env, pep691_cache_dir=cache_dir
+    )._load_pep691("demo")
+    assert len(list(cache_dir.glob("*.pickle"))) == 1
+
+    ProjectResolutionProvider.clear_caches()
+
+    def _no_json(_fh: Any) -> Any:
+        raise AssertionError("index JSON must not be parsed on a disk cache hit")
+
+    monkeypatch.setattr(resolvelib_mod.json, "loads", _no_json)
+    monkeypatch.setattr(resolvelib_mod, "_orjson", None)
+    second = ProjectResolutionProvider(
+        services=services, env=env, pep691_cache_dir=str(cache_dir)
+    )._load_pep691("demo")
+    assert second == first
+    assert second.last_serial == 7
+
+
+def test_pep691_disk_path_cases(tmp_path: Path):
+    # Covers: C001M022B0001, C001M022B0002, C001M022B0003, C001M022B0004
+    services = _FakeServices(
+        index_metadata=_FakeCoordinator({}), core_metadata=_FakeCoordinator({})
+    )
+    env = _FakeEnv(supported_tags=("py3-none-any",))
+    idx_path = _write_json(tmp_path, {"name": "demo", "files": []})
+    plain = _FakeRecord(destination_uri=idx_path.as_uri())
+    hashed = SimpleNamespace(destination_uri=idx_path.as_uri(), content_sha256="f" * 64)
+
+    disabled = ProjectResolutionProvider(services=services, env=env)
+    assert disabled._pep691_disk_path("demo", plain, idx_path) is None
+
+    p = ProjectResolutionProvider(
+        services=services, env=env, pep691_cache_dir=tmp_path / "c"
+    )
+    by_stat = p._pep691_disk_path("demo", plain, idx_path)
+    by_sha = p._pep691_disk_path("demo", hashed, idx_path)
+    assert by_stat is not None and by_stat.parent == tmp_path / "c"
+    assert by_sha is not None and by_sha.suffix == ".pickle"
+    assert by_sha != by_stat
+    assert p._pep691_disk_path("demo", plain, tmp_path / "missing.json") is None
+
+
+@pytest.mark.parametrize(
+    "use_orjson",
+    [
+        pytest.param(True, id="orjson"),  # covers C000F012B0001
+        pytest.param(False, id="stdlib"),  # covers C000F012B0002
+    ],
+)
+def test_load_json_bytes_decoders(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+):
+    path = _write_json(tmp_path, {"name": "demo", "files": []})
+    seen: list[bytes] = []
+
+    def _fake_loads(data: bytes) -> Any:
+        seen.append(data)
+        return json.loads(data)
+
+    fake = SimpleNamespace(loads=_fake_loads) if use_orjson else None
+    monkeypatch.setattr(resolvelib_mod, "_orjson", fake)
+
+    assert _load_json_bytes(path) == {"name": "demo", "files": []}
+    assert seen == ([path.read_bytes()] if use_orjson else [])
+
+
+def test_pickled_pep691_helpers_tolerate_bad_entries(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    # Covers: C000F010B0001, C000F010B0003, C000F011B0002
+    assert _read_pickled_pep691(tmp_path / "absent.pickle") is None
+
+    foreign = tmp_path / "foreign.pickle"
+    foreign.write_bytes(pickle.dumps({"not": "metadata"}))
+    assert _read_pickled_pep691(foreign) is None
+
+    def _fail(*_args: Any, **_kwargs: Any) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(resolvelib_mod.os, "replace", _fail)
+    target = tmp_path / "out" / "entry.pickle"
+    _write_pickled_pep691(target, FakePep691Metadata(name="demo", files=[]))
+    assert not target.exists()
+    assert list(target.parent.iterdir()) == []
+
+
+@pytest.mark.parametrize(
+    "filename, expect_parsed",
+    [
+        pytest.param("demo-1.0.0.tar.gz", False, id="C001M023B0001"),
+        pytest.param("other-1.0.0-py3-none-any.whl", False, id="C001M023B0002"),
+        pytest.param("demo-bad.whl", False, id="C001M023B0003"),
+        pytest.param("Demo-1.0.0-py3-none-any.whl", True, id="C001M023B0004"),
+    ],
+)
+def test_parse_index_file_cases(filename: str, expect_parsed: bool):
+    f = _pep691_file(filename=filename, hashes={"sha256": "a" * 64})
+    parsed = ProjectResolutionProvider._parse_index_file(f, "demo")
+    if not expect_parsed:
+        assert parsed is None
+        return
+    assert parsed is not None
+    assert parsed.file is f
+    assert parsed.version == Version("1.0.0")
+    assert parsed.version_str == "1.0.0"
+    assert parsed.tag_strs == frozenset({"py3-none-any"})
+    assert parsed.hash_spec == ("sha256", "a" * 64)
+
+
+def test_parsed_index_files_shared_across_providers():
+    # Covers: C001M024B0001, C001M024B0002, C001M021B0003, C001M025B0001, C001M025B0002, C001M025B0003, C001M026B0001
+    services = _FakeServices(
+        index_metadata=_FakeCoordinator({}), core_metadata=_FakeCoordinator({})
+    )
+    env = _FakeEnv(
+        supported_tags=("py3-none-any",), supported_tags_ordered=("py3-none-any",)
+    )
+    p1 = ProjectResolutionProvider(services=services, env=env)
+    p2 = ProjectResolutionProvider(services=services, env=env)
+    files = [
+        _pep691_file(
+            filename="demo-1.0.0-py3-none-any.whl", hashes={"sha256": "a" * 64}
+        ),
+        _pep691_file(
+            filename="demo-1.1.0-py3-none-any.whl",
+            hashes={"sha256": "b" * 64},
+            yanked=True,
+        ),
+        _pep691_file(
+            filename="demo-1.2.0-py3-none-any.whl",
+            hashes={"sha256": "c" * 64},
+            requires_python="<3.0",
+        ),
+        _pep691_file(filename="demo-1.3.0-py3-none-any.whl", hashes={}),
+        _pep691_file(filename="demo-1.0.0.tar.gz"),
+    ]
+    pep = FakePep691Metadata(name="demo", files=files)
+
+    table = p1._parsed_index_files("demo", pep)
+    assert [pf.version_str for pf in table] == ["1.0.0", "1.1.0", "1.2.0", "1.3.0"]
+    assert p2._parsed_index_files("demo", pep) is table
+
+    rebuilt = p2._parsed_index_files(
+        "demo", FakePep691Metadata(name="demo", files=files[:1])
+    )
+    assert [pf.version_str for pf in rebuilt] == ["1.0.0"]
+
+    wheels = p1._index_wheel_candidates(name="demo", pep691=pep, py_version="3.11")
+    assert [(str(v), c.wheel_key.content_hash) for v, c in wheels] == [
+        ("1.0.0", "a" * 64)
+    ]
+    assert wheels[0][1].wheel_key.origin_uri == files[0].url
+
+
 def test_build_index_candidates_loop_0_and_none_and_some():
-    # Covers: C001M012B0001, C001M012B0002, C001M012B0003
+    # Covers: C001M012B0001, C001M012B0004, C001M021B0002
     env = _FakeEnv(
         supported_tags=("py3-none-any",), supported_tags_ordered=("py3-none-any",)
     )
@@ -940,6 +1535,67 @@ def test_build_index_candidates_loop_0_and_none_and_some():
     assert out2[0].wheel_key.content_hash == "a" * 64
 
 
+def test_build_index_candidates_filters_prefiltered_wheels_per_call():
+    # Covers: C001M012B0002, C001M012B0003, C001M012B0004, C001M012B0005, C001M012B0006, C001M021B0001, C001M021B0002
+    env = _FakeEnv(
+        supported_tags=("py3-none-any",), supported_tags_ordered=("py3-none-any",)
+    )
+    services = _FakeServices(
+        index_metadata=_FakeCoordinator({}), core_metadata=_FakeCoordinator({})
+    )
+    p = ProjectResolutionProvider(services=services, env=env)
+    pep = FakePep691Metadata(
+        name="demo",
+        files=[
+            _pep691_file(
+                filename="demo-1.0.0-py3-none-any.whl", hashes={"sha256": "a" * 64}
+            ),
+            _pep691_file(
+                filename="demo-2.0.0-py3-none-any.whl", hashes={"sha256": "b" * 64}
+            ),
+            _pep691_file(filename="demo-2.0.0.tar.gz"),
+        ],
+    )
+
+    wheels = p._index_wheel_candidates(name="demo", pep691=pep, py_version="3.11")
+    assert [str(v) for v, _ in wheels] == ["1.0.0", "2.0.0"]
+    assert (
+        p._index_wheel_candidates(name="demo", pep691=pep, py_version="3.11") is wheels
+    )
+
+    everything = p._build_index_candidates(
+        name="demo", pep691=pep, combined_spec=None, py_version="3.11", bad=frozenset()
+    )
+    assert [c.version for c in everything] == ["1.0.0", "2.0.0"]
+
+    limited = p._build_index_candidates(
+        name="demo",
+        pep691=pep,
+        combined_spec=SpecifierSet("<2"),
+        py_version="3.11",
+        bad=frozenset(),
+    )
+    assert [c.version for c in limited] == ["1.0.0"]
+
+    without_bad = p._build_index_candidates(
+        name="demo",
+        pep691=pep,
+        combined_spec=None,
+        py_version="3.11",
+        bad=frozenset({("demo", "2.0.0", "py3-none-any")}),
+    )
+    assert [c.version for c in without_bad] == ["1.0.0"]
+
+    bad_and_spec = p._build_index_candidates(
+        name="demo",
+        pep691=pep,
+        combined_spec=SpecifierSet(">=2"),
+        py_version="3.11",
+        bad=frozenset({("demo", "1.5.0", "py3-none-any")}),
+    )
+    assert [c.version for c in bad_and_spec] == ["2.0.0"]
+
+
 @pytest.mark.parametrize(
     "row",
     [
@@ -962,7 +1618,7 @@ def test_build_index_candidates_loop_0_and_none_and_some():
         },
         # Covers: C001M013B0003
         {
-            "f": _pep691_file(filename="bad.whl", hashes={"sha256": "a" * 64}),
+            "f": _pep691_file(filename="demo-bad.whl", hashes={"sha256": "a" * 64}),
             "expect": None,
             "covers": ["C001M013B0003"],
         },
@@ -974,6 +1630,14 @@ def test_build_index_candidates_loop_0_and_none_and_some():
             "expect": None,
             "covers": ["C001M013B0004"],
         },
+        # Covers: C001M013B0004 (name segment is normalized before comparing)
+        {
+            "f": _pep691_file(
+                filename="Demo-1.0.0-py3-none-any.whl", hashes={"sha256": "a" * 64}
+            ),
+            "expect_non_none": True,
+            "covers": ["C001M013B0004", "C001M013B0011"],
+        },
         # Covers: C001M013B0005
         {
             "f": _pep691_file(
@@ -1077,7 +1741,7 @@ def test_candidate_from_index_file_branches(row: dict[str, Any]):
 
 
 def test_best_tag_ordered_and_fallback():
-    # Covers: C001M014B0001, C001M014B0002
+    # Covers: C001M001B0002, C001M001B0003, C001M014B0001, C001M014B0002
     services = _FakeServices(
         index_metadata=_FakeCoordinator({}), core_metadata=_FakeCoordinator({})
     )
@@ -1095,6 +1759,56 @@ def test_best_tag_ordered_and_fallback():
     p2 = ProjectResolutionProvider(services=services, env=env2)
     assert p2._best_tag({"py2-none-any", "py3-none-any"}) == "py2-none-any"
 
+    # no supported tag among the file tags
+    assert p2._best_tag({"cp311-cp311-win_amd64"}) is None
+
+    # duplicate supported tags keep their first (most preferred) rank
+    env3 = _FakeEnv(
+        supported_tags=("py2-none-any", "py3-none-any"),
+        supported_tags_ordered=("py3-none-any", "py2-none-any", "py3-none-any"),
+    )
+    p3 = ProjectResolutionProvider(services=services, env=env3)
+    assert p3._best_tag({"py2-none-any", "py3-none-any"}) == "py3-none-any"
+
+    # an empty ordered sequence falls back to supported_tags
+    env4 = _FakeEnv(supported_tags=("py2-none-any",), supported_tags_ordered=())
+    p4 = ProjectResolutionProvider(services=services, env=env4)
+    assert p4._ordered_tags == ("py2-none-any",)
+
+
+def test_parse_wheel_filename_memoizes_results_and_errors(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    # Covers: C001M019B0001, C001M019B0002, C000F013B0001, C000F013B0002
+    calls: list[str] = []
+    real_parse = resolvelib_mod.parse_wheel_filename
+
+    def _counting_parse(filename: str):
+        calls.append(filename)
+        return real_parse(filename)
+
+    monkeypatch.setattr(resolvelib_mod, "parse_wheel_filename", _counting_parse)
+
+    first = ProjectResolutionProvider._parse_wheel_filename(
+        "demo-1.0.0-py3-none-any.whl"
+    )
+    assert first[0] == "demo"
+    assert first[1] == Version("1.0.0")
+    assert (
+        ProjectResolutionProvider._parse_wheel_filename("demo-1.0.0-py3-none-any.whl")
+        is first
+    )
+
+    errors: list[ValueError] = []
+    for _ in range(2):
+        with pytest.raises(ValueError) as exc_info:
+            ProjectResolutionProvider._parse_wheel_filename("not-a-wheel.txt")
+        errors.append(exc_info.value)
+    assert errors[0] is not errors[1]
+    assert str(errors[0]) == str(errors[1])
+
+    assert calls == ["demo-1.0.0-py3-none-any.whl", "not-a-wheel.txt"]
+
 
 def test_sort_candidates_empty_and_sorted():
     # Covers: C001M015B0001, C001M015B0002, plus C000F005B0001/C000F005B0002 transitively
@@ -1293,6 +2007,96 @@ def test_get_dependencies_requires_dist_loop_zero(tmp_path: Path):
     assert list(p.get_dependencies(cand)) == []
 
 
+def test_get_dependencies_prefetches_index_dependencies(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    # Covers: C001M017B0002, C001M017B0017
+    services = _FakeServices(
+        index_metadata=_FakeCoordinator({}), core_metadata=_FakeCoordinator({})
+    )
+    env = _FakeEnv(
+        supported_tags=("py3-none-any",), marker_environment={"python_version": "3.11"}
+    )
+    p = ProjectResolutionProvider(services=services, env=env)
+    seen: list[list[str]] = []
+    monkeypatch.setattr(p, "prefetch_indexes", lambda names: seen.append(list(names)))
+
+    origin = "https://files.example/demo-1.0.0-py3-none-any.whl"
+    p._core_metadata_cache[origin] = SimpleNamespace(
+        requires_dist=[
+            "Dep_One>=1",
+            "dep-two>=0",
+            "dep_url @ https://example.com/dep_url-1.0.0-py3-none-any.whl",
+        ]
+    )
+    cand = FakeResolverCandidate(
+        wheel_key=_wk(
+            name="demo", version="1.0.0", tag="py3-none-any", origin_uri=origin
+        )
+    )
+    deps = list(p.get_dependencies(cand))
+
+    assert len(deps) == 3
+    assert seen == [["dep-one", "dep-two"]]
+
+
+def _prefetch_provider(
+    workers: int, loaded: list[str], fail: frozenset[str] = frozenset()
+) -> ProjectResolutionProvider:
+    services = _FakeServices(
+        index_metadata=_FakeCoordinator({}), core_metadata=_FakeCoordinator({})
+    )
+    p = ProjectResolutionProvider(
+        services=services,
+        env=_FakeEnv(supported_tags=("py3-none-any",)),
+        prefetch_workers=workers,
+    )
+
+    def _load(name: str) -> Any:
+        if name in fail:
+            raise RuntimeError(f"cannot load {name}")
+        loaded.append(name)
+        pep = FakePep691Metadata(name=name, files=[])
+        p._index_cache[(p._index_base, name)] = pep
+        return pep
+
+    p._load_pep691 = _load  # type: ignore[method-assign]
+    return p
+
+
+@pytest.mark.parametrize(
+    "workers, names, cached, expected",
+    [
+        pytest.param(0, ["a", "b"], (), [], id="C001M027B0001"),
+        pytest.param(4, ["a"], (), [], id="C001M027B0002-single"),
+        pytest.param(4, ["a", "b"], ("b",), [], id="C001M027B0002-cached"),
+        pytest.param(4, ["A_x", "a-x", "b"], (), ["a-x", "b"], id="C001M027B0003"),
+    ],
+)
+def test_prefetch_indexes_cases(
+    workers: int, names: list[str], cached: tuple[str, ...], expected: list[str]
+):
+    loaded: list[str] = []
+    p = _prefetch_provider(workers, loaded)
+    for name in cached:
+        p._index_cache[(p._index_base, name)] = FakePep691Metadata(name=name, files=[])
+
+    p.prefetch_indexes(names)
+
+    assert sorted(loaded) == expected
+
+
+def test_prefetch_indexes_swallows_failures():
+    # Covers: C001M027B0003, C001M027B0004
+    loaded: list[str] = []
+    p = _prefetch_provider(2, loaded, fail=frozenset({"bad"}))
+
+    p.prefetch_indexes(["bad", "good", "also-good"])
+
+    assert sorted(loaded) == ["also-good", "good"]
+    assert (p._index_base, "bad") not in p._index_cache
+
+
 # ==============================================================================
 # Tests: get_preference
 # ==============================================================================
@@ -1467,6 +2271,37 @@ def test_resolve_constructs_resolver_and_calls_resolve(monkeypatch):
         index_metadata=_FakeCoordinator({}), core_metadata=_FakeCoordinator({})
     )
 
-    roots = [_req(name="demo", version=">=1.0")]
+    prefetched: list[list[str]] = []
+    monkeypatch.setattr(
+        ProjectResolutionProvider,
+        "prefetch_indexes",
+        lambda self, names: prefetched.append(list(names)),
+    )
+
+    roots = [
+        _req(name="demo", version=">=1.0"),
+        _req(name="direct", uri="https://example.com/direct-1.0-py3-none-any.whl"),
+    ]
     out = resolve_via_resolvelib(services=services, env=env, roots=roots)
     assert out is sentinel
+    assert prefetched == [["demo"]]
+
+
+def test_bounded_cache_evicts_least_recently_used():
+    # Covers: C002M001B0001, C002M001B0002, C002M002B0001, C002M002B0002, C002M003B0001
+    cache: resolvelib_mod._BoundedCache[str, int] = resolvelib_mod._BoundedCache(2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert len(cache) == 2
+
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache["c"] = 3
+
+    assert "b" not in cache
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+    cache.clear()
+    assert len(cache) == 0
+    assert "a" not in cache
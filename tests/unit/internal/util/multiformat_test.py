@@ -1,14 +1,19 @@
 import hashlib
 from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime, date
 from enum import Enum
 from pathlib import Path
+from typing import ClassVar
 from unittest import mock
 
 import pytest
 
 from project_resolution_engine.internal.util.multiformat import (
+    _generate_to_mapping,
+    _is_class_var,
     _normalize,
+    MappingFieldKind,
     MultiformatSerializableMixin,
     MultiformatDeserializableMixin,
     MultiformatModelMixin,
@@ -142,6 +147,21 @@ B75: setattr(inst, "source_description", desc) -> sets attribute
 B76: except Exception -> catches exceptions during setattr
 B77: return inst -> returns instance
 
+## _is_class_var(annotation)
+B78: isinstance(annotation, str) -> True iff it starts with "ClassVar" / "typing.ClassVar"
+B79: else (evaluated annotation) -> True iff it is ClassVar or ClassVar[...]
+
+## _generate_to_mapping(cls, kinds)
+B80: kinds names a field the class does not declare -> raises ValueError("... unknown to_mapping fields ...")
+B81: field kind is an always-present kind -> emitted in the dict display
+B82: field kind is an optional kind -> emitted as a guarded insert after the display
+B83: else (unknown kind) -> raises ValueError("... unknown kind ...")
+B84: on success -> returns a compiled function with class-qualified name and <to_mapping:Cls> filename
+
+## MultiformatModelMixin.__init_subclass__(cls, *, mapping_fields=None, **kwargs)
+B85: mapping_fields is None -> to_mapping is not generated (inherited/hand-written one is kept)
+B86: mapping_fields is not None -> cls.to_mapping = _generate_to_mapping(cls, mapping_fields)
+
 LEDGER COMPLETENESS CHECK:
 - All if/elif/else captured: ✓
 - All match/case arms captured: ✓
@@ -1014,6 +1034,16 @@ def test_model_mixin_inheritance():
     assert issubclass(MultiformatModelMixin, MultiformatDeserializableMixin)
 
 
+def test_mixins_declare_empty_slots():
+    """Test that the mixins add no instance __dict__ to slotted subclasses."""
+    for mixin in (
+        MultiformatSerializableMixin,
+        MultiformatDeserializableMixin,
+        MultiformatModelMixin,
+    ):
+        assert mixin.__dict__["__slots__"] == ()
+
+
 def test_model_mixin_functionality():
     """Test that MultiformatModelMixin provides both serialization and deserialization capabilities."""
     # Create test data
@@ -1043,3 +1073,107 @@ def test_model_mixin_functionality():
         instance = MultiformatModelFixture.from_json('{"key":"value"}')
         assert isinstance(instance, MultiformatModelFixture)
         assert instance.data == test_data
+
+
+@dataclass
+class _Leaf:
+    x: int = 1
+
+    def to_mapping(self):
+        return {"x": self.x}
+
+
+@pytest.mark.parametrize(
+    "annotation, expected, branches",
+    [
+        ("ClassVar[int]", True, ["B78"]),
+        ("typing.ClassVar[int]", True, ["B78"]),
+        ("int", False, ["B78"]),
+        (ClassVar, True, ["B79"]),
+        (ClassVar[int], True, ["B79"]),
+        (int, False, ["B79"]),
+    ],
+)
+def test_is_class_var(annotation, expected, branches):
+    """Test ClassVar detection for stringified and evaluated annotations."""
+    assert _is_class_var(annotation) is expected
+
+
+def test_model_mixin_generates_to_mapping_from_mapping_fields():
+    """Test generated to_mapping for every kind. Covers branches B81, B82, B84, B86."""
+
+    @dataclass(slots=True)
+    class Generated(
+        MultiformatModelMixin,
+        mapping_fields={
+            "mode": MappingFieldKind.ENUM,
+            "leaf": MappingFieldKind.MODEL,
+            "leaves": MappingFieldKind.MODEL_DICT,
+            "maybe": MappingFieldKind.OPT,
+            "maybe_leaf": MappingFieldKind.OPT_MODEL,
+            "maybe_leaves": MappingFieldKind.OPT_MODEL_DICT,
+        },
+    ):
+        LABEL: ClassVar[str] = "not a field"
+        plain: str = "p"
+        mode: SampleEnum = SampleEnum.VALUE1
+        leaf: _Leaf = field(default_factory=_Leaf)
+        leaves: dict = field(default_factory=dict)
+        maybe: str | None = None
+        maybe_leaf: _Leaf | None = None
+        maybe_leaves: dict = field(default_factory=dict)
+
+    assert Generated.to_mapping.__qualname__.endswith("Generated.to_mapping")
+    assert Generated.to_mapping.__code__.co_filename == "<to_mapping:Generated>"
+
+    assert Generated().to_mapping() == {
+        "plain": "p",
+        "mode": SampleEnum.VALUE1.value,
+        "leaf": {"x": 1},
+        "leaves": {},
+    }
+
+    out = Generated(
+        leaves={"a": _Leaf(2)},
+        maybe="m",
+        maybe_leaf=_Leaf(3),
+        maybe_leaves={"b": _Leaf(4)},
+    ).to_mapping()
+    assert list(out) == [
+        "plain",
+        "mode",
+        "leaf",
+        "leaves",
+        "maybe",
+        "maybe_leaf",
+        "maybe_leaves",
+    ]
+    assert out["leaves"] == {"a": {"x": 2}}
+    assert out["maybe"] == "m"
+    assert out["maybe_leaf"] == {"x": 3}
+    assert out["maybe_leaves"] == {"b": {"x": 4}}
+
+
+def test_model_mixin_without_mapping_fields_keeps_to_mapping():
+    """Test that subclasses without mapping_fields are left alone. Covers branch B85."""
+    assert "to_mapping" in MultiformatModelFixture.__dict__
+    assert MultiformatModelFixture({"k": 1}).to_mapping() == {"k": 1}
+
+
+@pytest.mark.parametrize(
+    "kinds, error_fragment, branches",
+    [
+        ({"nope": MappingFieldKind.PLAIN}, "unknown to_mapping fields", ["B80"]),
+        ({"a": "bogus"}, "unknown kind 'bogus'", ["B83"]),
+    ],
+    ids=["unknown_field", "unknown_kind"],
+)
+def test_generate_to_mapping_rejects_bad_spec(kinds, error_fragment, branches):
+    """Test that invalid mapping_fields specs fail at class creation time."""
+
+    class Bad:
+        a: int = 0
+
+    with pytest.raises(ValueError) as excinfo:
+        _generate_to_mapping(Bad, kinds)
+    assert error_fragment in str(excinfo.value)
@@ -1,3 +1,4 @@
+import sys
 import types
 from typing import Any, Mapping
 
@@ -62,6 +63,15 @@ def test_strategyref_normalized_instance_id(
         assert ref.normalized_instance_id() == expect
 
 
+def test_strategyref_normalized_instance_id_is_precomputed_and_interned():
+    iid = "".join(["wheel", "_http"])
+    ref = strat.StrategyRef(strategy_name="s", instance_id=iid)
+    assert ref.normalized_instance_id() is sys.intern("wheel_http")
+    # Derived state stays out of equality/hash and repr.
+    assert ref == strat.StrategyRef(strategy_name="s", instance_id="wheel_http")
+    assert "_normalized_iid" not in repr(ref)
+
+
 # --------------------------------------------------------------------------------------
 # BaseArtifactResolutionStrategyConfig (defaults / plan)
 # --------------------------------------------------------------------------------------
@@ -75,6 +85,36 @@ def test_base_config_defaults_and_plan():
         strat.BaseArtifactResolutionStrategyConfig.plan(strategy_cls=object, config={})
 
 
+def test_base_config_plan_all_delegates_to_plan_per_config():
+    # covers: C004M003B0001, C004M003B0002
+    class Spec(strat.BaseArtifactResolutionStrategyConfig):
+        @classmethod
+        def plan(cls, *, strategy_cls, config):
+            return (config["n"], config["n"] * 10)
+
+    assert Spec.plan_all(strategy_cls=object, configs=[]) == []
+    assert Spec.plan_all(strategy_cls=object, configs=[{"n": 1}, {"n": 2}]) == [
+        1,
+        10,
+        2,
+        20,
+    ]
+
+
+def test_plan_records_and_base_config_are_slotted():
+    assert not hasattr(strat.BaseArtifactResolutionStrategyConfig(), "__dict__")
+    plan = strat.StrategyPlan(
+        strategy_name="s",
+        instance_id="s",
+        strategy_cls=BaseArtifactResolutionStrategy,
+        ctor_kwargs={},
+        depends_on=(),
+        precedence=1,
+    )
+    assert not hasattr(plan, "__dict__")
+    assert not hasattr(strat.StrategyRef("s", "s"), "__dict__")
+
+
 # --------------------------------------------------------------------------------------
 # DefaultStrategyConfig.plan
 # --------------------------------------------------------------------------------------
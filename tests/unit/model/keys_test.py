@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from typing import Any
 
 import pytest
@@ -272,6 +273,17 @@ WHEEL_FROM_MAPPING_REQUIRED_KEY_ERROR_CASES = [
 # ==============================================================================
 
 
+@pytest.fixture(autouse=True)
+def _clear_normalization_caches() -> Iterator[None]:
+    # Several tests patch Version/canonicalize_name; keep memoized results from
+    # leaking into (or out of) them.
+    keys_mod.normalize_project_name.cache_clear()
+    keys_mod._normalize_version.cache_clear()
+    yield
+    keys_mod.normalize_project_name.cache_clear()
+    keys_mod._normalize_version.cache_clear()
+
+
 def _patch_name_and_version(
     monkeypatch: pytest.MonkeyPatch,
     *,
@@ -475,6 +487,15 @@ def test_normalize_project_name_delegates_to_canonicalize_name(
     assert calls == ["Some_Project"]
 
 
+def test_normalize_version_memoizes_and_tolerates_invalid() -> None:
+    # Covers: C004M002B0002, C004M002B0003 (via the memoized _normalize_version helper)
+    assert keys_mod._normalize_version("1.0") == "1.0"
+    assert keys_mod._normalize_version("01.0.0") == "1.0.0"
+    assert keys_mod._normalize_version("not a version") == "not a version"
+    assert keys_mod._normalize_version("01.0.0") == "1.0.0"
+    assert keys_mod._normalize_version.cache_info().hits == 1
+
+
 def test_wheelkey_set_dependency_ids_set_and_error(monkeypatch):
     # Covers: C004M003B0002, C004M003B0001
     wk = _mk_wheel(monkeypatch)